@@ -10,6 +10,7 @@ from utils.io import load_config, read_json, write_json, log_message, ensure_dir
 from utils.sanitizer import sanitize_text, strip_html
 from utils.translator import detect_language
 from utils.web import fetch_url_text
+from utils.tracing import begin_span, span, traced_run
 from modules.adapters import get_enabled_adapters
 
 
@@ -549,6 +550,7 @@ def _merge_filters(base, derived):
     return merged
 
 
+@traced_run("crawl_jobs")
 def crawl_jobs(config_path="config/applicant.yaml"):
     config = load_config(config_path)
     jobs_dir = config["paths"]["jobs_dir"]
@@ -594,6 +596,7 @@ def crawl_jobs(config_path="config/applicant.yaml"):
     manual_jobs = []
     ats_jobs = []
     page_jobs = []
+    fetch_span = begin_span("fetch")
     if job_sources.get("use_manual_files", True):
         manual_jobs = _load_job_files(jobs_dir)
         jobs.extend(manual_jobs)
@@ -614,6 +617,9 @@ def crawl_jobs(config_path="config/applicant.yaml"):
     if use_job_pages and job_pages:
         page_jobs = _load_job_pages(job_pages, fetch_timeout, logs_dir)
         jobs.extend(page_jobs)
+    fetch_span.end(
+        manual=len(manual_jobs), ats=len(ats_jobs), pages=len(page_jobs), adapters=len(adapter_jobs), jobs=len(jobs)
+    )
 
     log_message(
         logs_dir,
@@ -627,6 +633,7 @@ def crawl_jobs(config_path="config/applicant.yaml"):
     filtered_out = 0
     seen_ids = {}
     duplicates = 0
+    normalize_span = begin_span("normalize")
 
     for idx, job in enumerate(jobs, start=1):
         if not isinstance(job, dict):
@@ -643,11 +650,15 @@ def crawl_jobs(config_path="config/applicant.yaml"):
         if "<" in description_raw or "&lt;" in description_raw:
             description_raw = _strip_html(description_raw)
         if source_type == "rss" and len(description_raw.strip()) < 200 and url:
-            fetched_text = _fetch_job_text(url, fetch_timeout, logs_dir=logs_dir, label=title)
+            with span("fetch_text"):
+                fetched_text = _fetch_job_text(url, fetch_timeout, logs_dir=logs_dir, label=title)
             if fetched_text:
                 description_raw = fetched_text
 
-        sanitized, notes = _sanitize_text(description_raw)
+        with span("sanitize") as sanitize_span:
+            sanitized, notes = _sanitize_text(description_raw)
+            if notes:
+                sanitize_span.count("sanitized")
         description = sanitized
         job_id = _build_job_id(source_id, str(external_id or ""), url, title, location)
         if not job_id:
@@ -696,6 +707,7 @@ def crawl_jobs(config_path="config/applicant.yaml"):
             filtered_out += 1
 
     normalized = list(seen_ids.values())
+    normalize_span.end(jobs=len(normalized), filtered_out=filtered_out, duplicates=duplicates)
     if duplicates and logs_dir:
         log_message(logs_dir, "crawl_jobs", f"Dropped {duplicates} duplicate jobs by job_id.")
 
@@ -738,10 +750,10 @@ def crawl_jobs(config_path="config/applicant.yaml"):
         },
         "generated_at": datetime.utcnow().isoformat() + "Z",
     }
-    write_json(summary, os.path.join(output_dir, "job_collection_summary.json"))
-
-    output_path = os.path.join(jobs_dir, "latest_jobs.json")
-    write_json(normalized, output_path)
+    with span("write", jobs=len(normalized)):
+        write_json(summary, os.path.join(output_dir, "job_collection_summary.json"))
+        output_path = os.path.join(jobs_dir, "latest_jobs.json")
+        write_json(normalized, output_path)
     log_message(logs_dir, "crawl_jobs", f"Collected {len(normalized)} jobs from {jobs_dir}")
     return normalized
 
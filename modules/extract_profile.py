@@ -1,12 +1,17 @@
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from fnmatch import fnmatch
+from urllib.parse import urlparse
 from io import BytesIO
-import zipfile
 
 from utils.io import load_config, read_json, write_json, log_message, ensure_dir
-from utils.parser import load_documents, build_inventory, Document
-from utils.web import fetch_url_html, fetch_binary, extract_links, html_to_text, allowed_url
+from utils.cache import stable_hash
+from utils.parser import load_documents, build_inventory, docx_to_text, open_text_cache, pdf_to_text, walk_documents, Document
+from utils.web import WebCache, cached_text, fetch_url_html, fetch_binary, extract_links, html_to_text, allowed_url
+from utils.tracing import span, traced_run
 
 SECTION_HEADERS = {
     "skills": ["skills", "technical skills", "core skills"],
@@ -243,6 +248,31 @@ TRAIT_TAXONOMY = [
 ]
 
 
+def _build_taxonomy_index():
+    index = {}
+    for idx, cap in enumerate(CAPABILITY_TAXONOMY):
+        for keyword in cap.get("keywords") or []:
+            index.setdefault(keyword, []).append(("capability", idx))
+    for idx, trait in enumerate(TRAIT_TAXONOMY):
+        for keyword in trait.get("keywords") or []:
+            index.setdefault(keyword, []).append(("trait", idx))
+    return index
+
+
+TAXONOMY_KEYWORD_INDEX = _build_taxonomy_index()
+
+SKILL_MATCHER_CACHE_SIZE = 256
+PROFILE_MANIFEST_VERSION = 3
+PROFILE_MANIFEST_FILENAME = "profile_manifest.json"
+WEB_FETCH_KEYS = ("cache", "max_workers", "max_per_domain", "timeout_seconds")
+PROFILE_OUTPUTS = ("rob_profile.json", "source_inventory.json", "committee_review.json", "profile_comparison.json")
+TAXONOMY_HITS_CACHE_SIZE = 4096
+_TAXONOMY_HITS = {}
+SKILL_PATTERNS_CACHE_SIZE = 4096
+_SKILL_PATTERNS = {}
+_SKILL_MATCHERS = {}
+
+
 def _normalize_lines(text):
     text = text.replace("\r", "\n")
     return [line.strip() for line in text.split("\n") if line.strip()]
@@ -369,18 +399,17 @@ def _extract_skills(text, skills_seed):
     hard = []
     soft = []
     evidence = {}
-    for skill in skills_seed.get("hard", []):
-        pattern = re.compile(rf"\b{re.escape(skill)}\b", re.IGNORECASE)
-        match = pattern.search(text)
-        if match:
+    hard_seed = skills_seed.get("hard", [])
+    soft_seed = skills_seed.get("soft", [])
+    first_hits, _ = _skill_matcher(list(hard_seed) + list(soft_seed), bounded=True).scan(text)
+    for skill in hard_seed:
+        if skill in first_hits:
             hard.append(skill)
-            evidence[skill] = _snippet(text, match.start())
-    for skill in skills_seed.get("soft", []):
-        pattern = re.compile(rf"\b{re.escape(skill)}\b", re.IGNORECASE)
-        match = pattern.search(text)
-        if match:
+            evidence[skill] = _snippet(text, first_hits[skill])
+    for skill in soft_seed:
+        if skill in first_hits:
             soft.append(skill)
-            evidence[skill] = _snippet(text, match.start())
+            evidence[skill] = _snippet(text, first_hits[skill])
     return sorted(set(hard)), sorted(set(soft)), evidence
 
 
@@ -395,56 +424,15 @@ def _docx_bytes_to_text(data):
     if not data:
         return ""
     try:
-        with zipfile.ZipFile(BytesIO(data)) as z:
-            xml = z.read("word/document.xml").decode("utf-8", errors="ignore")
+        return docx_to_text(BytesIO(data))
     except Exception:
         return ""
-    xml = re.sub(r"</w:p>", "\n", xml)
-    text = re.sub(r"<[^>]+>", "", xml)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
 
 
-def _pdf_bytes_to_text(data):
+def _pdf_bytes_to_text(data, max_pages=0, max_chars=0):
     if not data:
         return ""
-    try:
-        from pypdf import PdfReader  # type: ignore
-
-        reader = PdfReader(BytesIO(data))
-        parts = []
-        for page in reader.pages:
-            parts.append(page.extract_text() or "")
-        return "\n".join(parts).strip()
-    except Exception:
-        pass
-
-    temp_path = None
-    try:
-        import subprocess
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(data)
-            temp_path = tmp.name
-        result = subprocess.run(
-            ["pdftotext", temp_path, "-"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=False,
-            text=True,
-        )
-        if result.stdout:
-            return result.stdout.strip()
-    except Exception:
-        return ""
-    finally:
-        if temp_path:
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
-    return ""
+    return pdf_to_text(data, max_pages=max_pages, max_chars=max_chars)["content"]
 
 
 def _match_patterns(path, patterns):
@@ -553,18 +541,97 @@ def _capability_confidence(support_count, evidence_count):
 def _skill_match_pattern(skill):
     if not skill:
         return None
-    if re.match(r"^[A-Za-z0-9]+$", skill):
-        return re.compile(rf"\\b{re.escape(skill)}\\b", re.IGNORECASE)
-    return re.compile(re.escape(skill), re.IGNORECASE)
+    pattern = _SKILL_PATTERNS.get(skill)
+    if pattern is None:
+        if re.match(r"^[A-Za-z0-9]+$", skill):
+            pattern = re.compile(rf"\b{skill}\b", re.IGNORECASE)
+        else:
+            pattern = re.compile(re.escape(skill), re.IGNORECASE)
+        if len(_SKILL_PATTERNS) >= SKILL_PATTERNS_CACHE_SIZE:
+            _SKILL_PATTERNS.clear()
+        _SKILL_PATTERNS[skill] = pattern
+    return pattern
+
+
+@lru_cache(maxsize=4096)
+def _case_regular(char):
+    lower = char.lower()
+    upper = char.upper()
+    return (
+        len(lower) == 1
+        and len(upper) == 1
+        and char.casefold() == lower
+        and upper.lower() == lower
+        and lower.upper() == upper
+    )
 
 
-def _count_skill_mentions(text, skill):
-    if not text or not skill:
-        return 0
-    pattern = _skill_match_pattern(skill)
-    if not pattern:
-        return 0
-    return len(pattern.findall(text))
+def _case_safe(chars):
+    return all(char.isascii() or _case_regular(char) for char in chars)
+
+
+class SkillMatcher:
+    def __init__(self, skills, bounded=True):
+        self.skills = [skill for skill in dict.fromkeys(skills) if skill]
+        self.bounded = bounded
+        self.patterns = {}
+        self._leads = {}
+        literals = set()
+        for skill in self.skills:
+            if bounded:
+                pattern = re.compile(rf"\b{re.escape(skill)}\b", re.IGNORECASE)
+            else:
+                pattern = _skill_match_pattern(skill)
+            self.patterns[skill] = pattern
+            literal = skill.lower()
+            literals.add(literal)
+            self._leads.setdefault(literal[0], []).append((skill, pattern))
+        self._scanner = None
+        if literals and _case_safe(set("".join(literals))):
+            alternation = "|".join(re.escape(literal) for literal in sorted(literals, key=lambda x: (-len(x), x)))
+            self._scanner = re.compile(f"(?=(?:{alternation}))")
+
+    def scan(self, text):
+        first_hits = {}
+        counts = {}
+        if not text or not self.skills:
+            return first_hits, counts
+        lowered = text.lower()
+        if self._scanner is None or len(lowered) != len(text) or not _case_safe(set(text)):
+            for skill, pattern in self.patterns.items():
+                for match in pattern.finditer(text):
+                    if skill not in first_hits:
+                        first_hits[skill] = match.start()
+                    counts[skill] = counts.get(skill, 0) + 1
+            return first_hits, counts
+        ends = {}
+        for hit in self._scanner.finditer(lowered):
+            pos = hit.start()
+            for skill, pattern in self._leads.get(lowered[pos], []):
+                if pos < ends.get(skill, 0):
+                    continue
+                match = pattern.match(text, pos)
+                if not match:
+                    continue
+                if skill not in first_hits:
+                    first_hits[skill] = pos
+                counts[skill] = counts.get(skill, 0) + 1
+                ends[skill] = match.end()
+        return first_hits, counts
+
+    def counts(self, text):
+        return self.scan(text)[1]
+
+
+def _skill_matcher(skills, bounded=True):
+    key = (bool(bounded), tuple(skills))
+    matcher = _SKILL_MATCHERS.get(key)
+    if matcher is None:
+        if len(_SKILL_MATCHERS) >= SKILL_MATCHER_CACHE_SIZE:
+            _SKILL_MATCHERS.clear()
+        matcher = SkillMatcher(skills, bounded=bounded)
+        _SKILL_MATCHERS[key] = matcher
+    return matcher
 
 
 def _assign_levels(items, major_frac=0.2, median_frac=0.5, key="signal", name_key="skill"):
@@ -586,11 +653,32 @@ def _assign_levels(items, major_frac=0.2, median_frac=0.5, key="signal", name_ke
             item["level"] = "minor"
 
 
-def _skill_committee_vote(skill, combined_text, skills_section, seeded_skills, evidence_hits):
+def _taxonomy_hits(skill):
+    low = skill.lower()
+    hits = _TAXONOMY_HITS.get(low)
+    if hits is not None:
+        return hits
+    capabilities = {}
+    traits = set()
+    for keyword, refs in TAXONOMY_KEYWORD_INDEX.items():
+        if keyword not in low:
+            continue
+        for kind, idx in refs:
+            if kind == "capability":
+                capabilities.setdefault(idx, []).append(keyword)
+            else:
+                traits.add(idx)
+    hits = {"capabilities": capabilities, "traits": traits}
+    if len(_TAXONOMY_HITS) >= TAXONOMY_HITS_CACHE_SIZE:
+        _TAXONOMY_HITS.clear()
+    _TAXONOMY_HITS[low] = hits
+    return hits
+
+
+def _skill_committee_vote(skill, mentions, in_skills_section, seeded_skills, evidence_hits):
     votes = []
     score = 0
 
-    mentions = _count_skill_mentions(combined_text, skill)
     if mentions >= 2:
         votes.append({"source": "mentions", "weight": 1})
         score += 1
@@ -599,23 +687,17 @@ def _skill_committee_vote(skill, combined_text, skills_section, seeded_skills, e
         votes.append({"source": "evidence", "weight": 1})
         score += 1
 
-    if skills_section:
-        pattern = _skill_match_pattern(skill)
-        if pattern and pattern.search(skills_section):
-            votes.append({"source": "skills section", "weight": 1})
-            score += 1
+    if in_skills_section:
+        votes.append({"source": "skills section", "weight": 1})
+        score += 1
 
     if seeded_skills and skill.lower() in seeded_skills:
         votes.append({"source": "seeded skill", "weight": 1})
         score += 1
 
     low = skill.lower()
-    taxonomy_keywords = set()
-    for cap in CAPABILITY_TAXONOMY:
-        taxonomy_keywords.update(cap.get("keywords") or [])
-    for trait in TRAIT_TAXONOMY:
-        taxonomy_keywords.update(trait.get("keywords") or [])
-    if any(keyword in low for keyword in taxonomy_keywords):
+    hits = _taxonomy_hits(skill)
+    if hits["capabilities"] or hits["traits"]:
         votes.append({"source": "taxonomy match", "weight": 1})
         score += 1
 
@@ -639,7 +721,7 @@ def _normalize_committee_decision(value):
     return ""
 
 
-def _build_skill_weighting(profile, combined_text, config, committee_cfg=None, overrides=None):
+def _build_skill_weighting(profile, combined_text, config, committee_cfg=None, overrides=None, vocabulary=None):
     entries = []
     lines = _normalize_lines(combined_text)
     skills_lines = _find_section(lines, SECTION_HEADERS["skills"])
@@ -647,6 +729,7 @@ def _build_skill_weighting(profile, combined_text, config, committee_cfg=None, o
     skills_seed = config.get("skills_seed", {})
     hard_seed = set([s.lower() for s in skills_seed.get("hard", [])])
     soft_seed = set([s.lower() for s in skills_seed.get("soft", [])])
+    seeded_skills = hard_seed | soft_seed
     committee_cfg = committee_cfg if committee_cfg is not None else config.get("profile", {}).get("committee", {})
     min_score = committee_cfg.get("min_score", 2)
     try:
@@ -656,15 +739,25 @@ def _build_skill_weighting(profile, combined_text, config, committee_cfg=None, o
     overrides = overrides or {}
     override_skills = {key.lower(): _normalize_committee_decision(val) for key, val in (overrides.get("skills") or {}).items()}
     evidence_map = profile.get("evidence", {})
+    skills = list(profile.get("hard_skills", [])) + list(profile.get("soft_skills", []))
+    matcher = _skill_matcher(skills if vocabulary is None else vocabulary, bounded=False)
+    mention_counts = matcher.counts(combined_text)
+    section_hits = matcher.scan(skills_section)[0] if skills_section else {}
+    for skill in skills:
+        if skill and skill not in matcher.patterns:
+            pattern = _skill_match_pattern(skill)
+            mention_counts[skill] = len(pattern.findall(combined_text))
+            if skills_section and pattern.search(skills_section):
+                section_hits[skill] = True
     for skill in profile.get("hard_skills", []):
-        mentions = _count_skill_mentions(combined_text, skill)
+        mentions = mention_counts.get(skill, 0)
         evidence_hits = 1 if skill in evidence_map else 0
         signal = mentions + (2 if evidence_hits else 0)
         committee = _skill_committee_vote(
             skill,
-            combined_text,
-            skills_section,
-            hard_seed | soft_seed,
+            mentions,
+            skill in section_hits,
+            seeded_skills,
             evidence_hits,
         )
         committee["decision"] = "accept" if committee["score"] >= min_score else "hold"
@@ -683,14 +776,14 @@ def _build_skill_weighting(profile, combined_text, config, committee_cfg=None, o
             }
         )
     for skill in profile.get("soft_skills", []):
-        mentions = _count_skill_mentions(combined_text, skill)
+        mentions = mention_counts.get(skill, 0)
         evidence_hits = 1 if skill in evidence_map else 0
         signal = mentions + (2 if evidence_hits else 0)
         committee = _skill_committee_vote(
             skill,
-            combined_text,
-            skills_section,
-            hard_seed | soft_seed,
+            mentions,
+            skill in section_hits,
+            seeded_skills,
             evidence_hits,
         )
         committee["decision"] = "accept" if committee["score"] >= min_score else "hold"
@@ -771,20 +864,19 @@ def _build_role_abstractions(skill_weighting, overrides=None):
     overrides = overrides or {}
     override_map = {key.lower(): _normalize_committee_decision(val) for key, val in (overrides.get("abstractions") or {}).items()}
 
+    entry_hits = [(entry, _taxonomy_hits(entry["skill"])) for entry in entries]
     capabilities = []
     held = []
-    for cap in CAPABILITY_TAXONOMY:
+    for cap_idx, cap in enumerate(CAPABILITY_TAXONOMY):
         support = []
         matched_keywords = set()
         total_signal = 0
-        for entry in entries:
-            low = entry["skill"].lower()
-            if any(keyword in low for keyword in cap["keywords"]):
+        for entry, hits in entry_hits:
+            keywords = hits["capabilities"].get(cap_idx)
+            if keywords:
                 support.append(entry)
                 total_signal += entry["signal"]
-                for keyword in cap["keywords"]:
-                    if keyword in low:
-                        matched_keywords.add(keyword)
+                matched_keywords.update(keywords)
         if not support:
             continue
         support_sorted = sorted(support, key=lambda x: (-x["signal"], x["skill"].lower()))
@@ -813,14 +905,13 @@ def _build_role_abstractions(skill_weighting, overrides=None):
             held.append({"kind": "capability", **payload})
 
     traits = []
-    for trait in TRAIT_TAXONOMY:
+    for trait_idx, trait in enumerate(TRAIT_TAXONOMY):
         support = []
         total_signal = 0
-        for entry in entries:
+        for entry, hits in entry_hits:
             if entry.get("type") != "soft":
                 continue
-            low = entry["skill"].lower()
-            if any(keyword in low for keyword in trait["keywords"]):
+            if trait_idx in hits["traits"]:
                 support.append(entry)
                 total_signal += entry["signal"]
         if not support:
@@ -1281,27 +1372,73 @@ def _extract_skill_categories(lines):
     return categories
 
 
-def _fetch_web_document(url):
+def _fetch_web_document(url, timeout=10, cache=None, pdf_limits=None):
     clean_url = url.split("?", 1)[0].split("#", 1)[0].lower()
     if clean_url.endswith(".pdf"):
-        data, content_type, status = fetch_binary(url)
-        text = _pdf_bytes_to_text(data) if data else ""
+        data, content_type, status = fetch_binary(url, timeout=timeout, cache=cache)
+        pdf_limits = pdf_limits or {}
+        parser_key = f"pdf:{pdf_limits.get('max_pages', 0)}:{pdf_limits.get('max_chars', 0)}"
+        text = cached_text(cache, data, parser_key, lambda body: _pdf_bytes_to_text(body, **pdf_limits)) if data else ""
         notes = content_type or status
         doc_status = "ok" if text else "error"
         return Document(path=f"web:{url}", content=text, file_type="pdf", status=doc_status, notes=notes), ""
     if clean_url.endswith(".docx"):
-        data, content_type, status = fetch_binary(url)
-        text = _docx_bytes_to_text(data) if data else ""
+        data, content_type, status = fetch_binary(url, timeout=timeout, cache=cache)
+        text = cached_text(cache, data, "docx", _docx_bytes_to_text) if data else ""
         notes = content_type or status
         doc_status = "ok" if text else "error"
         return Document(path=f"web:{url}", content=text, file_type="docx", status=doc_status, notes=notes), ""
 
-    html, status = fetch_url_html(url)
-    text = html_to_text(html) if html else ""
+    html, status = fetch_url_html(url, timeout=timeout, cache=cache)
+    text = cached_text(cache, html, "html", html_to_text) if html else ""
     doc_status = "ok" if text else "error"
     return Document(path=f"web:{url}", content=text, file_type="html", status=doc_status, notes=status), html
 
 
+def _int_setting(settings, key, default):
+    try:
+        return int(settings.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _open_web_cache(config):
+    cache_cfg = (config.get("web_profile", {}) or {}).get("cache", {}) or {}
+    if not cache_cfg.get("enabled", True):
+        return None
+    return WebCache(
+        cache_cfg.get("path") or os.path.join(config["paths"]["output_dir"], "web_cache"),
+        max_age_days=cache_cfg.get("max_age_days", 30),
+    )
+
+
+def _fetch_web_limited(url, limit, allowed_domains, timeout, cache, pdf_limits=None):
+    if allowed_domains and not allowed_url(url, allowed_domains):
+        document = Document(
+            path=f"web:{url}",
+            content="",
+            file_type="html",
+            status="blocked",
+            notes="domain not in allowed_domains",
+        )
+        return document, ""
+    with limit:
+        return _fetch_web_document(url, timeout=timeout, cache=cache, pdf_limits=pdf_limits)
+
+
+def _fetch_web_level(executor, level, allowed_domains, per_domain, timeout, cache, pdf_limits=None):
+    limits = {}
+    for _, url in level:
+        limits.setdefault(urlparse(url).netloc.lower(), threading.BoundedSemaphore(per_domain))
+    futures = [
+        executor.submit(
+            _fetch_web_limited, url, limits[urlparse(url).netloc.lower()], allowed_domains, timeout, cache, pdf_limits
+        )
+        for _, url in level
+    ]
+    return [future.result() for future in futures]
+
+
 def _load_web_documents(config, output_text_dir):
     web_cfg = config.get("web_profile", {})
     if not web_cfg.get("enabled"):
@@ -1311,67 +1448,179 @@ def _load_web_documents(config, output_text_dir):
     allowed_domains = web_cfg.get("allowed_domains", [])
     follow_enabled = bool(web_cfg.get("follow_library", False) or web_cfg.get("follow_patterns"))
     follow_patterns = web_cfg.get("follow_patterns", []) or []
-    max_pages = web_cfg.get("max_pages", 0)
-    try:
-        max_pages = int(max_pages)
-    except (TypeError, ValueError):
-        max_pages = 0
+    max_pages = _int_setting(web_cfg, "max_pages", 0)
+    max_depth = max(0, _int_setting(web_cfg, "max_depth", 1))
+    workers = max(1, _int_setting(web_cfg, "max_workers", 4))
+    per_domain = max(1, _int_setting(web_cfg, "max_per_domain", 2))
+    timeout = max(1, _int_setting(web_cfg, "timeout_seconds", 10))
+    cache = _open_web_cache(config)
+    parsing = _parsing_settings(config)
+    pdf_limits = {"max_pages": parsing["max_pages"], "max_chars": parsing["max_chars"]}
 
     documents = []
-    seen = set()
-    follow_queue = []
-
-    for idx, url in enumerate(urls, start=1):
-        if allowed_domains and not allowed_url(url, allowed_domains):
-            documents.append(
-                Document(
-                    path=f"web:{url}",
-                    content="",
-                    file_type="html",
-                    status="blocked",
-                    notes="domain not in allowed_domains",
-                )
-            )
-            continue
-
-        document, html = _fetch_web_document(url)
-        documents.append(document)
-        seen.add(url)
-
-        if output_text_dir and document.content:
-            os.makedirs(output_text_dir, exist_ok=True)
-            out_path = os.path.join(output_text_dir, f"web_{idx}.txt")
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(document.content)
-
-        if follow_enabled and html:
-            links = extract_links(html, url)
-            for link in links:
-                if max_pages and len(follow_queue) >= max_pages:
-                    break
-                if link in seen:
-                    continue
-                if allowed_domains and not allowed_url(link, allowed_domains):
-                    continue
-                if follow_patterns and not any(pat in link for pat in follow_patterns):
+    seen = set(url for url in urls if not allowed_domains or allowed_url(url, allowed_domains))
+    level = list(enumerate(urls, start=1))
+    next_idx = len(urls) + 1
+    followed = 0
+    depth = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while level:
+            fetched = _fetch_web_level(executor, level, allowed_domains, per_domain, timeout, cache, pdf_limits)
+            next_level = []
+            for (idx, url), (document, html) in zip(level, fetched):
+                documents.append(document)
+
+                if output_text_dir and document.content:
+                    os.makedirs(output_text_dir, exist_ok=True)
+                    out_path = os.path.join(output_text_dir, f"web_{idx}.txt")
+                    with open(out_path, "w", encoding="utf-8") as f:
+                        f.write(document.content)
+
+                if not follow_enabled or not html or depth >= max_depth:
                     continue
-                follow_queue.append(link)
-                seen.add(link)
+                for link in extract_links(html, url):
+                    if max_pages and followed >= max_pages:
+                        break
+                    if link in seen:
+                        continue
+                    if allowed_domains and not allowed_url(link, allowed_domains):
+                        continue
+                    if follow_patterns and not any(pat in link for pat in follow_patterns):
+                        continue
+                    next_level.append((next_idx, link))
+                    next_idx += 1
+                    followed += 1
+                    seen.add(link)
+            level = next_level
+            depth += 1
+
+    if cache is not None:
+        cache.save()
+        stats = cache.stats()
+        log_message(
+            config["paths"]["logs_dir"],
+            "extract_profile",
+            (
+                f"Web cache: {stats['fetched']} fetched, {stats['not_modified']} not modified, {stats['stale']} stale, "
+                f"{stats['text_hits']} parsed texts reused, {stats['removed']} removed upstream, {stats['pruned']} pruned"
+            ),
+        )
+    return documents
 
-    for idx, url in enumerate(follow_queue, start=len(urls) + 1):
-        document, _ = _fetch_web_document(url)
-        documents.append(document)
 
-        if output_text_dir and document.content:
-            os.makedirs(output_text_dir, exist_ok=True)
-            out_path = os.path.join(output_text_dir, f"web_{idx}.txt")
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(document.content)
+def _parsing_settings(config):
+    settings = (config.get("profile", {}) or {}).get("parsing", {}) or {}
+    try:
+        workers = int(settings.get("workers", 1))
+    except (TypeError, ValueError):
+        workers = 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    try:
+        timeout = float(settings.get("timeout_seconds", 120) or 0)
+    except (TypeError, ValueError):
+        timeout = 120.0
+    cache_cfg = settings.get("cache", {}) or {}
+    cache_path = ""
+    if cache_cfg.get("enabled", True):
+        cache_path = cache_cfg.get("path") or os.path.join(config["paths"]["output_dir"], "source_text_cache.json")
+    return {
+        "workers": workers,
+        "timeout_seconds": timeout if timeout > 0 else None,
+        "cache_path": cache_path,
+        "max_pages": max(0, _int_setting(settings, "max_pages", 40)),
+        "max_chars": max(0, _int_setting(settings, "max_chars", 200000)),
+    }
 
-    return documents
+
+def _source_fingerprints(sources_dir):
+    fingerprints = {}
+    for path in walk_documents(sources_dir):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        fingerprints[path] = [stat.st_size, stat.st_mtime_ns]
+    return fingerprints
+
+
+def _web_fingerprints(config, web_docs):
+    # Fingerprint web documents on the cache validators the fetch just
+    # refreshed rather than rehashing their bodies; pages without an
+    # ETag/Last-Modified fall back to the stored body hash, and the text hash
+    # is only used when the cache is disabled.
+    cache = _open_web_cache(config)
+    fingerprints = {}
+    for doc in web_docs:
+        entry = cache.entry(doc.path[len("web:"):]) if cache is not None and doc.status == "ok" else None
+        if entry and (entry.get("etag") or entry.get("last_modified")):
+            fingerprints[doc.path] = [doc.status, entry.get("etag", ""), entry.get("last_modified", "")]
+        elif entry and entry.get("sha256"):
+            fingerprints[doc.path] = [doc.status, entry["sha256"]]
+        else:
+            fingerprints[doc.path] = [doc.status, stable_hash(doc.content)]
+    return fingerprints
+
+
+def _profile_manifest(config, sources_dir, web_docs, profile_overrides):
+    profile_cfg = {key: value for key, value in (config.get("profile", {}) or {}).items() if key != "parsing"}
+    parsing = _parsing_settings(config)
+    profile_cfg["parsing_limits"] = [parsing["max_pages"], parsing["max_chars"]]
+    web_cfg = {key: value for key, value in (config.get("web_profile", {}) or {}).items() if key not in WEB_FETCH_KEYS}
+    components = {
+        "version": PROFILE_MANIFEST_VERSION,
+        "local": _source_fingerprints(sources_dir),
+        "web": _web_fingerprints(config, web_docs),
+        "overrides": stable_hash(profile_overrides or {}),
+        "config": stable_hash(
+            {
+                "profile": profile_cfg,
+                "skills_seed": config.get("skills_seed", {}),
+                "web_profile": web_cfg,
+            }
+        ),
+    }
+    return stable_hash(components), components
+
+
+def _load_profile_manifest(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        return read_json(path)
+    except Exception:
+        return None
 
 
-def extract_profile(config_path="config/applicant.yaml"):
+def _changed_keys(previous, current):
+    previous = previous or {}
+    return sorted(key for key in set(previous) | set(current) if previous.get(key) != current.get(key))
+
+
+def _manifest_changes(previous, components):
+    if not isinstance(previous, dict) or not isinstance(previous.get("components"), dict):
+        return ["no previous manifest"]
+    before = previous["components"]
+    reasons = []
+    if before.get("version") != components["version"]:
+        reasons.append("extractor version changed")
+    local_changed = _changed_keys(before.get("local"), components["local"])
+    if local_changed:
+        names = ", ".join(os.path.basename(path) for path in local_changed[:3])
+        reasons.append(f"{len(local_changed)} local documents changed ({names})")
+    web_changed = _changed_keys(before.get("web"), components["web"])
+    if web_changed:
+        reasons.append(f"{len(web_changed)} web documents changed ({', '.join(web_changed[:3])})")
+    if before.get("overrides") != components["overrides"]:
+        reasons.append("committee_votes profile overrides changed")
+    if before.get("config") != components["config"]:
+        reasons.append("profile, skills_seed or web_profile config changed")
+    return reasons
+
+
+@traced_run("extract_profile")
+def extract_profile(config_path="config/applicant.yaml", force=False):
     config = load_config(config_path)
     sources_dir = config["paths"]["sources_dir"]
     output_dir = config["paths"]["output_dir"]
@@ -1381,8 +1630,57 @@ def extract_profile(config_path="config/applicant.yaml"):
     profile_overrides = committee_votes.get("profile", {}) if isinstance(committee_votes, dict) else {}
 
     output_text_dir = os.path.join(output_dir, "source_texts")
-    docs = load_documents(sources_dir, output_text_dir=output_text_dir)
-    docs.extend(_load_web_documents(config, output_text_dir))
+    with span("web") as web_span:
+        fetched_docs = _load_web_documents(config, output_text_dir)
+        web_span.count("documents", len(fetched_docs))
+
+    manifest_path = os.path.join(output_dir, PROFILE_MANIFEST_FILENAME)
+    with span("manifest"):
+        manifest_hash, manifest_components = _profile_manifest(config, sources_dir, fetched_docs, profile_overrides)
+        previous_manifest = _load_profile_manifest(manifest_path)
+        reasons = _manifest_changes(previous_manifest, manifest_components)
+        missing = [name for name in PROFILE_OUTPUTS if not os.path.exists(os.path.join(output_dir, name))]
+        if missing:
+            reasons.append(f"missing outputs: {', '.join(missing)}")
+    if force:
+        reasons = ["forced"] + reasons
+    if not reasons and config.get("profile", {}).get("incremental", True):
+        try:
+            profile = read_json(os.path.join(output_dir, "rob_profile.json"))
+            log_message(
+                logs_dir,
+                "extract_profile",
+                f"Profile sources unchanged (manifest {manifest_hash[:12]}); reusing rob_profile.json",
+            )
+            return profile
+        except Exception as exc:
+            reasons.append(f"rob_profile.json unreadable: {exc}")
+    log_message(logs_dir, "extract_profile", f"Re-extracting profile: {'; '.join(reasons) or 'incremental disabled'}")
+
+    with span("load") as load_span:
+        parsing = _parsing_settings(config)
+        text_cache = open_text_cache(parsing["cache_path"], max_pages=parsing["max_pages"], max_chars=parsing["max_chars"])
+        docs = load_documents(
+            sources_dir,
+            output_text_dir=output_text_dir,
+            workers=parsing["workers"],
+            timeout=parsing["timeout_seconds"],
+            cache=text_cache,
+            max_pages=parsing["max_pages"],
+            max_chars=parsing["max_chars"],
+        )
+        load_span.count("documents", len(docs))
+        load_span.count("workers", parsing["workers"])
+        if text_cache is not None:
+            cache_stats = text_cache.stats()
+            load_span.count("cache_hits", cache_stats["hits"])
+            load_span.count("cache_misses", cache_stats["misses"])
+            log_message(
+                logs_dir,
+                "extract_profile",
+                f"Source text cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses",
+            )
+    docs.extend(fetched_docs)
     inventory = build_inventory(docs)
     write_json(inventory, os.path.join(output_dir, "source_inventory.json"))
 
@@ -1490,13 +1788,14 @@ def extract_profile(config_path="config/applicant.yaml"):
 
     profile["hard_skills"] = list(dict.fromkeys(profile["hard_skills"]))
     profile["soft_skills"] = list(dict.fromkeys(profile["soft_skills"]))
-    profile["skill_weighting"] = _build_skill_weighting(
-        profile,
-        combined_text,
-        config,
-        committee_cfg=config.get("profile", {}).get("committee", {}),
-        overrides=profile_overrides,
-    )
+    with span("skill_weighting"):
+        profile["skill_weighting"] = _build_skill_weighting(
+            profile,
+            combined_text,
+            config,
+            committee_cfg=config.get("profile", {}).get("committee", {}),
+            overrides=profile_overrides,
+        )
     profile["role_abstractions"] = _build_role_abstractions(profile["skill_weighting"], overrides=profile_overrides)
     profile["capability_baseline"] = _build_capability_baseline(profile, combined_text, config)
     role_intent, intent_signals = _infer_role_intent(profile, combined_text)
@@ -1561,6 +1860,7 @@ def extract_profile(config_path="config/applicant.yaml"):
 
     write_json(committee_review, os.path.join(output_dir, "committee_review.json"))
     write_json(profile, os.path.join(output_dir, "rob_profile.json"))
+    write_json({"hash": manifest_hash, "components": manifest_components}, manifest_path)
     log_message(logs_dir, "extract_profile", f"Extracted profile from {len(docs)} documents")
     if held_skills or held_abstractions or held_emails:
         log_message(logs_dir, "extract_profile", "Committee review queued; see committee_review.json")
@@ -4,6 +4,8 @@ from utils.io import load_config, read_json, write_json, log_message
 from utils.db import db_enabled, init_db, load_votes as db_load_votes
 from utils.translator import detect_language
 from utils.exporter import build_cover_letter_text, export_docx, export_pdf
+from utils.match_index import load_matches
+from utils.tracing import span, traced_run
 
 
 def _load_prompt(prompts_dir, filename):
@@ -81,14 +83,17 @@ def _copy_previous_package(path):
         return ""
 
 
+@traced_run("generate_app")
 def generate_app(config_path="config/applicant.yaml"):
     config = load_config(config_path)
     output_dir = config["paths"]["output_dir"]
     prompts_dir = config["paths"]["prompts_dir"]
     logs_dir = config["paths"]["logs_dir"]
 
-    profile = read_json(os.path.join(output_dir, "rob_profile.json"))
-    matches = read_json(os.path.join(output_dir, "matched_jobs.json"))
+    with span("load") as load_span:
+        profile = read_json(os.path.join(output_dir, "rob_profile.json"))
+        matches = load_matches(output_dir)
+        load_span.count("matches", len(matches))
 
     top_n = config.get("matching", {}).get("top_n", 5)
     min_score = config.get("matching", {}).get("min_score", 0.0)
@@ -132,7 +137,8 @@ def generate_app(config_path="config/applicant.yaml"):
         lang = job.get("language") or detect_language(job.get("description", ""))
         job_id = job.get("id")
         role_family = template_overrides.get(str(job_id), default_role_family) if job_id else default_role_family
-        letter, template_file = create_cover_letter(job, profile, config, lang, max_skills, role_family=role_family)
+        with span("draft"):
+            letter, template_file = create_cover_letter(job, profile, config, lang, max_skills, role_family=role_family)
 
         email = job.get("contact_email")
         if not email:
@@ -165,14 +171,16 @@ def generate_app(config_path="config/applicant.yaml"):
             },
         }
 
-        output_path = os.path.join(output_app_dir, f"application_{idx}.json")
-        _copy_previous_package(output_path)
-        write_json(package, output_path)
+        with span("write"):
+            output_path = os.path.join(output_app_dir, f"application_{idx}.json")
+            _copy_previous_package(output_path)
+            write_json(package, output_path)
 
-        docx_path = os.path.join(output_app_dir, f"application_{idx}.docx")
-        pdf_path = os.path.join(output_app_dir, f"application_{idx}.pdf")
-        export_docx(letter, docx_path)
-        export_pdf(letter, pdf_path)
+        with span("export"):
+            docx_path = os.path.join(output_app_dir, f"application_{idx}.docx")
+            pdf_path = os.path.join(output_app_dir, f"application_{idx}.pdf")
+            export_docx(letter, docx_path)
+            export_pdf(letter, pdf_path)
 
     log_message(logs_dir, "generate_app", f"Generated {len(filtered)} application drafts")
     return filtered
@@ -1,9 +1,24 @@
 import os
+import pickle
 import re
-
-from utils.io import load_config, read_json, write_json, log_message
-from utils.db import db_enabled, init_db, upsert_job_state
-from utils.vectorizer import jaccard_similarity, semantic_similarity, SemanticEmbedder, cluster_texts
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from utils.io import load_config, read_json, write_json, log_message, file_lock
+from utils.db import db_enabled, init_db, JobStateWriter
+from utils.cache import AnalysisCache, stable_hash
+from utils.feature_store import feature_store_path, write_features, load_features
+from utils.match_index import (
+    load_matches,
+    match_index_path,
+    match_index_settings,
+    matches_available,
+    save_match_detail,
+    write_match_index,
+)
+from utils.tracing import collect_spans, merge_spans, span, traced_run
+from utils.vectorizer import jaccard_similarity, semantic_similarity, SemanticEmbedder, cluster_texts, BM25Index
 from utils.feedback import load_feedback, build_tag_stats, build_feedback_tags, score_adjustment
 from utils.translator import detect_language
 from modules.extract_profile import (  # noqa: E402
@@ -30,36 +45,92 @@ ROLE_INTENT_ORDER = [
     "engineering_execution",
 ]
 ROLE_INTENT_LEADERSHIP = {"executive_strategy", "principal_architecture", "consulting_leadership"}
-SALES_GUARD_PATTERNS = [
-    r"\baccount executive\b",
-    r"\baccount manager\b",
-    r"\bsales ops\b",
-    r"\bsales operations\b",
-    r"\bbusiness development\b",
-    r"\bquota\b",
-    r"\bsdr\b",
-    r"\bbdr\b",
-    r"\bsales(?!force)\b",
+SALES_GUARD_TERMS = [
+    "account executive",
+    "account manager",
+    "sales ops",
+    "sales operations",
+    "business development",
+    "quota",
+    "sdr",
+    "bdr",
+    "sales",
+]
+SALES_GUARD_PATTERNS = [rf"\b{re.escape(term)}\b" for term in SALES_GUARD_TERMS]
+INTENT_RULES = [
+    ("executive_strategy", ["director", "head", "vp", "chief", "executive", "strategy"], ["vice president"]),
+    (
+        "principal_architecture",
+        ["architect", "architecture"],
+        ["solution architect", "enterprise architect", "platform architect"],
+    ),
+    ("consulting_leadership", ["consultant", "consulting", "advisory", "advisor", "partner", "client"], ["presales", "pre-sales"]),
+    (
+        "engineering_execution",
+        ["engineer", "developer", "scientist", "backend", "frontend", "swe", "devops", "sre"],
+        ["data engineer", "ml engineer", "full stack"],
+    ),
+]
+INTENT_PATTERNS = [
+    (tag, re.compile("|".join([rf"\b{re.escape(word)}\b" for word in words] + [re.escape(phrase) for phrase in phrases])))
+    for tag, words, phrases in INTENT_RULES
 ]
+SENIORITY_RULES = [
+    ("c_level", ["chief", "c-level", "cto", "cio", "ciso", "ceo", "coo", "cpo"]),
+    ("vp", ["vp", "vice president"]),
+    ("director", ["director", "head of"]),
+    ("principal", ["principal", "staff"]),
+    ("lead", ["lead", "leader"]),
+    ("senior", ["senior", "sr.", "sr "]),
+    ("mid", ["mid", "mid-level", "mid level"]),
+    ("junior", ["junior", "jr.", "jr "]),
+    ("intern", ["intern", "internship"]),
+]
+CONTRACT_RULES = [
+    ("full_time", ["full-time", "full time", "fulltime"]),
+    ("part_time", ["part-time", "part time", "parttime"]),
+    ("contract", ["contract", "contractor", "fixed-term", "fixed term"]),
+    ("freelance", ["freelance"]),
+    ("internship", ["intern", "internship"]),
+    ("temporary", ["temporary", "temp"]),
+]
+BENEFIT_RULES = [
+    ("health", ["health insurance", "medical insurance", "healthcare", "medical plan"]),
+    ("pension", ["pension", "retirement", "401k", "401(k)"]),
+    ("equity", ["equity", "stock", "stock options", "esop", "rsu"]),
+    ("bonus", ["bonus", "performance bonus", "annual bonus"]),
+    ("relocation", ["relocation", "relocate"]),
+    ("visa", ["visa sponsorship", "work visa", "sponsorship"]),
+    ("training", ["training", "learning budget", "education budget", "conference"]),
+    ("wellness", ["wellness", "gym", "fitness"]),
+    ("pto", ["pto", "paid time off", "vacation", "holiday"]),
+]
+ON_SITE_TOKENS = ["on-site", "onsite", "in-office", "in office", "office-based"]
+EMPLOYMENT_TYPES = {
+    "full_time": "Full-time",
+    "part_time": "Part-time",
+    "contract": "Contract",
+    "temporary": "Temporary",
+    "internship": "Internship",
+    "freelance": "Freelance",
+}
+WORKPLACES = {"remote": "Remote", "hybrid": "Hybrid", "on_site": "On-site"}
+PAY_CURRENCY = r"(?:USD|EUR|GBP|CHF|CAD|AUD|NZD|SGD|HKD|JPY|CNY|INR|SEK|NOK|DKK|PLN|CZK|BRL|MXN|\$|\u20ac|\u00a3)"
+PAY_AMOUNT = r"\d{2,3}(?:[.,]\d{3})*(?:\s?[kK])?"
+PAY_RANGE_PATTERN = re.compile(
+    rf"(?P<currency>{PAY_CURRENCY})\s*(?P<min>{PAY_AMOUNT})\s*(?:-|to|\u2013|\u2014)\s*(?P<currency2>{PAY_CURRENCY})?\s*(?P<max>{PAY_AMOUNT})",
+    re.IGNORECASE,
+)
+PAY_SINGLE_PATTERN = re.compile(rf"(?P<currency>{PAY_CURRENCY})\s*(?P<amount>{PAY_AMOUNT})", re.IGNORECASE)
+ANALYSIS_CACHE_VERSION = 2
+BASE_PRESET = "base"
 
 
 def _job_intent_tags(job):
     title = job.get("title", "") or ""
     description = job.get("description", "") or ""
     text = f"{title} {description}".lower()
-    tags = set()
-    if re.search(r"\bdirector\b|\bhead\b|\bvp\b|vice president|\bchief\b|\bexecutive\b|\bstrategy\b", text):
-        tags.add("executive_strategy")
-    if re.search(r"\barchitect\b|\barchitecture\b|solution architect|enterprise architect|platform architect", text):
-        tags.add("principal_architecture")
-    if re.search(r"\bconsultant\b|\bconsulting\b|\badvisory\b|\badvisor\b|pre-?sales|\bpartner\b|\bclient\b", text):
-        tags.add("consulting_leadership")
-    if re.search(
-        r"\bengineer\b|\bdeveloper\b|\bscientist\b|data engineer|ml engineer|\bbackend\b|\bfrontend\b|full stack|\bswe\b|\bdevops\b|\bsre\b",
-        text,
-    ):
-        tags.add("engineering_execution")
-    return tags
+    return {tag for tag, pattern in INTENT_PATTERNS if pattern.search(text)}
 
 
 def _primary_job_track(tags):
@@ -102,21 +173,14 @@ def _normalize_amount(raw):
 def _extract_compensation(text):
     if not text:
         return ""
-    currency = r"(?:USD|EUR|GBP|CHF|CAD|AUD|NZD|SGD|HKD|JPY|CNY|INR|SEK|NOK|DKK|PLN|CZK|BRL|MXN|\$|\u20ac|\u00a3)"
-    amount = r"\d{2,3}(?:[.,]\d{3})*(?:\s?[kK])?"
-    range_pattern = re.compile(
-        rf"(?P<currency>{currency})\s*(?P<min>{amount})\s*(?:-|to|\u2013|\u2014)\s*(?P<currency2>{currency})?\s*(?P<max>{amount})",
-        re.IGNORECASE,
-    )
-    match = range_pattern.search(text)
+    match = PAY_RANGE_PATTERN.search(text)
     if match:
         unit = _extract_pay_unit(text, match.start(), match.end())
         min_amt = _normalize_amount(match.group("min"))
         max_amt = _normalize_amount(match.group("max"))
         return f"{match.group('currency')} {min_amt} - {max_amt}{unit}".strip()
 
-    single_pattern = re.compile(rf"(?P<currency>{currency})\s*(?P<amount>{amount})", re.IGNORECASE)
-    match = single_pattern.search(text)
+    match = PAY_SINGLE_PATTERN.search(text)
     if match:
         unit = _extract_pay_unit(text, match.start(), match.end())
         amt = _normalize_amount(match.group("amount"))
@@ -124,65 +188,30 @@ def _extract_compensation(text):
     return ""
 
 
-def _detect_seniority(text):
-    if not text:
-        return ""
-    rules = [
-        ("c_level", ["chief", "c-level", "cto", "cio", "ciso", "ceo", "coo", "cpo"]),
-        ("vp", ["vp", "vice president"]),
-        ("director", ["director", "head of"]),
-        ("principal", ["principal", "staff"]),
-        ("lead", ["lead", "leader"]),
-        ("senior", ["senior", "sr.", "sr "]),
-        ("mid", ["mid", "mid-level", "mid level"]),
-        ("junior", ["junior", "jr.", "jr "]),
-        ("intern", ["intern", "internship"]),
-    ]
-    low = text.lower()
+def _first_rule_label(rules, found):
     for label, tokens in rules:
-        if any(token in low for token in tokens):
+        if any(token in found for token in tokens):
             return label
     return ""
 
 
+def _detect_seniority(text):
+    if not text:
+        return ""
+    return _first_rule_label(SENIORITY_RULES, text.lower())
+
+
 def _detect_contract_type(text):
     if not text:
         return ""
-    rules = [
-        ("full_time", ["full-time", "full time", "fulltime"]),
-        ("part_time", ["part-time", "part time", "parttime"]),
-        ("contract", ["contract", "contractor", "fixed-term", "fixed term"]),
-        ("freelance", ["freelance"]),
-        ("internship", ["intern", "internship"]),
-        ("temporary", ["temporary", "temp"]),
-    ]
-    low = text.lower()
-    for label, tokens in rules:
-        if any(token in low for token in tokens):
-            return label
-    return ""
+    return _first_rule_label(CONTRACT_RULES, text.lower())
 
 
 def _detect_benefits(text):
     if not text:
         return []
-    rules = {
-        "health": ["health insurance", "medical insurance", "healthcare", "medical plan"],
-        "pension": ["pension", "retirement", "401k", "401(k)"],
-        "equity": ["equity", "stock", "stock options", "esop", "rsu"],
-        "bonus": ["bonus", "performance bonus", "annual bonus"],
-        "relocation": ["relocation", "relocate"],
-        "visa": ["visa sponsorship", "work visa", "sponsorship"],
-        "training": ["training", "learning budget", "education budget", "conference"],
-        "wellness": ["wellness", "gym", "fitness"],
-        "pto": ["pto", "paid time off", "vacation", "holiday"],
-    }
     low = text.lower()
-    hits = []
-    for label, tokens in rules.items():
-        if any(token in low for token in tokens):
-            hits.append(label)
-    return hits
+    return [label for label, tokens in BENEFIT_RULES if any(token in low for token in tokens)]
 
 
 def _detect_work_mode(text, location_text):
@@ -192,52 +221,129 @@ def _detect_work_mode(text, location_text):
         return "hybrid"
     if "remote" in low or "remote" in loc or "telecommute" in low:
         return "remote"
-    if any(token in low for token in ["on-site", "onsite", "in-office", "in office", "office-based"]):
+    if any(token in low for token in ON_SITE_TOKENS):
         return "on_site"
     return ""
 
 
+def _job_facts(location, work_mode, contract_type, compensation, seniority, benefits):
+    return {
+        "location": location.strip(),
+        "workplace": WORKPLACES.get(work_mode, ""),
+        "work_mode": work_mode,
+        "employment_type": EMPLOYMENT_TYPES.get(contract_type, ""),
+        "contract_type": contract_type,
+        "compensation": compensation,
+        "seniority": seniority,
+        "benefits": benefits,
+    }
+
+
 def _extract_job_facts(job):
     description = job.get("description", "") or ""
     title = job.get("title", "") or ""
     location = job.get("location", "") or ""
     text = f"{title}\\n{description}".lower()
-    location_text = location.lower()
-
-    work_mode = _detect_work_mode(text, location_text)
-    workplace = (
-        "Remote" if work_mode == "remote" else "Hybrid" if work_mode == "hybrid" else "On-site" if work_mode == "on_site" else ""
-    )
-    contract_type = _detect_contract_type(text)
-    employment_type = (
-        "Full-time"
-        if contract_type == "full_time"
-        else "Part-time"
-        if contract_type == "part_time"
-        else "Contract"
-        if contract_type == "contract"
-        else "Temporary"
-        if contract_type == "temporary"
-        else "Internship"
-        if contract_type == "internship"
-        else "Freelance"
-        if contract_type == "freelance"
-        else ""
+    return _job_facts(
+        location,
+        _detect_work_mode(text, location.lower()),
+        _detect_contract_type(text),
+        _extract_compensation(description),
+        _detect_seniority(title) or _detect_seniority(description),
+        _detect_benefits(description),
     )
 
-    compensation = _extract_compensation(description)
-    seniority = _detect_seniority(title) or _detect_seniority(description)
-    benefits = _detect_benefits(description)
 
+def _trie_pattern(terms):
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return build(trie)
+
+
+JOB_SCAN_BOUNDED = set(SALES_GUARD_TERMS) | {word for _, words, _ in INTENT_RULES for word in words}
+JOB_SCAN_TERMS = sorted(
+    JOB_SCAN_BOUNDED
+    | {phrase for _, _, phrases in INTENT_RULES for phrase in phrases}
+    | {token for rules in (SENIORITY_RULES, CONTRACT_RULES, BENEFIT_RULES) for _, tokens in rules for token in tokens}
+    | set(ON_SITE_TOKENS)
+    | {"hybrid", "remote", "telecommute"}
+)
+JOB_SCAN_PATTERN = re.compile(_trie_pattern(JOB_SCAN_TERMS))
+JOB_SCAN_PREFIXES = {term: [other for other in JOB_SCAN_TERMS if term.startswith(other)] for term in JOB_SCAN_TERMS}
+
+
+def _is_word_char(text, idx):
+    return 0 <= idx < len(text) and (text[idx].isalnum() or text[idx] == "_")
+
+
+def _scan_job(job):
+    title = job.get("title", "") or ""
+    description = job.get("description", "") or ""
+    location = job.get("location", "") or ""
+    text = f"{title} {description}".lower()
+    split = len(title.lower())
+    anywhere = set()
+    bounded = set()
+    title_terms = set()
+    title_bounded = set()
+    description_terms = set()
+    match = JOB_SCAN_PATTERN.search(text)
+    while match:
+        start = match.start()
+        for term in JOB_SCAN_PREFIXES[match.group()]:
+            end = start + len(term)
+            anywhere.add(term)
+            in_title = end <= split
+            if in_title:
+                title_terms.add(term)
+            elif start > split:
+                description_terms.add(term)
+            if term in JOB_SCAN_BOUNDED and not _is_word_char(text, start - 1) and not _is_word_char(text, end):
+                bounded.add(term)
+                if in_title:
+                    title_bounded.add(term)
+        match = JOB_SCAN_PATTERN.search(text, start + 1)
+
+    intent_tags = {
+        tag
+        for tag, words, phrases in INTENT_RULES
+        if any(word in bounded for word in words) or any(phrase in anywhere for phrase in phrases)
+    }
+    body_terms = title_terms | description_terms
+    location_text = location.lower()
+    if "hybrid" in body_terms or "hybrid" in location_text:
+        work_mode = "hybrid"
+    elif "remote" in body_terms or "remote" in location_text or "telecommute" in body_terms:
+        work_mode = "remote"
+    elif any(token in body_terms for token in ON_SITE_TOKENS):
+        work_mode = "on_site"
+    else:
+        work_mode = ""
+    job_facts = _job_facts(
+        location,
+        work_mode,
+        _first_rule_label(CONTRACT_RULES, body_terms),
+        _extract_compensation(description),
+        _first_rule_label(SENIORITY_RULES, title_terms) or _first_rule_label(SENIORITY_RULES, description_terms),
+        [label for label, tokens in BENEFIT_RULES if any(token in description_terms for token in tokens)],
+    )
     return {
-        "location": location.strip(),
-        "workplace": workplace,
-        "work_mode": work_mode,
-        "employment_type": employment_type,
-        "contract_type": contract_type,
-        "compensation": compensation,
-        "seniority": seniority,
-        "benefits": benefits,
+        "intent_tags": intent_tags,
+        "sales_guard": any(term in title_bounded for term in SALES_GUARD_TERMS),
+        "job_facts": job_facts,
     }
 
 
@@ -558,7 +664,14 @@ def _collect_committee_review(skill_weighting, role_abstractions):
     }
 
 
-def _build_job_analysis(text, config, overrides=None):
+def _skill_vocabulary(profile, config):
+    skills_seed = config.get("skills_seed", {}) or {}
+    skills = list(skills_seed.get("hard", [])) + list(skills_seed.get("soft", []))
+    skills += list(profile.get("hard_skills", [])) + list(profile.get("soft_skills", []))
+    return tuple(skill for skill in dict.fromkeys(skills) if skill)
+
+
+def _build_job_analysis(text, config, overrides=None, vocabulary=None):
     hard, soft = _extract_skill_lists(text, config)
     hard = list(dict.fromkeys(hard))
     soft = list(dict.fromkeys(soft))
@@ -572,7 +685,9 @@ def _build_job_analysis(text, config, overrides=None):
 
     job_profile = {"hard_skills": hard, "soft_skills": soft, "evidence": evidence}
     committee_cfg = config.get("matching", {}).get("committee", {})
-    weighting = _build_skill_weighting(job_profile, text, config, committee_cfg=committee_cfg, overrides=overrides)
+    weighting = _build_skill_weighting(
+        job_profile, text, config, committee_cfg=committee_cfg, overrides=overrides, vocabulary=vocabulary
+    )
     abstractions = _build_role_abstractions(weighting, overrides=overrides)
     committee_review = _collect_committee_review(weighting, abstractions)
     return {
@@ -641,10 +756,27 @@ def _compute_alignment(profile_weighting, job_weighting, profile_abstractions, j
         "alignment_score": alignment_score,
     }
 
-def _select_similarity(similarity_mode, embedder):
+def _select_similarity(similarity_mode, embedder, bm25=None):
     if similarity_mode == "token":
-        return lambda a, b: jaccard_similarity(a, b)
-    return lambda a, b: semantic_similarity(a, b, embedder)
+        return lambda a, b, field="documents": jaccard_similarity(a, b)
+    if similarity_mode == "bm25" and bm25:
+        return lambda a, b, field="documents": _bm25_similarity(bm25[field], a, b)
+    return lambda a, b, field="documents": semantic_similarity(a, b, embedder)
+
+
+def _build_bm25(jobs, config):
+    bm25_cfg = config.get("matching", {}).get("semantic", {}).get("bm25", {}) or {}
+    texts = [_embedding_texts(job) for job in jobs]
+    k1 = bm25_cfg.get("k1", 1.5)
+    b = bm25_cfg.get("b", 0.75)
+    return {
+        "documents": BM25Index([row[0] for row in texts], k1=k1, b=b),
+        "titles": BM25Index([row[1] for row in texts], k1=k1, b=b),
+    }
+
+
+def _bm25_similarity(index, query, text):
+    return index.similarity(query, text)
 
 
 def _merge_weights(base, override):
@@ -656,15 +788,25 @@ def _merge_weights(base, override):
     return merged
 
 
+def _preset_key(preset_name):
+    return preset_name or BASE_PRESET
+
+
+def _rank_key(match):
+    return (-match["score"], str(match.get("id") or ""))
+
+
 def _resolve_scoring_preset(config, preset_name=None):
     scoring_cfg = config.get("scoring", {}) or {}
     presets = scoring_cfg.get("presets", {}) or {}
     if preset_name is None:
         active_name = scoring_cfg.get("active_preset") or ""
-    elif preset_name == "":
+    elif preset_name in ("", BASE_PRESET):
         active_name = ""
     else:
         active_name = preset_name
+    if active_name == BASE_PRESET:
+        active_name = ""
     preset = presets.get(active_name) if active_name else None
     base_weights = config.get("matching", {}).get("weights", {}) or {}
     base_apply = config.get("matching", {}).get("apply_threshold", 0.25)
@@ -688,47 +830,19 @@ def _resolve_scoring_preset(config, preset_name=None):
     }
 
 
-def _score_jobs(jobs, profile, config, similarity_mode=None, feedback_enabled=None, preset_name=None):
-    logs_dir = config["paths"]["logs_dir"]
+def _build_scoring_context(profile, config, similarity_mode=None, feedback_enabled=None, preset_name=None):
     output_dir = config["paths"]["output_dir"]
     matching_cfg = config.get("matching", {}) or {}
     semantic_cfg = matching_cfg.get("semantic", {}) or {}
-    similarity_cfg = matching_cfg.get("similarity", {}) or {}
-    mode = similarity_mode or semantic_cfg.get("mode", "semantic")
-    backend = semantic_cfg.get("backend", "hash")
-    model_path = semantic_cfg.get("model_path") or os.getenv("APPLICANT_SEMANTIC_MODEL")
-    cache_path = semantic_cfg.get("cache_path")
-    embedder = None
-    if mode == "semantic":
-        embedder = SemanticEmbedder(backend=backend, model_path=model_path, cache_path=cache_path)
-        if not embedder.available:
-            log_message(logs_dir, "match_score", f"Semantic embedder unavailable ({embedder.reason}); using token overlap.")
-    similarity = _select_similarity(mode, embedder)
-
-    profile_text = _text_from_profile(profile)
-    evidence_items = _atomize_profile(profile)
-    profile_weighting = profile.get("skill_weighting", {}) or {}
-    profile_abstractions = profile.get("role_abstractions", {}) or {}
-    committee_votes = _load_committee_votes(os.path.join(config["paths"]["output_dir"], "committee_votes.json"))
-    region_keywords = config.get("matching", {}).get("region_keywords", [])
-    feedback_cfg = config.get("matching", {}).get("feedback", {}) or {}
+    feedback_cfg = matching_cfg.get("feedback", {}) or {}
     feedback_path = feedback_cfg.get("path") or os.path.join(output_dir, "feedback.json")
     feedback_enabled = feedback_enabled if feedback_enabled is not None else feedback_cfg.get("enabled", False)
-    feedback_stats = {}
-    if feedback_enabled:
-        feedback_data = load_feedback(feedback_path)
-        feedback_stats = build_tag_stats(feedback_data.get("outcomes"), feedback_data.get("rollbacks"))
-    base_weights = matching_cfg.get("weights", {})
-    supported_langs = set(config.get("language", {}).get("supported", []))
-    top_n = matching_cfg.get("top_n", 5)
-    apply_threshold = matching_cfg.get("apply_threshold", 0.25)
-    consider_threshold = matching_cfg.get("consider_threshold", 0.15)
+    feedback_data = load_feedback(feedback_path)
+    feedback_stats = build_tag_stats(feedback_data.get("outcomes"), feedback_data.get("rollbacks"))
+    preset_names = [""] + [
+        name for name in ((config.get("scoring", {}) or {}).get("presets", {}) or {}) if name != BASE_PRESET
+    ]
     reco_guard_cfg = matching_cfg.get("recommendation_guard", {}) or {}
-    reco_guard_enabled = reco_guard_cfg.get("enabled", True)
-    preset_cfg = _resolve_scoring_preset(config, preset_name=preset_name)
-    preset_weights = preset_cfg["weights"]
-    preset_apply = preset_cfg["apply_threshold"]
-    preset_consider = preset_cfg["consider_threshold"]
     intent_cfg = matching_cfg.get("role_intent", {}) or {}
     role_intent = (profile.get("role_intent") or "engineering_execution").lower()
     if role_intent not in ROLE_INTENT_ORDER:
@@ -745,265 +859,701 @@ def _score_jobs(jobs, profile, config, similarity_mode=None, feedback_enabled=No
         execution_bonus = float(intent_cfg.get("execution_bonus", 0.0))
     except (TypeError, ValueError):
         execution_bonus = 0.0
-    intent_enabled = intent_cfg.get("enabled", True)
+    evidence_items = _atomize_profile(profile)
 
-    results = []
-    review_queue = []
-    cluster_texts_list = []
+    return {
+        "config": config,
+        "mode": similarity_mode or semantic_cfg.get("mode", "semantic"),
+        "backend": semantic_cfg.get("backend", "hash"),
+        "model_path": semantic_cfg.get("model_path") or os.getenv("APPLICANT_SEMANTIC_MODEL"),
+        "cache_path": semantic_cfg.get("cache_path"),
+        "cache_max_entries": semantic_cfg.get("cache_max_entries", 0),
+        "cache_ttl_days": semantic_cfg.get("cache_ttl_days", 0),
+        "batch_size": semantic_cfg.get("batch_size", 64),
+        "dims": semantic_cfg.get("dims", 0),
+        "profile_text": _text_from_profile(profile),
+        "experience_text": " ".join([e.get("summary", "") for e in profile.get("experience", [])]),
+        "evidence_items": evidence_items,
+        "skill_vocabulary": _skill_vocabulary(profile, config),
+        "profile_hash": stable_hash(evidence_items),
+        "analysis_config_hash": stable_hash(
+            {
+                "skills_seed": config.get("skills_seed", {}),
+                "committee": matching_cfg.get("committee", {}),
+            }
+        ),
+        "profile_weighting": profile.get("skill_weighting", {}) or {},
+        "profile_abstractions": profile.get("role_abstractions", {}) or {},
+        "committee_votes": _load_committee_votes(os.path.join(output_dir, "committee_votes.json")),
+        "region_keywords": matching_cfg.get("region_keywords", []),
+        "feedback_cfg": feedback_cfg,
+        "feedback_enabled": feedback_enabled,
+        "feedback_stats": feedback_stats,
+        "supported_langs": set(config.get("language", {}).get("supported", [])),
+        "reco_guard_enabled": reco_guard_cfg.get("enabled", True),
+        "preset": _resolve_scoring_preset(config, preset_name=preset_name),
+        "presets": [_resolve_scoring_preset(config, preset_name=name) for name in preset_names],
+        "role_intent": role_intent,
+        "mismatch_penalty": mismatch_penalty,
+        "alignment_bonus": alignment_bonus,
+        "execution_bonus": execution_bonus,
+        "intent_enabled": intent_cfg.get("enabled", True),
+        "pruning": (matching_cfg.get("pruning", {}) or {}).get("enabled", False),
+    }
 
-    if db_enabled(config):
-        init_db(config)
 
-    for job in jobs:
-        title = job.get("title", "")
-        description = job.get("description", "") or ""
-        location = job.get("location", "")
-        text_missing = job.get("text_missing")
-        if text_missing is None:
-            text_missing = len(description) < 200
-        job_text = f"{title}\n\n{description}".strip() if description else title
-        job_facts = _extract_job_facts(job)
-        job_overrides = {}
-        if isinstance(committee_votes, dict):
-            job_key = str(job.get("id", ""))
-            job_overrides = (committee_votes.get("jobs", {}) or {}).get(job_key, {}) or {}
-        job_analysis = _build_job_analysis(job_text, config, overrides=job_overrides)
-        alignment = _compute_alignment(
-            profile_weighting,
-            job_analysis.get("skill_weighting", {}),
-            profile_abstractions,
-            job_analysis.get("role_abstractions", {}),
-        )
-        job_intent_tags = _job_intent_tags(job)
-        job_track = _primary_job_track(job_intent_tags)
-        intent_bonus = 0.0
-        intent_penalty = 0.0
-        if intent_enabled:
-            if role_intent == "engineering_execution":
-                if "engineering_execution" in job_intent_tags:
-                    intent_bonus = execution_bonus
-            else:
-                if "engineering_execution" in job_intent_tags:
-                    intent_penalty = mismatch_penalty
-                if job_intent_tags & ROLE_INTENT_LEADERSHIP:
-                    intent_bonus = alignment_bonus
-        intent_adjustment = intent_bonus - intent_penalty
-        if intent_bonus and intent_penalty:
-            intent_alignment = "mixed"
-        elif intent_bonus:
-            intent_alignment = "bonus"
-        elif intent_penalty:
-            intent_alignment = "penalty"
-        else:
-            intent_alignment = "neutral"
+def _open_analysis_cache(config):
+    cache_cfg = (config.get("matching", {}) or {}).get("analysis_cache", {}) or {}
+    if not cache_cfg.get("enabled", True):
+        return None
+    path = cache_cfg.get("path") or os.path.join(config["paths"]["output_dir"], "analysis_cache.json")
+    return AnalysisCache(path)
 
-        requirements = [] if text_missing else _extract_requirements(description)
-        if text_missing:
-            requirement_rows, coverage, gaps = [], 0.0, []
-            coverage_reason = "missing_description"
-        else:
-            requirement_rows, coverage, gaps = _match_requirements(requirements, evidence_items)
-            coverage_reason = ""
 
-        similarity_text = description if not text_missing else title
-        skills_semantic = similarity(profile_text, similarity_text)
-        title_score = similarity(profile_text, title)
-        experience_score = similarity(
-            " ".join([e.get("summary", "") for e in profile.get("experience", [])]),
-            similarity_text,
-        )
-        skills_signal = skills_semantic
-        if coverage > 0:
-            skills_signal = (skills_semantic + coverage) / 2
-        language = job.get("language") or detect_language(description)
-        language_score = 1.0 if language in supported_langs else 0.0
-        location_score = _location_score(location, region_keywords)
-
-        base_score = (
-            skills_signal * base_weights.get("skills", 0.0)
-            + title_score * base_weights.get("title", 0.0)
-            + experience_score * base_weights.get("experience", 0.0)
-            + language_score * base_weights.get("language", 0.0)
-            + location_score * base_weights.get("location", 0.0)
-            + alignment.get("alignment_score", 0.0) * base_weights.get("alignment", 0.0)
+def _resolve_workers(config, workers=None):
+    if workers is None:
+        workers = (config.get("matching", {}) or {}).get("workers", 1)
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        workers = 1
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def _job_text_missing(job):
+    text_missing = job.get("text_missing")
+    if text_missing is None:
+        text_missing = len(job.get("description", "") or "") < 200
+    return text_missing
+
+
+def _job_text(job):
+    title = job.get("title", "")
+    description = job.get("description", "") or ""
+    return f"{title}\n\n{description}".strip() if description else title
+
+
+def _embedding_texts(job):
+    title = job.get("title", "")
+    similarity_text = (job.get("description", "") or "") if not _job_text_missing(job) else title
+    return [similarity_text, title, _job_text(job)]
+
+
+def _job_overrides(job, committee_votes):
+    if not isinstance(committee_votes, dict):
+        return {}
+    job_key = str(job.get("id", ""))
+    return (committee_votes.get("jobs", {}) or {}).get(job_key, {}) or {}
+
+
+def _analysis_cache_key(job, context):
+    return stable_hash(
+        {
+            "version": ANALYSIS_CACHE_VERSION,
+            "job": {
+                "title": job.get("title", ""),
+                "description": job.get("description", "") or "",
+                "location": job.get("location", ""),
+                "text_missing": _job_text_missing(job),
+            },
+            "overrides": _job_overrides(job, context["committee_votes"]),
+            "profile": context["profile_hash"],
+            "config": context["analysis_config_hash"],
+        }
+    )
+
+
+def _analyze_job(job, context, job_facts=None):
+    description = job.get("description", "") or ""
+    text_missing = _job_text_missing(job)
+    job_overrides = _job_overrides(job, context["committee_votes"])
+    with span("analysis"):
+        job_analysis = _build_job_analysis(
+            _job_text(job), context["config"], overrides=job_overrides, vocabulary=context["skill_vocabulary"]
         )
-        preset_score = (
-            skills_signal * preset_weights.get("skills", 0.0)
-            + title_score * preset_weights.get("title", 0.0)
-            + experience_score * preset_weights.get("experience", 0.0)
-            + language_score * preset_weights.get("language", 0.0)
-            + location_score * preset_weights.get("location", 0.0)
-            + alignment.get("alignment_score", 0.0) * preset_weights.get("alignment", 0.0)
+    if text_missing:
+        requirement_rows, coverage, gaps = [], 0.0, []
+        coverage_reason = "missing_description"
+    else:
+        with span("requirements") as requirements_span:
+            requirements = _extract_requirements(description)
+            requirement_rows, coverage, gaps = _match_requirements(requirements, context["evidence_items"])
+            requirements_span.count("requirements", len(requirements))
+        coverage_reason = ""
+    return {
+        "job_facts": job_facts if job_facts is not None else _extract_job_facts(job),
+        "job_analysis": job_analysis,
+        "requirement_rows": requirement_rows,
+        "coverage": coverage,
+        "gaps": gaps,
+        "coverage_reason": coverage_reason,
+    }
+
+
+SCORE_COMPONENTS = ("skills", "title", "experience", "language", "location", "alignment")
+
+
+def _recommend(score, threshold_apply, threshold_consider, sales_hit, role_intent, job_intent_tags):
+    if score >= threshold_apply:
+        recommendation = "apply"
+    elif score >= threshold_consider:
+        recommendation = "consider"
+    else:
+        recommendation = "skip"
+    if sales_hit and recommendation == "apply":
+        recommendation = "consider"
+    out_of_scope = False
+    if (
+        role_intent != "engineering_execution"
+        and "engineering_execution" in job_intent_tags
+        and recommendation == "consider"
+    ):
+        recommendation = "skip"
+        out_of_scope = True
+    return recommendation, out_of_scope
+
+
+def _preset_view(components, preset_cfg, intent_adjustment, feedback_adjustment, sales_hit, role_intent, job_intent_tags):
+    weights = preset_cfg["weights"]
+    preset_score = sum(components[key] * weights.get(key, 0.0) for key in SCORE_COMPONENTS)
+    score_intent_adjusted = round(max(0.0, min(1.0, preset_score + intent_adjustment)), 4)
+    score_adjusted = round(max(0.0, min(1.0, score_intent_adjusted + feedback_adjustment)), 4)
+    threshold_apply = preset_cfg["apply_threshold"]
+    threshold_consider = preset_cfg["consider_threshold"]
+    recommendation, out_of_scope = _recommend(
+        score_intent_adjusted, threshold_apply, threshold_consider, sales_hit, role_intent, job_intent_tags
+    )
+    recommendation_feedback, out_of_scope_feedback = _recommend(
+        score_adjusted, threshold_apply, threshold_consider, sales_hit, role_intent, job_intent_tags
+    )
+    return {
+        "score_preset": round(preset_score, 4),
+        "score_intent_adjusted": score_intent_adjusted,
+        "score_adjusted": score_adjusted,
+        "recommendation": recommendation,
+        "recommendation_feedback": recommendation_feedback,
+        "out_of_scope": out_of_scope,
+        "out_of_scope_feedback": out_of_scope_feedback,
+        "thresholds": {"apply": threshold_apply, "consider": threshold_consider},
+    }
+
+
+def _apply_preset_view(match, preset_name, feedback_enabled):
+    view = match["score_by_preset"][_preset_key(preset_name)]
+    intent = match["intent"]
+    score_preset = view["score_preset"]
+    score_intent_adjusted = view["score_intent_adjusted"]
+    if feedback_enabled:
+        score_adjusted = view["score_adjusted"]
+        recommendation = view["recommendation_feedback"]
+        out_of_scope = view["out_of_scope_feedback"]
+    else:
+        score_adjusted = score_intent_adjusted
+        recommendation = view["recommendation"]
+        out_of_scope = view["out_of_scope"]
+    score_feedback_adjustment = round(score_adjusted - score_intent_adjusted, 4)
+
+    adjusted_by = []
+    if preset_name:
+        adjusted_by.append(f"preset:{preset_name}")
+    if intent["intent_alignment"] != "neutral":
+        adjusted_by.append(f"intent:{intent['intent_alignment']}:{intent['role_intent']}")
+    if feedback_enabled:
+        adjusted_by.extend(match.get("feedback_audit") or [])
+
+    notes = []
+    if match.get("recommendation_reason"):
+        notes.append(match["recommendation_reason"])
+    if out_of_scope:
+        notes.append("out_of_scope:engineering_execution")
+
+    match["score"] = score_adjusted
+    match["score_preset"] = score_preset
+    match["score_preset_adjustment"] = round(score_preset - match["score_raw"], 4)
+    match["score_intent_adjusted"] = score_intent_adjusted
+    match["score_intent_adjustment"] = round(score_intent_adjusted - score_preset, 4)
+    match["score_adjusted"] = score_adjusted
+    match["score_adjustment"] = score_feedback_adjustment
+    match["score_feedback_adjustment"] = score_feedback_adjustment
+    match["feedback_applied"] = bool(feedback_enabled)
+    match["adjusted_by"] = " + ".join(adjusted_by)
+    match["adjusted_by_parts"] = adjusted_by
+    match["preset_name"] = preset_name
+    intent["out_of_scope"] = out_of_scope
+    match["recommendation"] = recommendation
+    match["score_thresholds"] = dict(view["thresholds"])
+    match["notes"] = notes
+    return match
+
+
+def rerank_results(results, preset_name, feedback_enabled=False):
+    ranked = []
+    for match in results:
+        if _preset_key(preset_name) not in (match.get("score_by_preset") or {}):
+            return None
+        view = dict(match)
+        view["intent"] = dict(match.get("intent") or {})
+        ranked.append(_apply_preset_view(view, preset_name, feedback_enabled))
+    ranked.sort(key=_rank_key)
+    return ranked
+
+
+def _feedback_adjustment(job, job_facts, context):
+    feedback_cfg = context["feedback_cfg"]
+    feedback_tags = build_feedback_tags(job, job_facts)
+    adjustment = 0.0
+    adjustment_audit = []
+    if context["feedback_stats"] and feedback_tags:
+        adjustment, adjustment_audit = score_adjustment(
+            feedback_tags,
+            context["feedback_stats"],
+            weight=feedback_cfg.get("weight", 0.05),
+            tag_weight=feedback_cfg.get("tag_weight"),
+            company_weight=feedback_cfg.get("company_weight"),
+            min_samples=feedback_cfg.get("min_samples", 2),
+            max_adjustment=feedback_cfg.get("max_adjustment", 0.1),
         )
+    return feedback_tags, adjustment, adjustment_audit
 
-        feedback_tags = build_feedback_tags(job, job_facts)
-        adjustment = 0.0
-        adjustment_audit = []
-        if feedback_enabled and feedback_tags:
-            adjustment, adjustment_audit = score_adjustment(
-                feedback_tags,
-                feedback_stats,
-                weight=feedback_cfg.get("weight", 0.05),
-                tag_weight=feedback_cfg.get("tag_weight"),
-                company_weight=feedback_cfg.get("company_weight"),
-                min_samples=feedback_cfg.get("min_samples", 2),
-                max_adjustment=feedback_cfg.get("max_adjustment", 0.1),
-            )
-        score_raw = round(base_score, 4)
-        score_preset = round(preset_score, 4)
-        score_intent_adjusted = round(max(0.0, min(1.0, preset_score + intent_adjustment)), 4)
-        score_intent_adjustment = round(score_intent_adjusted - score_preset, 4)
-        score_adjusted = round(max(0.0, min(1.0, score_intent_adjusted + adjustment)), 4)
-        score_feedback_adjustment = round(score_adjusted - score_intent_adjusted, 4)
-        score_final = score_adjusted if feedback_enabled else score_intent_adjusted
-        adjusted_by = []
-        if preset_cfg["name"]:
-            adjusted_by.append(f"preset:{preset_cfg['name']}")
-        if intent_alignment != "neutral":
-            adjusted_by.append(f"intent:{intent_alignment}:{role_intent}")
-        if adjustment_audit:
-            adjusted_by.extend(adjustment_audit)
-        adjusted_by_label = " + ".join(adjusted_by)
-
-        threshold_apply = preset_apply if preset_cfg["name"] else apply_threshold
-        threshold_consider = preset_consider if preset_cfg["name"] else consider_threshold
-
-        if score_final >= threshold_apply:
-            recommendation = "apply"
-        elif score_final >= threshold_consider:
-            recommendation = "consider"
+
+def _score_upper_bound(cheap, skills_semantic, text_missing, intent_adjustment, feedback_adjustment, sales_hit, role_intent, job_intent_tags, presets):
+    ranges = {key: (value, value) for key, value in cheap.items()}
+    if text_missing:
+        ranges["skills"] = (skills_semantic, skills_semantic)
+    else:
+        ranges["skills"] = (min(skills_semantic, skills_semantic / 2), max(skills_semantic, (skills_semantic + 1) / 2))
+    ranges["alignment"] = (0.0, 1.0)
+    bound = 0.0
+    for preset in presets:
+        weights = preset["weights"]
+        components = {key: high if weights.get(key, 0.0) >= 0 else low for key, (low, high) in ranges.items()}
+        view = _preset_view(components, preset, intent_adjustment, feedback_adjustment, sales_hit, role_intent, job_intent_tags)
+        if view["recommendation"] != "skip" or view["recommendation_feedback"] != "skip":
+            return None
+        bound = max(bound, view["score_intent_adjusted"], view["score_adjusted"])
+    return bound
+
+
+def _score_job(job, context, similarity, features=None):
+    preset_cfg = context["preset"]
+    feedback_enabled = context["feedback_enabled"]
+    role_intent = context["role_intent"]
+
+    title = job.get("title", "")
+    description = job.get("description", "") or ""
+    location = job.get("location", "")
+    text_missing = _job_text_missing(job)
+    job_text = _job_text(job)
+
+    scan = _scan_job(job)
+    job_intent_tags = scan["intent_tags"]
+    job_track = _primary_job_track(job_intent_tags)
+    intent_bonus = 0.0
+    intent_penalty = 0.0
+    if context["intent_enabled"]:
+        if role_intent == "engineering_execution":
+            if "engineering_execution" in job_intent_tags:
+                intent_bonus = context["execution_bonus"]
         else:
-            recommendation = "skip"
-        reco_reason = ""
-        if reco_guard_enabled and _sales_guard_hit(title):
-            reco_reason = "role_family_out_of_scope:sales"
-            if recommendation == "apply":
-                recommendation = "consider"
-        out_of_scope = False
-        if (
-            role_intent != "engineering_execution"
-            and "engineering_execution" in job_intent_tags
-            and recommendation == "consider"
-        ):
-            recommendation = "skip"
-            out_of_scope = True
-
-        job_with_facts = dict(job)
-        job_with_facts["job_facts"] = job_facts
-        cluster_texts_list.append(job_text)
-        notes = []
-        if reco_reason:
-            notes.append(reco_reason)
-        if out_of_scope:
-            notes.append("out_of_scope:engineering_execution")
+            if "engineering_execution" in job_intent_tags:
+                intent_penalty = context["mismatch_penalty"]
+            if job_intent_tags & ROLE_INTENT_LEADERSHIP:
+                intent_bonus = context["alignment_bonus"]
+    intent_adjustment = intent_bonus - intent_penalty
+    if intent_bonus and intent_penalty:
+        intent_alignment = "mixed"
+    elif intent_bonus:
+        intent_alignment = "bonus"
+    elif intent_penalty:
+        intent_alignment = "penalty"
+    else:
+        intent_alignment = "neutral"
 
-        results.append(
-            {
-                "id": job.get("id"),
-                "score": score_final,
-                "score_raw": score_raw,
-                "score_preset": score_preset,
-                "score_preset_adjustment": round(score_preset - score_raw, 4),
-                "score_intent_adjusted": score_intent_adjusted,
-                "score_intent_adjustment": score_intent_adjustment,
-                "score_adjusted": score_adjusted,
-                "score_adjustment": score_feedback_adjustment,
-                "score_feedback_adjustment": score_feedback_adjustment,
-                "feedback_applied": bool(feedback_enabled),
-                "feedback_tags": feedback_tags,
-                "adjusted_by": adjusted_by_label,
-                "adjusted_by_parts": adjusted_by,
-                "preset_name": preset_cfg["name"],
-                "score_breakdown": {
-                    "skills": round(skills_signal, 4),
-                    "skills_semantic": round(skills_semantic, 4),
-                    "coverage_signal": round(coverage, 4),
-                    "title": round(title_score, 4),
-                    "experience": round(experience_score, 4),
-                    "language": round(language_score, 4),
-                    "location": round(location_score, 4),
-                    "alignment": alignment.get("alignment_score", 0.0),
-                    "capability_depth": round(skills_semantic, 4),
-                    "role_target_match": round(title_score, 4),
-                },
-                "intent": {
-                    "role_intent": role_intent,
-                    "job_track": job_track,
-                    "job_intent_tags": sorted(job_intent_tags),
-                    "intent_alignment": intent_alignment,
-                    "intent_bonus": round(intent_bonus, 4),
-                    "intent_penalty": round(intent_penalty, 4),
-                    "intent_adjustment": round(intent_adjustment, 4),
-                    "out_of_scope": out_of_scope,
-                },
-                "qualification": {
-                    "coverage": round(coverage, 4),
-                    "coverage_reason": coverage_reason,
-                    "requirements": requirement_rows,
-                    "gaps": gaps,
-                },
-                "job_analysis": job_analysis,
-                "alignment": alignment,
+    profile_text = context["profile_text"]
+    similarity_text = description if not text_missing else title
+    with span("similarity"):
+        skills_semantic = similarity(profile_text, similarity_text)
+        title_score = similarity(profile_text, title, field="titles")
+        experience_score = similarity(context["experience_text"], similarity_text)
+    language = job.get("language") or detect_language(description)
+    language_score = 1.0 if language in context["supported_langs"] else 0.0
+    location_score = _location_score(location, context["region_keywords"])
+    sales_hit = bool(context["reco_guard_enabled"] and scan["sales_guard"])
+
+    pruned = None
+    job_facts = scan["job_facts"]
+    if features is None and context.get("pruning"):
+        _, bound_adjustment, _ = _feedback_adjustment(job, job_facts, context)
+        upper_bound = _score_upper_bound(
+            {"title": title_score, "experience": experience_score, "language": language_score, "location": location_score},
+            skills_semantic,
+            text_missing,
+            intent_adjustment,
+            bound_adjustment,
+            sales_hit,
+            role_intent,
+            job_intent_tags,
+            context["presets"],
+        )
+        if upper_bound is not None:
+            pruned = {"upper_bound": upper_bound, "reason": "upper_bound_below_consider"}
+            features = {
                 "job_facts": job_facts,
-                "recommendation": recommendation,
-                "recommendation_reason": reco_reason,
-                "score_thresholds": {
-                    "apply": threshold_apply,
-                    "consider": threshold_consider,
-                },
-                "notes": notes,
-                "job": job_with_facts,
+                "job_analysis": {},
+                "requirement_rows": [],
+                "coverage": 0.0,
+                "gaps": [],
+                "coverage_reason": "pruned",
             }
+    if features is None:
+        features = _analyze_job(job, context, job_facts=job_facts)
+    job_facts = features["job_facts"]
+    job_analysis = features["job_analysis"]
+    requirement_rows = features["requirement_rows"]
+    coverage = features["coverage"]
+    gaps = features["gaps"]
+    coverage_reason = features["coverage_reason"]
+    alignment = _compute_alignment(
+        context["profile_weighting"],
+        job_analysis.get("skill_weighting", {}),
+        context["profile_abstractions"],
+        job_analysis.get("role_abstractions", {}),
+    )
+    skills_signal = skills_semantic
+    if coverage > 0:
+        skills_signal = (skills_semantic + coverage) / 2
+
+    components = {
+        "skills": skills_signal,
+        "title": title_score,
+        "experience": experience_score,
+        "language": language_score,
+        "location": location_score,
+        "alignment": alignment.get("alignment_score", 0.0),
+    }
+    feedback_tags, adjustment, adjustment_audit = _feedback_adjustment(job, job_facts, context)
+    score_by_preset = {}
+    for preset in context["presets"]:
+        score_by_preset[_preset_key(preset["name"])] = _preset_view(
+            components, preset, intent_adjustment, adjustment, sales_hit, role_intent, job_intent_tags
         )
+    score_raw = score_by_preset[BASE_PRESET]["score_preset"]
+
+    job_with_facts = dict(job)
+    job_with_facts["job_facts"] = job_facts
+
+    result = {
+        "id": job.get("id"),
+        "score": 0.0,
+        "score_raw": score_raw,
+        "score_preset": 0.0,
+        "score_preset_adjustment": 0.0,
+        "score_intent_adjusted": 0.0,
+        "score_intent_adjustment": 0.0,
+        "score_adjusted": 0.0,
+        "score_adjustment": 0.0,
+        "score_feedback_adjustment": 0.0,
+        "feedback_applied": False,
+        "feedback_tags": feedback_tags,
+        "feedback_audit": adjustment_audit,
+        "adjusted_by": "",
+        "adjusted_by_parts": [],
+        "preset_name": "",
+        "score_by_preset": score_by_preset,
+        "score_breakdown": {
+            "skills": round(skills_signal, 4),
+            "skills_semantic": round(skills_semantic, 4),
+            "coverage_signal": round(coverage, 4),
+            "title": round(title_score, 4),
+            "experience": round(experience_score, 4),
+            "language": round(language_score, 4),
+            "location": round(location_score, 4),
+            "alignment": alignment.get("alignment_score", 0.0),
+            "capability_depth": round(skills_semantic, 4),
+            "role_target_match": round(title_score, 4),
+        },
+        "intent": {
+            "role_intent": role_intent,
+            "job_track": job_track,
+            "job_intent_tags": sorted(job_intent_tags),
+            "intent_alignment": intent_alignment,
+            "intent_bonus": round(intent_bonus, 4),
+            "intent_penalty": round(intent_penalty, 4),
+            "intent_adjustment": round(intent_adjustment, 4),
+            "out_of_scope": False,
+        },
+        "qualification": {
+            "coverage": round(coverage, 4),
+            "coverage_reason": coverage_reason,
+            "requirements": requirement_rows,
+            "gaps": gaps,
+        },
+        "job_analysis": job_analysis,
+        "alignment": alignment,
+        "job_facts": job_facts,
+        "recommendation": "",
+        "recommendation_reason": "role_family_out_of_scope:sales" if sales_hit else "",
+        "score_thresholds": {},
+        "notes": [],
+        "job": job_with_facts,
+    }
+    if pruned:
+        result["pruned"] = pruned
+    _apply_preset_view(result, preset_cfg["name"], feedback_enabled)
+
+    review_entry = None
+    committee_review = job_analysis.get("committee_review") or {}
+    if committee_review:
+        review_entry = {
+            "job_id": job.get("id"),
+            "title": job.get("title", ""),
+            "company": job.get("company", ""),
+            "url": job.get("url", ""),
+            "committee_review": committee_review,
+        }
+    signals = {
+        "job_id": job.get("id"),
+        **components,
+        "skills_semantic": skills_semantic,
+        "coverage": coverage,
+        "intent_adjustment": intent_adjustment,
+        "feedback_adjustment": adjustment,
+        "sales_guard": sales_hit,
+        "role_intent": role_intent,
+        "job_intent_tags": sorted(job_intent_tags),
+        "pruned": bool(pruned),
+        "upper_bound": pruned["upper_bound"] if pruned else None,
+    }
+    return result, review_entry, job_text, features, signals
+
+
+def _build_embedder(context, read_only=False):
+    if context["mode"] != "semantic":
+        return None
+    return SemanticEmbedder(
+        backend=context["backend"],
+        model_path=context["model_path"],
+        cache_path=context["cache_path"],
+        cache_max_entries=context["cache_max_entries"],
+        cache_ttl_days=context["cache_ttl_days"],
+        dims=context["dims"],
+        cache_read_only=read_only,
+    )
 
-        committee_review = job_analysis.get("committee_review") or {}
-        if committee_review:
-            review_queue.append(
-                {
-                    "job_id": job.get("id"),
-                    "title": job.get("title", ""),
-                    "company": job.get("company", ""),
-                    "url": job.get("url", ""),
-                    "committee_review": committee_review,
-                }
-            )
 
-        if db_enabled(config) and job.get("id"):
-            upsert_job_state(config, job.get("id"), score_final, recommendation)
+_WORKER_STATE = {}
+
+
+def _init_score_worker(context):
+    # The parent prefetched and saved every embedding before starting the
+    # pool; workers only read the store so they never race on its files.
+    embedder = _build_embedder(context, read_only=True)
+    _WORKER_STATE["context"] = context
+    _WORKER_STATE["similarity"] = _select_similarity(context["mode"], embedder, context.get("bm25"))
+
+
+def _score_job_chunk(items):
+    context = _WORKER_STATE["context"]
+    similarity = _WORKER_STATE["similarity"]
+    with collect_spans() as run:
+        rows = [_score_job(job, context, similarity, features=features) for job, features in items]
+    return rows, run.export_spans()
+
+
+def _score_jobs_parallel(items, context, workers):
+    chunk_size = max(1, -(-len(items) // (workers * 4)))
+    chunks = [items[idx : idx + chunk_size] for idx in range(0, len(items), chunk_size)]
+    scored = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_score_worker, initargs=(context,)) as executor:
+        for chunk_rows, chunk_spans in executor.map(_score_job_chunk, chunks):
+            scored.extend(chunk_rows)
+            merge_spans(chunk_spans)
+    return scored
+
+
+def _score_jobs(
+    jobs,
+    profile,
+    config,
+    similarity_mode=None,
+    feedback_enabled=None,
+    preset_name=None,
+    workers=None,
+    feature_rows=None,
+):
+    logs_dir = config["paths"]["logs_dir"]
+    matching_cfg = config.get("matching", {}) or {}
+    similarity_cfg = matching_cfg.get("similarity", {}) or {}
+    top_n = matching_cfg.get("top_n", 5)
+    context = _build_scoring_context(
+        profile,
+        config,
+        similarity_mode=similarity_mode,
+        feedback_enabled=feedback_enabled,
+        preset_name=preset_name,
+    )
+    embedders = []
+
+    def parent_embedder():
+        # Built on first use: for serial scoring, for the prefetch that fills a
+        # persistent store ahead of the pool, or for clustering.
+        if not embedders:
+            embedder = _build_embedder(context)
+            if embedder is not None and not embedder.available:
+                log_message(logs_dir, "match_score", f"Semantic embedder unavailable ({embedder.reason}); using token overlap.")
+            embedders.append(embedder)
+        return embedders[0]
+
+    if context["mode"] == "bm25":
+        with span("index", documents=len(jobs)):
+            context["bm25"] = _build_bm25(jobs, config)
+            for query in (context["profile_text"], context["experience_text"]):
+                context["bm25"]["documents"].score_all(query)
+            context["bm25"]["titles"].score_all(context["profile_text"])
+        log_message(
+            logs_dir,
+            "match_score",
+            f"BM25 index: {len(context['bm25']['documents'])} documents, {len(context['bm25']['titles'])} titles.",
+        )
+    workers = min(_resolve_workers(config, workers), max(1, len(jobs)))
+
+    def prefetch_embeddings():
+        embedder = parent_embedder()
+        if not embedder or not embedder.available:
+            return
+        prefetch = [context["profile_text"], context["experience_text"]]
+        for job in jobs:
+            prefetch.extend(_embedding_texts(job))
+        with span("embedding_prefetch", texts=len(prefetch)):
+            embedder.embed_many(prefetch, batch_size=context["batch_size"])
+            if workers > 1:
+                embedder.cache.save()
+
+    if workers > 1 and context["mode"] == "semantic" and context["cache_path"] and context["backend"] != "hash_fast":
+        prefetch_embeddings()
+
+    results = []
+    review_queue = []
+    cluster_texts_list = []
+
+    state_writer = None
+    if db_enabled(config):
+        init_db(config)
+        state_writer = JobStateWriter(config)
+
+    with span("analysis_cache"):
+        analysis_cache = _open_analysis_cache(config)
+        cache_keys = [_analysis_cache_key(job, context) for job in jobs] if analysis_cache else [None] * len(jobs)
+        items = [(job, analysis_cache.get(key) if analysis_cache else None) for job, key in zip(jobs, cache_keys)]
+
+    scored = None
+    with span("score", jobs=len(items), workers=workers):
+        if workers > 1:
+            try:
+                scored = _score_jobs_parallel(items, context, workers)
+            except (BrokenProcessPool, pickle.PicklingError) as exc:
+                log_message(
+                    logs_dir,
+                    "match_score",
+                    f"Parallel scoring failed ({exc}); scoring serially.\n{traceback.format_exc()}",
+                )
+                scored = None
+        if scored is None:
+            if not embedders:
+                prefetch_embeddings()
+            embedder = parent_embedder()
+            similarity = _select_similarity(context["mode"], embedder, context.get("bm25"))
+            scored = [_score_job(job, context, similarity, features=features) for job, features in items]
+
+    for (job, cached), key, (result, review_entry, job_text, features, signals) in zip(items, cache_keys, scored):
+        if analysis_cache and cached is None and not result.get("pruned"):
+            analysis_cache.set(key, features)
+        results.append(result)
+        if feature_rows is not None:
+            feature_rows.append(signals)
+        cluster_texts_list.append(job_text)
+        if review_entry:
+            review_queue.append(review_entry)
+        if state_writer and job.get("id"):
+            state_writer.add(job.get("id"), result["score"], result["recommendation"])
+    if state_writer:
+        with span("db") as db_span:
+            state_writer.flush()
+            db_span.count("rows", state_writer.written)
+    if context["pruning"]:
+        pruned = sum(1 for result in results if result.get("pruned"))
+        log_message(
+            logs_dir,
+            "match_score",
+            f"Upper-bound pruning: {pruned} of {len(results)} jobs skipped full analysis.",
+        )
 
     if similarity_cfg.get("enabled", False) and results:
         try:
             cluster_threshold = float(similarity_cfg.get("threshold", 0.85))
         except (TypeError, ValueError):
             cluster_threshold = 0.85
+        embedder = parent_embedder()
         cluster_embedder = embedder if embedder and embedder.available else None
-        cluster_ids, cluster_sizes = cluster_texts(cluster_texts_list, embedder=cluster_embedder, threshold=cluster_threshold)
+        with span("clustering", texts=len(cluster_texts_list)):
+            cluster_ids, cluster_sizes = cluster_texts(cluster_texts_list, embedder=cluster_embedder, threshold=cluster_threshold)
         for idx, match in enumerate(results):
             cluster_id = cluster_ids[idx] if idx < len(cluster_ids) else None
             if cluster_id:
                 match["cluster_id"] = f"cluster-{cluster_id}"
                 match["cluster_size"] = cluster_sizes.get(cluster_id, 1)
 
-    if embedder and embedder.cache:
-        embedder.cache.save()
+    embedder = embedders[0] if embedders else None
+    if embedder and embedder.cache is not None:
+        with span("embedding_cache"):
+            embedder.cache.save()
+        if embedder.cache.evicted:
+            log_message(
+                logs_dir,
+                "match_score",
+                f"Embedding cache: evicted {embedder.cache.evicted} entries ({len(embedder.cache)} kept).",
+            )
+    if analysis_cache:
+        stats = analysis_cache.stats()
+        with span("analysis_cache", hits=stats["hits"], misses=stats["misses"]):
+            analysis_cache.save()
+        log_message(
+            logs_dir,
+            "match_score",
+            (
+                f"Analysis cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"(hit rate {stats['hit_rate']:.0%}, {stats['entries']} entries, {stats['pruned']} pruned)"
+            ),
+        )
 
-    results.sort(key=lambda x: x["score"], reverse=True)
+    results.sort(key=_rank_key)
     suggestions = _build_suggestions(results, top_n)
     assessment = _summarize_skill_assessment(results, profile)
     return results, suggestions, assessment, review_queue
 
 
+@traced_run("match_score")
 def match_score(
-    config_path="config/applicant.yaml", similarity_mode=None, write_outputs=True, feedback_enabled=None, preset_name=None
+    config_path="config/applicant.yaml",
+    similarity_mode=None,
+    write_outputs=True,
+    feedback_enabled=None,
+    preset_name=None,
+    workers=None,
 ):
     config = load_config(config_path)
     output_dir = config["paths"]["output_dir"]
     jobs_dir = config["paths"]["jobs_dir"]
     logs_dir = config["paths"]["logs_dir"]
 
-    profile = read_json(os.path.join(output_dir, "rob_profile.json"))
-    jobs = read_json(os.path.join(jobs_dir, "latest_jobs.json"))
+    with span("load") as load_span:
+        profile = read_json(os.path.join(output_dir, "rob_profile.json"))
+        jobs = read_json(os.path.join(jobs_dir, "latest_jobs.json"))
+        load_span.count("jobs", len(jobs))
 
+    feature_rows = []
     results, suggestions, assessment, review_queue = _score_jobs(
         jobs,
         profile,
@@ -1011,24 +1561,31 @@ def match_score(
         similarity_mode=similarity_mode,
         feedback_enabled=feedback_enabled,
         preset_name=preset_name,
+        workers=workers,
+        feature_rows=feature_rows,
     )
 
     if not write_outputs:
         return results
 
-    output_path = os.path.join(output_dir, "matched_jobs.json")
-    write_json(results, output_path)
-    write_json(suggestions, os.path.join(output_dir, "job_suggestions.json"))
-    write_json(assessment, os.path.join(output_dir, "skill_assessment.json"))
-    if review_queue:
-        write_json(
-            {
-                "action": "agent_review",
-                "jobs": review_queue,
-                "notes": "Held job skills/abstractions require agent review before use in scoring.",
-            },
-            os.path.join(output_dir, "job_committee_review.json"),
-        )
+    with span("write", matches=len(results)):
+        _write_ranked_outputs(output_dir, results, suggestions, assessment, config)
+        if (config.get("matching", {}).get("feature_store", {}) or {}).get("enabled", True):
+            features_path = feature_store_path(config)
+            try:
+                count = write_features(features_path, feature_rows)
+                log_message(logs_dir, "match_score", f"Wrote {count} job feature rows to {features_path}")
+            except Exception as exc:
+                log_message(logs_dir, "match_score", f"Feature store write failed ({exc}).")
+        if review_queue:
+            write_json(
+                {
+                    "action": "agent_review",
+                    "jobs": review_queue,
+                    "notes": "Held job skills/abstractions require agent review before use in scoring.",
+                },
+                os.path.join(output_dir, "job_committee_review.json"),
+            )
     log_message(logs_dir, "match_score", f"Ranked {len(results)} jobs")
     log_message(logs_dir, "match_score", f"Wrote {len(suggestions)} job suggestions")
     log_message(logs_dir, "match_score", "Wrote skill assessment summary")
@@ -1037,5 +1594,166 @@ def match_score(
     return results
 
 
+def expand_pruned_match(config, match):
+    if not match.get("pruned"):
+        return match
+    output_dir = config["paths"]["output_dir"]
+    profile_path = os.path.join(output_dir, "rob_profile.json")
+    if not os.path.exists(profile_path):
+        return match
+    context = _build_scoring_context(
+        read_json(profile_path),
+        config,
+        feedback_enabled=bool(match.get("feedback_applied")),
+        preset_name=match.get("preset_name", ""),
+    )
+    context["pruning"] = False
+    job = {key: value for key, value in (match.get("job") or {}).items() if key != "job_facts"}
+    if context["mode"] == "bm25":
+        jobs_path = os.path.join(config["paths"]["jobs_dir"], "latest_jobs.json")
+        jobs = read_json(jobs_path) if os.path.exists(jobs_path) else []
+        context["bm25"] = _build_bm25(jobs or [job], config)
+    # Expansion runs on web requests next to scoring runs; it only reads the
+    # embedding store and leaves persisting vectors to the runs themselves.
+    embedder = _build_embedder(context, read_only=True)
+    result = _score_job(job, context, _select_similarity(context["mode"], embedder, context.get("bm25")))[0]
+    for key in ("cluster_id", "cluster_size"):
+        if key in match:
+            result[key] = match[key]
+    try:
+        save_match_detail(output_dir, result)
+    except Exception as exc:
+        log_message(config["paths"]["logs_dir"], "match_score", f"Saving expanded match {result.get('id')} failed ({exc}).")
+    return result
+
+
+def _write_ranked_outputs(output_dir, results, suggestions, assessment, config):
+    matches_path = os.path.join(output_dir, "matched_jobs.json")
+    with file_lock(matches_path):
+        _write_ranked_files(output_dir, results, suggestions, assessment, config)
+
+
+def _write_ranked_files(output_dir, results, suggestions, assessment, config):
+    matches_path = os.path.join(output_dir, "matched_jobs.json")
+    write_json(suggestions, os.path.join(output_dir, "job_suggestions.json"))
+    write_json(assessment, os.path.join(output_dir, "skill_assessment.json"))
+    settings = match_index_settings(config)
+    if not settings["enabled"]:
+        write_json(results, matches_path)
+        if os.path.exists(match_index_path(output_dir)):
+            os.remove(match_index_path(output_dir))
+        return
+    try:
+        shards = write_match_index(output_dir, results, settings["shard_size"], settings["preview_chars"])
+        log_message(
+            config["paths"]["logs_dir"],
+            "match_score",
+            f"Wrote match index with {len(results)} entries and {shards} detail shards",
+        )
+    except Exception as exc:
+        log_message(config["paths"]["logs_dir"], "match_score", f"Match index write failed ({exc}).")
+        write_json(results, matches_path)
+        return
+    # matched_jobs.json duplicates the shards; it is kept by default for
+    # tools that read it directly and can be switched off with write_full.
+    if settings["write_full"]:
+        write_json(results, matches_path)
+    elif os.path.exists(matches_path):
+        os.remove(matches_path)
+
+
+def _coerce_float(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def reweight_features(rows, config, weights=None, thresholds=None, preset_name=None, feedback_enabled=None):
+    preset = _resolve_scoring_preset(config, preset_name=preset_name)
+    merged = _merge_weights(preset["weights"], weights or {})
+    preset = {
+        "name": preset["name"],
+        "weights": {key: _coerce_float(value, 0.0) for key, value in merged.items()},
+        "apply_threshold": _coerce_float((thresholds or {}).get("apply"), preset["apply_threshold"]),
+        "consider_threshold": _coerce_float((thresholds or {}).get("consider"), preset["consider_threshold"]),
+    }
+    if feedback_enabled is None:
+        feedback_enabled = (config.get("matching", {}).get("feedback", {}) or {}).get("enabled", False)
+    ranked = []
+    not_analysed = []
+    for row in rows:
+        if row.get("pruned"):
+            not_analysed.append({"id": row.get("job_id"), "upper_bound": row.get("upper_bound")})
+            continue
+        components = {key: row.get(key, 0.0) for key in SCORE_COMPONENTS}
+        view = _preset_view(
+            components,
+            preset,
+            row.get("intent_adjustment", 0.0),
+            row.get("feedback_adjustment", 0.0),
+            row.get("sales_guard", False),
+            row.get("role_intent") or "",
+            set(row.get("job_intent_tags") or []),
+        )
+        ranked.append(
+            {
+                "id": row.get("job_id"),
+                "score": view["score_adjusted"] if feedback_enabled else view["score_intent_adjusted"],
+                "score_preset": view["score_preset"],
+                "recommendation": view["recommendation_feedback"] if feedback_enabled else view["recommendation"],
+                "out_of_scope": view["out_of_scope_feedback"] if feedback_enabled else view["out_of_scope"],
+            }
+        )
+    ranked.sort(key=_rank_key)
+    for idx, item in enumerate(ranked):
+        item["rank"] = idx + 1
+    return {
+        "preset": preset["name"],
+        "weights": preset["weights"],
+        "thresholds": {"apply": preset["apply_threshold"], "consider": preset["consider_threshold"]},
+        "feedback_enabled": bool(feedback_enabled),
+        "results": ranked,
+        "not_analysed": not_analysed,
+    }
+
+
+def reweight_matches(config_path="config/applicant.yaml", weights=None, thresholds=None, preset_name=None, feedback_enabled=None):
+    config = load_config(config_path)
+    rows = load_features(feature_store_path(config))
+    if not rows:
+        return None
+    return reweight_features(
+        rows,
+        config,
+        weights=weights,
+        thresholds=thresholds,
+        preset_name=preset_name,
+        feedback_enabled=feedback_enabled,
+    )
+
+
+def rerank_matches(config_path="config/applicant.yaml", preset_name=None, feedback_enabled=None):
+    config = load_config(config_path)
+    output_dir = config["paths"]["output_dir"]
+    logs_dir = config["paths"]["logs_dir"]
+    if not matches_available(output_dir):
+        return None
+    preset_key = _resolve_scoring_preset(config, preset_name=preset_name)["name"]
+    if feedback_enabled is None:
+        feedback_enabled = (config.get("matching", {}).get("feedback", {}) or {}).get("enabled", False)
+    results = rerank_results(load_matches(output_dir), preset_key, feedback_enabled=feedback_enabled)
+    if results is None:
+        return None
+
+    profile_path = os.path.join(output_dir, "rob_profile.json")
+    profile = read_json(profile_path) if os.path.exists(profile_path) else {}
+    suggestions = _build_suggestions(results, config.get("matching", {}).get("top_n", 5))
+    assessment = _summarize_skill_assessment(results, profile)
+    _write_ranked_outputs(output_dir, results, suggestions, assessment, config)
+    log_message(logs_dir, "match_score", f"Re-ranked {len(results)} jobs for preset '{preset_key}' without rescoring")
+    return results
+
+
 if __name__ == "__main__":
     match_score()
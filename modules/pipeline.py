@@ -4,8 +4,10 @@ from modules.extract_profile import extract_profile
 from modules.crawl_jobs import crawl_jobs
 from modules.match_score import match_score
 from modules.generate_app import generate_app
+from utils.tracing import traced_run
 
 
+@traced_run("pipeline")
 def run_pipeline(config_path="config/applicant.yaml"):
     config = load_config(config_path)
     output_dir = config["paths"]["output_dir"]
@@ -3,7 +3,7 @@ import smtplib
 from datetime import datetime
 from email.message import EmailMessage
 
-from utils.io import read_json, write_json, ensure_dir, log_message
+from utils.io import read_json, write_json, ensure_dir, log_message, file_lock
 
 
 def _application_dir(output_dir):
@@ -119,17 +119,18 @@ def record_submission(app, config, record, submitted=False, draft_created=False)
 
     app_path = app.get("_path")
     if app_path and os.path.exists(app_path):
-        current = read_json(app_path)
-        history = current.get("submission_history") or []
-        history.append(record)
-        current["submission_history"] = history
-        current["last_submission"] = record
-        if draft_created:
-            current["draft_created"] = True
-        if submitted:
-            current["submitted"] = True
-            current["submitted_at"] = record["recorded_at"]
-        write_json(current, app_path)
+        with file_lock(app_path):
+            current = read_json(app_path)
+            history = current.get("submission_history") or []
+            history.append(record)
+            current["submission_history"] = history
+            current["last_submission"] = record
+            if draft_created:
+                current["draft_created"] = True
+            if submitted:
+                current["submitted"] = True
+                current["submitted_at"] = record["recorded_at"]
+            write_json(current, app_path)
 
     log_message(logs_dir, "submission_agent", f"Recorded submission for job {record.get('job_id')}")
     return log_path
@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, REPO_ROOT)
+
+from utils.io import ensure_dir, write_json  # noqa: E402
+from utils.parser import _docx_to_text_regex, docx_to_text  # noqa: E402
+
+
+WORD_NS_URI = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _run(text):
+    return f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def write_synthetic_docx(path, paragraphs=5000, table_rows=2000):
+    body = []
+    for idx in range(paragraphs):
+        body.append(
+            "<w:p><w:pPr><w:pStyle w:val=\"Normal\"/></w:pPr>"
+            + _run(f"Paragraph {idx} covers Python, cloud security &amp; stakeholder management. ")
+            + f'<w:ins w:id="{idx}" w:author="Reviewer">{_run("Inserted governance roadmap.")}</w:ins>'
+            + f'<w:del w:id="d{idx}" w:author="Reviewer"><w:r><w:delText>Removed sentence.</w:delText></w:r></w:del>'
+            + "</w:p>"
+        )
+    rows = []
+    for idx in range(table_rows):
+        cells = "".join(f"<w:tc><w:p>{_run(f'Row {idx} cell {col}')}</w:p></w:tc>" for col in range(4))
+        rows.append(f"<w:tr>{cells}</w:tr>")
+    body.append(f"<w:tbl>{''.join(rows)}</w:tbl>")
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{WORD_NS_URI}"><w:body>{"".join(body)}</w:body></w:document>'
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("word/document.xml", xml)
+    return path
+
+
+def _measure(extractor, path, repeat):
+    tracemalloc.start()
+    text = extractor(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extractor(path)
+    total = time.perf_counter() - start
+    return {
+        "per_file_ms": round(total / repeat * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "chars": len(text),
+    }, text
+
+
+def benchmark_docx_extraction(paths, repeat=5, output=None):
+    results = []
+    for path in paths:
+        regex, regex_text = _measure(_docx_to_text_regex, path, repeat)
+        streaming, streaming_text = _measure(docx_to_text, path, repeat)
+        speedup = round(regex["per_file_ms"] / streaming["per_file_ms"], 2) if streaming["per_file_ms"] else 0.0
+        results.append(
+            {
+                "path": path,
+                "bytes": os.path.getsize(path),
+                "regex": regex,
+                "streaming": streaming,
+                "speedup": speedup,
+                "identical_output": regex_text == streaming_text,
+            }
+        )
+    payload = {"repeat": repeat, "results": results}
+    if output:
+        ensure_dir(os.path.dirname(output))
+        write_json(payload, output)
+        print(f"Wrote benchmark to {output}")
+    else:
+        print(json.dumps(payload, indent=2))
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming DOCX extraction against the regex-over-XML path.")
+    parser.add_argument("--docx", nargs="*", default=[], help="DOCX files to measure; a synthetic document is generated if omitted.")
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--table-rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = args.docx or [
+            write_synthetic_docx(os.path.join(tmpdir, "synthetic.docx"), paragraphs=args.paragraphs, table_rows=args.table_rows)
+        ]
+        benchmark_docx_extraction(paths, repeat=max(1, args.repeat), output=args.output or None)
+
+
+if __name__ == "__main__":
+    main()
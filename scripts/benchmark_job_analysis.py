@@ -0,0 +1,81 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, REPO_ROOT)
+
+from modules import extract_profile as profile_module  # noqa: E402
+from modules.match_score import _build_job_analysis, _job_text, _skill_vocabulary  # noqa: E402
+from utils.io import load_config, read_json, write_json, ensure_dir  # noqa: E402
+
+
+def _reset_indexes():
+    profile_module._TAXONOMY_HITS.clear()
+    profile_module._SKILL_MATCHERS.clear()
+    profile_module._SKILL_PATTERNS.clear()
+
+
+def _run(texts, config, repeat, reuse_indexes):
+    timings = []
+    outputs = []
+    vocabulary = _skill_vocabulary({}, config)
+    _reset_indexes()
+    for _ in range(repeat):
+        for text in texts:
+            if not reuse_indexes:
+                _reset_indexes()
+            start = time.perf_counter()
+            outputs.append(_build_job_analysis(text, config, vocabulary=vocabulary))
+            timings.append(time.perf_counter() - start)
+    total = sum(timings)
+    return {
+        "runs": len(timings),
+        "total_s": round(total, 4),
+        "per_job_ms": round(total / len(timings) * 1000, 3) if timings else 0.0,
+    }, outputs
+
+
+def benchmark_job_analysis(config_path, jobs_path=None, repeat=20, output=None):
+    config = load_config(config_path)
+    jobs_path = jobs_path or os.path.join(config["paths"]["jobs_dir"], "latest_jobs.json")
+    jobs = read_json(jobs_path)
+    texts = [_job_text(job) for job in jobs if isinstance(job, dict)]
+    cold, cold_outputs = _run(texts, config, repeat, reuse_indexes=False)
+    warm, warm_outputs = _run(texts, config, repeat, reuse_indexes=True)
+    savings = 0.0
+    if cold["per_job_ms"]:
+        savings = round((cold["per_job_ms"] - warm["per_job_ms"]) / cold["per_job_ms"] * 100, 2)
+    payload = {
+        "jobs_path": jobs_path,
+        "jobs": len(texts),
+        "repeat": repeat,
+        "rebuild_per_job": cold,
+        "shared_indexes": warm,
+        "per_job_savings_pct": savings,
+        "identical_output": cold_outputs == warm_outputs,
+    }
+    if output:
+        ensure_dir(os.path.dirname(output))
+        write_json(payload, output)
+        print(f"Wrote benchmark to {output}")
+    else:
+        print(json.dumps(payload, indent=2))
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-job skill analysis with shared matcher and taxonomy indexes.")
+    parser.add_argument("--config", default="tests/fixtures/config/applicant.yaml")
+    parser.add_argument("--jobs", default="tests/fixtures/data/jobs/sample_jobs.json")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    benchmark_job_analysis(args.config, jobs_path=args.jobs or None, repeat=max(1, args.repeat), output=args.output or None)
+
+
+if __name__ == "__main__":
+    main()
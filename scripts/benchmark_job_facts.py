@@ -0,0 +1,75 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, REPO_ROOT)
+
+from modules.match_score import _extract_job_facts, _job_intent_tags, _sales_guard_hit, _scan_job  # noqa: E402
+from utils.io import load_config, read_json, write_json, ensure_dir  # noqa: E402
+
+
+def _multi_pass(job):
+    return {
+        "intent_tags": _job_intent_tags(job),
+        "sales_guard": _sales_guard_hit(job.get("title", "")),
+        "job_facts": _extract_job_facts(job),
+    }
+
+
+def _run(jobs, repeat, extractor):
+    outputs = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        outputs = [extractor(job) for job in jobs]
+    total = time.perf_counter() - start
+    runs = len(jobs) * repeat
+    return {
+        "runs": runs,
+        "total_s": round(total, 4),
+        "per_job_ms": round(total / runs * 1000, 4) if runs else 0.0,
+    }, outputs
+
+
+def benchmark_job_facts(config_path, jobs_path=None, repeat=20, output=None):
+    config = load_config(config_path)
+    jobs_path = jobs_path or os.path.join(config["paths"]["jobs_dir"], "latest_jobs.json")
+    jobs = [job for job in read_json(jobs_path) if isinstance(job, dict)]
+    multi, multi_outputs = _run(jobs, repeat, _multi_pass)
+    single, single_outputs = _run(jobs, repeat, _scan_job)
+    savings = 0.0
+    if multi["per_job_ms"]:
+        savings = round((multi["per_job_ms"] - single["per_job_ms"]) / multi["per_job_ms"] * 100, 2)
+    payload = {
+        "jobs_path": jobs_path,
+        "jobs": len(jobs),
+        "repeat": repeat,
+        "multi_pass": multi,
+        "single_pass": single,
+        "per_job_savings_pct": savings,
+        "identical_output": multi_outputs == single_outputs,
+    }
+    if output:
+        ensure_dir(os.path.dirname(output))
+        write_json(payload, output)
+        print(f"Wrote benchmark to {output}")
+    else:
+        print(json.dumps(payload, indent=2))
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass job fact and intent extractor against per-detector scans.")
+    parser.add_argument("--config", default="tests/fixtures/config/applicant.yaml")
+    parser.add_argument("--jobs", default="tests/fixtures/data/jobs/sample_jobs.json")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    benchmark_job_facts(args.config, jobs_path=args.jobs or None, repeat=max(1, args.repeat), output=args.output or None)
+
+
+if __name__ == "__main__":
+    main()
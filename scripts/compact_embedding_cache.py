@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, REPO_ROOT)
+
+from utils.io import load_config, log_message  # noqa: E402
+from utils.vectorizer import EmbeddingStore  # noqa: E402
+
+
+def compact_embedding_cache(config_path, max_entries=None, ttl_days=None):
+    config = load_config(config_path)
+    semantic_cfg = config.get("matching", {}).get("semantic", {}) or {}
+    cache_path = semantic_cfg.get("cache_path")
+    if not cache_path:
+        print("No matching.semantic.cache_path configured; nothing to compact.")
+        return None
+    store = EmbeddingStore(
+        cache_path,
+        max_entries=semantic_cfg.get("cache_max_entries", 0) if max_entries is None else max_entries,
+        ttl_days=semantic_cfg.get("cache_ttl_days", 0) if ttl_days is None else ttl_days,
+        import_legacy=False,
+    )
+    before = len(store)
+    result = store.compact()
+    store.close()
+    summary = {"cache_path": store.base, "entries_before": before, "evicted": store.evicted, **result}
+    log_message(
+        config["paths"]["logs_dir"],
+        "compact_embedding_cache",
+        f"Compacted embedding cache: {summary['entries']} kept, {store.evicted} evicted, {summary['reclaimed_bytes']} bytes reclaimed.",
+    )
+    print(json.dumps(summary, indent=2))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evict and compact the binary embedding cache.")
+    parser.add_argument("--config", default="config/applicant.yaml")
+    parser.add_argument("--max-entries", type=int, default=None)
+    parser.add_argument("--ttl-days", type=float, default=None)
+    args = parser.parse_args()
+
+    compact_embedding_cache(args.config, max_entries=args.max_entries, ttl_days=args.ttl_days)
+
+
+if __name__ == "__main__":
+    main()
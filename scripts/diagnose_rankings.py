@@ -9,7 +9,7 @@ sys.path.insert(0, REPO_ROOT)
 
 from modules.extract_profile import extract_profile  # noqa: E402
 from modules.crawl_jobs import crawl_jobs  # noqa: E402
-from modules.match_score import match_score  # noqa: E402
+from modules.match_score import match_score, rerank_results, _resolve_scoring_preset  # noqa: E402
 from utils.io import load_config, write_json, ensure_dir  # noqa: E402
 
 
@@ -184,10 +184,12 @@ def diagnose_rankings(config_path, preset_name=None, output=None, fmt="json", ov
     extract_profile(run_config_path)
     crawl_jobs(run_config_path)
     preset_name = preset_name or (config.get("scoring", {}) or {}).get("active_preset")
+    preset_key = _resolve_scoring_preset(config, preset_name=preset_name)["name"]
 
-    raw_results = match_score(run_config_path, write_outputs=False, feedback_enabled=False, preset_name="")
-    preset_results = match_score(run_config_path, write_outputs=False, feedback_enabled=False, preset_name=preset_name)
-    feedback_results = match_score(run_config_path, write_outputs=False, feedback_enabled=True, preset_name=preset_name)
+    results = match_score(run_config_path, write_outputs=False, feedback_enabled=False, preset_name=preset_name)
+    raw_results = rerank_results(results, "", feedback_enabled=False)
+    preset_results = rerank_results(results, preset_key, feedback_enabled=False)
+    feedback_results = rerank_results(results, preset_key, feedback_enabled=True)
 
     rows = _build_report(raw_results, preset_results, feedback_results)
     output_payload = {
@@ -1,20 +1,21 @@
 import json
 import os
-import re
 import sys
-import zipfile
+import threading
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from urllib.parse import urlparse
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
 
 REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
 sys.path.insert(0, REPO_ROOT)
 
-from utils.io import load_config, read_json, write_json, ensure_dir, log_message  # noqa: E402
+from utils.io import load_config, read_json, write_json, ensure_dir, log_message, file_lock  # noqa: E402
 from utils.db import init_db, load_votes as db_load_votes, upsert_vote, db_enabled  # noqa: E402
+from utils.match_index import load_match_detail, load_match_index, load_matches, matches_available  # noqa: E402
+from utils.parser import docx_to_text  # noqa: E402
 from utils.feedback import load_feedback, record_outcome, latest_outcomes_by_job, build_feedback_tags  # noqa: E402
 from modules.crawl_jobs import crawl_jobs, _derive_job_filters, _merge_filters  # noqa: E402
-from modules.match_score import match_score  # noqa: E402
+from modules.match_score import match_score, rerank_matches, reweight_matches, expand_pruned_match  # noqa: E402
 from modules.pipeline import run_pipeline  # noqa: E402
 from modules.submission_agent import load_applications, submit_application  # noqa: E402
 
@@ -28,6 +29,8 @@ PIPELINE_OUTPUTS = (
     "job_collection_summary.json",
     "derived_job_filters.json",
 )
+JOB_ENDPOINTS = {"/api/crawl", "/api/score"}
+_JOB_LOCK = threading.Lock()
 
 
 def _load_votes(config, path):
@@ -73,12 +76,7 @@ def _save_template_overrides(output_dir, overrides):
 
 def _docx_to_text(path):
     try:
-        with zipfile.ZipFile(path) as z:
-            xml = z.read("word/document.xml").decode("utf-8", errors="ignore")
-        xml = re.sub(r"</w:p>", "\n", xml)
-        text = re.sub(r"<[^>]+>", "", xml)
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        return text.strip()
+        return docx_to_text(path)
     except Exception:
         return ""
 
@@ -111,7 +109,10 @@ def _load_committee_votes(path):
 
 
 def _pipeline_outputs_ready(output_dir):
-    return all(os.path.exists(os.path.join(output_dir, name)) for name in PIPELINE_OUTPUTS)
+    return all(
+        matches_available(output_dir) if name == "matched_jobs.json" else os.path.exists(os.path.join(output_dir, name))
+        for name in PIPELINE_OUTPUTS
+    )
 
 
 def _ensure_pipeline_outputs(config, config_path):
@@ -165,9 +166,11 @@ def _summarize_application(app, output_dir):
 
 def _build_ui_snapshot(config):
     output_dir = config["paths"]["output_dir"]
-    matches_path = os.path.join(output_dir, "matched_jobs.json")
     votes_path = os.path.join(output_dir, "review_votes.json")
-    matches = _load_optional_json(matches_path, [])
+    try:
+        matches = load_matches(output_dir)
+    except Exception:
+        matches = []
     votes = _load_votes(config, votes_path)
 
     region_keywords = config.get("matching", {}).get("region_keywords", []) or []
@@ -234,10 +237,13 @@ class ReviewHandler(SimpleHTTPRequestHandler):
         if parsed.path == "/api/matches":
             config = load_config("config/applicant.yaml")
             output_dir = config["paths"]["output_dir"]
-            matches_path = os.path.join(output_dir, "matched_jobs.json")
             votes_path = os.path.join(output_dir, "review_votes.json")
 
-            matches = read_json(matches_path) if os.path.exists(matches_path) else []
+            index = load_match_index(output_dir)
+            if index is not None:
+                matches = index["matches"]
+            else:
+                matches = load_matches(output_dir)
             votes = _load_votes(config, votes_path)
 
             for match in matches:
@@ -245,6 +251,22 @@ class ReviewHandler(SimpleHTTPRequestHandler):
 
             return self._send_json({"matches": matches})
 
+        if parsed.path.startswith("/api/matches/"):
+            config = load_config("config/applicant.yaml")
+            output_dir = config["paths"]["output_dir"]
+            job_id = unquote(parsed.path[len("/api/matches/") :])
+            match = load_match_detail(output_dir, job_id) if job_id else None
+            if match is None:
+                return self._send_json({"error": "match not found"}, status=404)
+            if match.get("pruned"):
+                try:
+                    match = expand_pruned_match(config, match)
+                except Exception as exc:
+                    log_message(config["paths"]["logs_dir"], "serve_web", f"Full analysis for pruned match {job_id} failed ({exc}).")
+            votes = _load_votes(config, os.path.join(output_dir, "review_votes.json"))
+            match["decision"] = votes.get(str(match.get("id")), {})
+            return self._send_json({"match": match})
+
         if parsed.path == "/api/insights":
             config = load_config("config/applicant.yaml")
             output_dir = config["paths"]["output_dir"]
@@ -364,6 +386,16 @@ class ReviewHandler(SimpleHTTPRequestHandler):
 
     def do_POST(self):
         parsed = urlparse(self.path)
+        if parsed.path in JOB_ENDPOINTS:
+            if not _JOB_LOCK.acquire(blocking=False):
+                return self._send_json({"error": "a crawl or scoring run is already in progress"}, status=409)
+            try:
+                return self._handle_post(parsed)
+            finally:
+                _JOB_LOCK.release()
+        return self._handle_post(parsed)
+
+    def _handle_post(self, parsed):
         if parsed.path == "/api/crawl":
             crawl_jobs("config/applicant.yaml")
             config = load_config("config/applicant.yaml")
@@ -382,13 +414,41 @@ class ReviewHandler(SimpleHTTPRequestHandler):
                     return self._send_json({"error": "invalid json"}, status=400)
             feedback_enabled = payload.get("feedback_enabled")
             preset_name = payload.get("preset")
-            match_score("config/applicant.yaml", feedback_enabled=feedback_enabled, preset_name=preset_name)
+            reranked = None
+            if payload.get("rerank"):
+                reranked = rerank_matches("config/applicant.yaml", preset_name=preset_name, feedback_enabled=feedback_enabled)
+            if reranked is None:
+                match_score("config/applicant.yaml", feedback_enabled=feedback_enabled, preset_name=preset_name)
             config = load_config("config/applicant.yaml")
             output_dir = config["paths"]["output_dir"]
             suggestions = _load_optional_json(os.path.join(output_dir, "job_suggestions.json"), [])
             assessment = _load_optional_json(os.path.join(output_dir, "skill_assessment.json"), {})
             return self._send_json({"ok": True, "suggestions": suggestions, "assessment": assessment})
 
+        if parsed.path == "/api/reweight":
+            length = int(self.headers.get("Content-Length", "0"))
+            raw = self.rfile.read(length) if length else b"{}"
+            payload = {}
+            if raw.strip():
+                try:
+                    payload = json.loads(raw.decode("utf-8"))
+                except json.JSONDecodeError:
+                    return self._send_json({"error": "invalid json"}, status=400)
+            weights = payload.get("weights") or {}
+            thresholds = payload.get("thresholds") or {}
+            if not isinstance(weights, dict) or not isinstance(thresholds, dict):
+                return self._send_json({"error": "weights and thresholds must be objects"}, status=400)
+            reweighted = reweight_matches(
+                "config/applicant.yaml",
+                weights=weights,
+                thresholds=thresholds,
+                preset_name=payload.get("preset"),
+                feedback_enabled=payload.get("feedback_enabled"),
+            )
+            if reweighted is None:
+                return self._send_json({"error": "feature store missing; run scoring first"}, status=404)
+            return self._send_json({"ok": True, **reweighted})
+
         if parsed.path == "/api/template":
             length = int(self.headers.get("Content-Length", "0"))
             raw = self.rfile.read(length) if length else b"{}"
@@ -407,13 +467,14 @@ class ReviewHandler(SimpleHTTPRequestHandler):
 
             config = load_config("config/applicant.yaml")
             output_dir = config["paths"]["output_dir"]
-            overrides = _load_template_overrides(output_dir)
-            key = str(job_id)
-            if role_family:
-                overrides[key] = role_family
-            else:
-                overrides.pop(key, None)
-            _save_template_overrides(output_dir, overrides)
+            with file_lock(_template_overrides_path(output_dir)):
+                overrides = _load_template_overrides(output_dir)
+                key = str(job_id)
+                if role_family:
+                    overrides[key] = role_family
+                else:
+                    overrides.pop(key, None)
+                _save_template_overrides(output_dir, overrides)
             return self._send_json({"ok": True, "template_overrides": overrides})
 
         if parsed.path == "/api/submit":
@@ -502,9 +563,7 @@ class ReviewHandler(SimpleHTTPRequestHandler):
 
             config = load_config("config/applicant.yaml")
             output_dir = config["paths"]["output_dir"]
-            matches_path = os.path.join(output_dir, "matched_jobs.json")
-            matches = read_json(matches_path) if os.path.exists(matches_path) else []
-            match = next((row for row in matches if str(row.get("id")) == str(job_id)), None)
+            match = load_match_detail(output_dir, job_id)
             if not match:
                 return self._send_json({"error": "job not found"}, status=404)
             apps = load_applications(output_dir)
@@ -514,18 +573,19 @@ class ReviewHandler(SimpleHTTPRequestHandler):
             job_facts = match.get("job_facts") or {}
             tags = build_feedback_tags(job, job_facts)
             feedback_path = _feedback_path(config)
-            entry = record_outcome(
-                feedback_path,
-                str(job_id),
-                outcome,
-                tags,
-                job_meta={
-                    "title": job.get("title"),
-                    "company": job.get("company"),
-                    "location": job.get("location"),
-                },
-                note=note,
-            )
+            with file_lock(feedback_path):
+                entry = record_outcome(
+                    feedback_path,
+                    str(job_id),
+                    outcome,
+                    tags,
+                    job_meta={
+                        "title": job.get("title"),
+                        "company": job.get("company"),
+                        "location": job.get("location"),
+                    },
+                    note=note,
+                )
             return self._send_json({"ok": True, "entry": entry})
 
         if parsed.path == "/api/vote":
@@ -547,19 +607,20 @@ class ReviewHandler(SimpleHTTPRequestHandler):
             ensure_dir(output_dir)
             votes_path = os.path.join(output_dir, "review_votes.json")
 
-            if db_enabled(config):
-                updated_at = upsert_vote(config, job_id, vote, note)
-                votes = _load_votes(config, votes_path)
-                votes[job_id] = {"vote": vote, "note": note, "updated_at": updated_at}
-                write_json(votes, votes_path)
-            else:
-                votes = _load_votes(config, votes_path)
-                votes[job_id] = {
-                    "vote": vote,
-                    "note": note,
-                    "updated_at": datetime.utcnow().isoformat() + "Z",
-                }
-                write_json(votes, votes_path)
+            with file_lock(votes_path):
+                if db_enabled(config):
+                    updated_at = upsert_vote(config, job_id, vote, note)
+                    votes = _load_votes(config, votes_path)
+                    votes[job_id] = {"vote": vote, "note": note, "updated_at": updated_at}
+                    write_json(votes, votes_path)
+                else:
+                    votes = _load_votes(config, votes_path)
+                    votes[job_id] = {
+                        "vote": vote,
+                        "note": note,
+                        "updated_at": datetime.utcnow().isoformat() + "Z",
+                    }
+                    write_json(votes, votes_path)
             return self._send_json({"ok": True, "job_id": job_id})
 
         if parsed.path == "/api/committee":
@@ -589,23 +650,31 @@ class ReviewHandler(SimpleHTTPRequestHandler):
             config = load_config("config/applicant.yaml")
             output_dir = config["paths"]["output_dir"]
             votes_path = os.path.join(output_dir, "committee_votes.json")
-            votes = _load_committee_votes(votes_path)
-
-            if scope == "profile":
-                votes["profile"].setdefault(kind, {})
-                votes["profile"][kind][item_id] = decision
-            else:
-                job_key = str(job_id)
-                votes["jobs"].setdefault(job_key, {})
-                votes["jobs"][job_key].setdefault(kind, {})
-                votes["jobs"][job_key][kind][item_id] = decision
+            with file_lock(votes_path):
+                votes = _load_committee_votes(votes_path)
+
+                if scope == "profile":
+                    votes["profile"].setdefault(kind, {})
+                    votes["profile"][kind][item_id] = decision
+                else:
+                    job_key = str(job_id)
+                    votes["jobs"].setdefault(job_key, {})
+                    votes["jobs"][job_key].setdefault(kind, {})
+                    votes["jobs"][job_key][kind][item_id] = decision
 
-            write_json(votes, votes_path)
+                write_json(votes, votes_path)
             return self._send_json({"ok": True})
 
         return self._send_json({"error": "not found"}, status=404)
 
 
+def make_server(host, port, web_dir):
+    handler = lambda *args, **kwargs: ReviewHandler(*args, directory=web_dir, **kwargs)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
 def main():
     config_path = "config/applicant.yaml"
     config = load_config(config_path)
@@ -618,8 +687,7 @@ def main():
     if db_enabled(config):
         init_db(config)
 
-    handler = lambda *args, **kwargs: ReviewHandler(*args, directory=web_dir, **kwargs)
-    server = HTTPServer((host, port), handler)
+    server = make_server(host, port, web_dir)
     print(f"Review UI running at http://{host}:{port}")
     server.serve_forever()
 
@@ -6,6 +6,7 @@ REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
 sys.path.insert(0, REPO_ROOT)
 
 from utils.io import load_config, read_json  # noqa: E402
+from utils.match_index import load_matches, matches_available  # noqa: E402
 
 
 def _load_json(path):
@@ -61,11 +62,13 @@ def _validate_feedback(feedback_path):
 def _emit_feedback_deltas(output_dir, outcomes):
     if not outcomes:
         return
-    matched_path = os.path.join(output_dir, "matched_jobs.json")
-    if not os.path.exists(matched_path):
+    if not matches_available(output_dir):
         return
-    matched, err = _load_json(matched_path)
-    if err or not isinstance(matched, list):
+    try:
+        matched = load_matches(output_dir)
+    except Exception:
+        return
+    if not isinstance(matched, list):
         return
     score_map = {}
     for row in matched:
@@ -0,0 +1,36 @@
+import unittest
+
+from scripts.benchmark_pipeline import compare_to_baseline, generate_feedback, generate_jobs, run_size
+from utils.io import read_json
+
+CONFIG_PATH = "tests/fixtures/config/applicant.yaml"
+JOBS_PATH = "tests/fixtures/data/jobs/sample_jobs.json"
+
+
+class BenchmarkPipelineTests(unittest.TestCase):
+    def test_synthetic_corpus_is_deterministic(self):
+        templates = read_json(JOBS_PATH)
+        jobs = generate_jobs(300, templates, seed=7)
+        self.assertEqual(jobs, generate_jobs(300, templates, seed=7))
+        self.assertNotEqual(jobs, generate_jobs(300, templates, seed=8))
+        self.assertEqual(len(jobs), 300)
+        self.assertLess(len({job["id"] for job in jobs}), 300)
+        feedback = generate_feedback(jobs, 25, seed=7)
+        self.assertEqual(len(feedback["outcomes"]), 25)
+        self.assertTrue(all(row["tags"] for row in feedback["outcomes"]))
+
+    def test_run_size_reports_stages_and_flags_regressions(self):
+        row = run_size(CONFIG_PATH, 40, drafts=3, feedback_outcomes=10)
+        self.assertEqual(set(row["stages"]), {"crawl_jobs", "match_score", "cluster_texts", "generate_app"})
+        self.assertEqual(row["stages"]["crawl_jobs"]["items"], 40)
+        self.assertEqual(row["stages"]["generate_app"]["items"], 3)
+        self.assertTrue(any(entry["path"] == "benchmark/match_score/score" for entry in row["spans"]))
+
+        baseline = {"results": [dict(row, wall_s=row["wall_s"] / 2, stages={})]}
+        comparison = compare_to_baseline({"results": [row]}, baseline, tolerance=0.2)
+        self.assertEqual([item["metric"] for item in comparison["regressions"]], ["wall_s"])
+        self.assertEqual(compare_to_baseline({"results": [row]}, {"results": [row]})["regressions"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
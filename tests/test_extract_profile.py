@@ -0,0 +1,140 @@
+import copy
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from modules import extract_profile as extract_profile_module
+from modules.extract_profile import (
+    SkillMatcher,
+    _build_skill_weighting,
+    _case_safe,
+    _extract_skills,
+    _skill_match_pattern,
+    extract_profile,
+)
+from utils.io import load_config, write_json
+
+SKILLS = ["Python", "AI", "C++", "Cloud", "Cloud Security", "Security", "Stakeholder Management"]
+TEXTS = [
+    "Python and AI work. python, PYTHON; ai-driven Cloud Security for Cloud teams.",
+    "Literal \\bPython\\b and \\bai\\b markers, C++ and c++ but not Cplusplus.",
+    "Sicherheit für Ölbranche: Cloud Security, Stakeholder Management und Größe.",
+    "ſecurity and İstanbul trigger the slow path: SECURITY security",
+    "",
+]
+
+
+class SkillMatcherTests(unittest.TestCase):
+    def test_bounded_scan_matches_per_skill_search(self):
+        matcher = SkillMatcher(SKILLS, bounded=True)
+        for text in TEXTS:
+            first_hits, counts = matcher.scan(text)
+            for skill in SKILLS:
+                matches = list(re.finditer(rf"\b{re.escape(skill)}\b", text, re.IGNORECASE))
+                self.assertEqual(first_hits.get(skill), matches[0].start() if matches else None)
+                self.assertEqual(counts.get(skill, 0), len(matches))
+
+    def test_mention_counts_match_findall(self):
+        matcher = SkillMatcher(SKILLS, bounded=False)
+        for text in TEXTS:
+            counts = matcher.counts(text)
+            for skill in SKILLS:
+                self.assertEqual(counts.get(skill, 0), len(_skill_match_pattern(skill).findall(text)))
+
+    def test_alphanumeric_skills_count_whole_words(self):
+        counts = SkillMatcher(["Python", "AI", "C++"], bounded=False).counts("Python, python; Pythonic cpython AI-driven, ai, mail, C++")
+        self.assertEqual(counts, {"Python": 2, "AI": 2, "C++": 1})
+
+    def test_case_irregular_characters_use_per_skill_patterns(self):
+        self.assertTrue(_case_safe(set("Ölbranche café für")))
+        for char in ["\u00df", "\u017f", "\u212a", "\u0130", "\u03c2", "\u00b5"]:
+            self.assertFalse(_case_safe({char}))
+
+    def test_job_weighting_shares_one_matcher_per_vocabulary(self):
+        vocabulary = tuple(SKILLS + ["Rust"])
+        config = {"skills_seed": {"hard": ["Python"]}, "profile": {"committee": {"min_score": 2}}}
+        jobs = [
+            ({"hard_skills": ["Python", "Cloud Security"], "soft_skills": [], "evidence": {}}, TEXTS[0]),
+            ({"hard_skills": ["C++", "Kotlin"], "soft_skills": ["Stakeholder Management"], "evidence": {}}, TEXTS[1] + " Kotlin"),
+        ]
+        extract_profile_module._SKILL_MATCHERS.clear()
+        for profile, text in jobs:
+            shared = _build_skill_weighting(profile, text, config, vocabulary=vocabulary)
+            self.assertEqual(shared, _build_skill_weighting(profile, text, config))
+        self.assertIn((False, vocabulary), extract_profile_module._SKILL_MATCHERS)
+        by_skill = {entry["skill"]: entry for entry in shared["entries"]}
+        self.assertEqual(by_skill["Kotlin"]["mentions"], 1)
+
+    def test_extract_skills_keeps_seed_order_evidence(self):
+        seed = {"hard": ["Cloud Security", "Python", "Rust"], "soft": ["Stakeholder Management", "Python"]}
+        hard, soft, evidence = _extract_skills(TEXTS[0] + " Stakeholder Management", seed)
+        self.assertEqual(hard, ["Cloud Security", "Python"])
+        self.assertEqual(soft, ["Python", "Stakeholder Management"])
+        self.assertEqual(list(evidence), ["Cloud Security", "Python", "Stakeholder Management"])
+
+    def test_skill_weighting_scans_corpus_once(self):
+        text = "Profile\nSkills\nPython, Cloud Security, C++\nExperience\n" + " ".join(TEXTS)
+        profile = {"hard_skills": ["Python", "C++", "Cloud Security"], "soft_skills": ["Stakeholder Management"], "evidence": {}}
+        config = {"skills_seed": {"hard": ["Python"]}, "profile": {"committee": {"min_score": 2}}}
+        with mock.patch.object(SkillMatcher, "scan", autospec=True, side_effect=SkillMatcher.scan) as scan:
+            weighting = _build_skill_weighting(profile, text, config)
+        self.assertEqual(scan.call_count, 2)
+        by_skill = {entry["skill"]: entry for entry in weighting["entries"]}
+        for skill, entry in by_skill.items():
+            self.assertEqual(entry["mentions"], len(_skill_match_pattern(skill).findall(text)))
+            sources = [vote["source"] for vote in entry["committee"]["votes"]]
+            self.assertEqual("mentions" in sources, entry["mentions"] >= 2)
+            self.assertEqual(
+                "skills section" in sources,
+                bool(_skill_match_pattern(skill).search("Python, Cloud Security, C++")),
+            )
+        self.assertIn("skills section", [vote["source"] for vote in by_skill["Cloud Security"]["committee"]["votes"]])
+        self.assertIn("seeded skill", [vote["source"] for vote in by_skill["Python"]["committee"]["votes"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class IncrementalExtractTests(unittest.TestCase):
+    def _config_path(self, tmpdir):
+        config = copy.deepcopy(load_config("tests/fixtures/config/applicant.yaml"))
+        config["paths"]["sources_dir"] = os.path.join(tmpdir, "Sources")
+        config["paths"]["output_dir"] = os.path.join(tmpdir, "output")
+        config["paths"]["logs_dir"] = os.path.join(tmpdir, "logs")
+        os.makedirs(config["paths"]["sources_dir"])
+        with open(os.path.join(config["paths"]["sources_dir"], "cv.txt"), "w", encoding="utf-8") as f:
+            f.write("Skills: Python, Cloud Security, AI Strategy\nStakeholder Management and leadership.")
+        path = os.path.join(tmpdir, "applicant.json")
+        write_json(config, path)
+        return path, config
+
+    def _last_log(self, config):
+        with open(os.path.join(config["paths"]["logs_dir"], "extract_profile.log"), "r", encoding="utf-8") as f:
+            return [line for line in f.read().splitlines() if "Re-extracting" in line or "unchanged" in line][-1]
+
+    def test_unchanged_sources_reuse_profile_and_changes_rerun(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path, config = self._config_path(tmpdir)
+            first = extract_profile(config_path)
+            self.assertIn("no previous manifest", self._last_log(config))
+
+            with mock.patch.object(extract_profile_module, "load_documents", side_effect=AssertionError("re-parsed")):
+                second = extract_profile(config_path)
+            self.assertEqual(first, second)
+            self.assertIn("unchanged", self._last_log(config))
+
+            with open(os.path.join(config["paths"]["sources_dir"], "cv.txt"), "a", encoding="utf-8") as f:
+                f.write("\nSkills: Kubernetes, Terraform")
+            third = extract_profile(config_path)
+            self.assertIn("1 local documents changed (cv.txt)", self._last_log(config))
+            self.assertIn("Kubernetes", third["hard_skills"])
+
+            votes_path = os.path.join(config["paths"]["output_dir"], "committee_votes.json")
+            write_json({"profile": {"skills": {"Terraform": "reject"}}}, votes_path)
+            extract_profile(config_path)
+            self.assertIn("committee_votes profile overrides changed", self._last_log(config))
+            extract_profile(config_path, force=True)
+            self.assertIn("forced", self._last_log(config))
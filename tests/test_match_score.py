@@ -0,0 +1,491 @@
+import copy
+import os
+import re
+import sqlite3
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from utils.io import load_config, read_json, write_json
+from modules import match_score as match_score_module
+from modules.match_score import (
+    _build_bm25,
+    _extract_compensation,
+    _extract_job_facts,
+    _job_intent_tags,
+    _sales_guard_hit,
+    _scan_job,
+    _score_jobs,
+    _text_from_profile,
+    _write_ranked_outputs,
+    expand_pruned_match,
+    rerank_matches,
+    rerank_results,
+    reweight_features,
+)
+from utils.feature_store import load_features, write_features
+from utils.match_index import load_match_detail, load_match_index, load_matches, write_match_index
+from utils.tracing import load_run_metrics, span, traced_run
+from utils.vectorizer import EmbeddingStore
+
+CONFIG_PATH = "tests/fixtures/config/applicant.yaml"
+JOBS_PATH = "tests/fixtures/data/jobs/sample_jobs.json"
+LATEST_JOBS_PATH = "tests/fixtures/data/jobs/latest_jobs.json"
+PROFILE_PATH = "tests/golden_output/rob_profile.json"
+
+
+def _fixture_config(tmpdir):
+    config = copy.deepcopy(load_config(CONFIG_PATH))
+    config["paths"]["output_dir"] = os.path.join(tmpdir, "output")
+    config["paths"]["logs_dir"] = os.path.join(tmpdir, "logs")
+    config["matching"]["semantic"]["cache_path"] = ""
+    return config
+
+
+class TracingTests(unittest.TestCase):
+    def test_nested_stage_runs_become_spans_of_the_outer_run(self):
+        jobs = read_json(JOBS_PATH)
+        profile = read_json(PROFILE_PATH)
+
+        @traced_run("stage")
+        def stage(config_path):
+            with span("inner", jobs=len(jobs)):
+                return _score_jobs(jobs, profile, load_config(config_path))
+
+        @traced_run("outer")
+        def outer(config_path):
+            stage(config_path)
+            stage(config_path)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = os.path.join(tmpdir, "applicant.json")
+            write_json(_fixture_config(tmpdir), config_path)
+            outer(config_path)
+            stage(config_path)
+            metrics = load_run_metrics(os.path.join(tmpdir, "output"), "outer")
+            stage_metrics = load_run_metrics(os.path.join(tmpdir, "output"), "stage")
+
+        spans = {entry["path"]: entry for entry in metrics["spans"]}
+        self.assertEqual(metrics["run"], "outer")
+        self.assertEqual(metrics["status"], "ok")
+        self.assertEqual(spans["outer/stage"]["calls"], 2)
+        self.assertEqual(spans["outer/stage/inner"]["counts"], {"jobs": 2 * len(jobs)})
+        self.assertEqual(spans["outer/stage/inner/score"]["counts"]["jobs"], 2 * len(jobs))
+        self.assertEqual(spans["outer/stage/inner/score"]["depth"], 3)
+        self.assertGreaterEqual(metrics["wall_s"], spans["outer/stage"]["wall_s"])
+        self.assertEqual(stage_metrics["run"], "stage")
+
+    def test_worker_spans_are_merged_into_the_parent_run(self):
+        jobs = read_json(JOBS_PATH)
+        profile = read_json(PROFILE_PATH)
+
+        @traced_run("stage")
+        def stage(config_path, workers):
+            return _score_jobs(jobs, profile, load_config(config_path), workers=workers)
+
+        spans = {}
+        for workers in (1, 2):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                config_path = os.path.join(tmpdir, "applicant.json")
+                write_json(_fixture_config(tmpdir), config_path)
+                stage(config_path, workers)
+                metrics = load_run_metrics(os.path.join(tmpdir, "output"), "stage")
+                spans[workers] = {entry["path"]: entry for entry in metrics["spans"]}
+        for path in ("stage/score/analysis", "stage/score/similarity"):
+            self.assertEqual(spans[2][path]["calls"], spans[1][path]["calls"])
+        self.assertEqual(spans[2]["stage/score/analysis"]["calls"], len(jobs))
+
+
+class ScoreJobsTests(unittest.TestCase):
+    def setUp(self):
+        self.jobs = read_json(JOBS_PATH)
+        self.profile = read_json(PROFILE_PATH)
+
+    def test_parallel_matches_serial(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            serial, _, _, _ = _score_jobs(self.jobs, self.profile, config, workers=1)
+            parallel, _, _, _ = _score_jobs(self.jobs, self.profile, config, workers=2)
+        self.assertEqual(serial, parallel)
+
+    def test_parent_builds_embedder_only_for_serial_scoring_or_clustering(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            config["matching"]["similarity"]["enabled"] = False
+            build = mock.patch.object(match_score_module, "_build_embedder", wraps=match_score_module._build_embedder)
+            with build as built:
+                _score_jobs(self.jobs, self.profile, config, workers=2)
+            self.assertEqual(built.call_count, 0)
+            config["matching"]["similarity"]["enabled"] = True
+            with build as built:
+                _score_jobs(self.jobs, self.profile, config, workers=2)
+            self.assertEqual(built.call_count, 1)
+
+    def test_parallel_run_persists_prefetched_embeddings(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            cache_path = os.path.join(tmpdir, "cache", "emb.json")
+            config["matching"]["semantic"]["cache_path"] = cache_path
+            serial, _, _, _ = _score_jobs(self.jobs, self.profile, copy.deepcopy(config), workers=1)
+            serial_entries = len(EmbeddingStore(cache_path))
+            for suffix in (".vec", ".idx", ".lru"):
+                os.remove(cache_path[:-5] + suffix)
+            parallel, _, _, _ = _score_jobs(self.jobs, self.profile, config, workers=2)
+            parallel_entries = len(EmbeddingStore(cache_path))
+            written = sorted(os.listdir(os.path.dirname(cache_path)))
+        self.assertEqual(parallel, serial)
+        self.assertGreater(serial_entries, 0)
+        self.assertEqual(parallel_entries, serial_entries)
+        self.assertEqual(written, ["emb.idx", "emb.lock", "emb.lru", "emb.vec"])
+
+    def test_falls_back_to_serial_only_when_the_pool_breaks(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            serial, _, _, _ = _score_jobs(self.jobs, self.profile, config, workers=1)
+            broken = mock.patch.object(match_score_module, "_score_jobs_parallel", side_effect=BrokenProcessPool("worker died"))
+            with broken:
+                fallback, _, _, _ = _score_jobs(self.jobs, self.profile, config, workers=2)
+            with open(os.path.join(tmpdir, "logs", "match_score.log"), encoding="utf-8") as f:
+                log = f.read()
+            failing = mock.patch.object(match_score_module, "_score_jobs_parallel", side_effect=ValueError("bug"))
+            with failing, self.assertRaises(ValueError):
+                _score_jobs(self.jobs, self.profile, config, workers=2)
+        self.assertEqual(serial, fallback)
+        self.assertIn("Traceback", log)
+
+    def test_analysis_cache_reuses_unchanged_jobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            cold, _, _, _ = _score_jobs(self.jobs, self.profile, config)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "output", "analysis_cache.json")))
+            warm, _, _, _ = _score_jobs(self.jobs, self.profile, config)
+            with open(os.path.join(tmpdir, "logs", "match_score.log"), "r", encoding="utf-8") as f:
+                log_lines = f.read().splitlines()
+        self.assertEqual(cold, warm)
+        self.assertIn("Analysis cache: 2 hits, 0 misses", log_lines[-1])
+
+    def test_rerank_matches_full_preset_run(self):
+        # Duplicate postings tie on every preset; ids are listed out of order so
+        # ties have to be broken by id rather than by the incoming order.
+        jobs = [dict(job, id=f"{job['id']}-{suffix}") for suffix in ("b", "a") for job in self.jobs]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            base, _, _, _ = _score_jobs(jobs, self.profile, config, preset_name="")
+            for preset_name in [""] + list(config["scoring"]["presets"]):
+                full, _, _, _ = _score_jobs(jobs, self.profile, config, preset_name=preset_name)
+                reranked = rerank_results(base, preset_name)
+                self.assertEqual(reranked, full)
+                self.assertEqual(rerank_results(list(reversed(reranked)), preset_name), full)
+        self.assertNotIn("", base[0]["score_by_preset"])
+        self.assertEqual(base[0]["score_raw"], base[0]["score_by_preset"]["base"]["score_preset"])
+        self.assertEqual([match["id"] for match in base[:2]], sorted(match["id"] for match in base[:2]))
+
+    def test_job_states_written_in_batches(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            db_path = os.path.join(tmpdir, "db", "applicant.db")
+            config["db"] = {"enabled": True, "env": "prod", "path": db_path, "batch_size": 1}
+            results, _, _, _ = _score_jobs(self.jobs, self.profile, config)
+            with sqlite3.connect(db_path) as conn:
+                rows = dict(conn.execute("SELECT job_id, recommendation FROM job_states").fetchall())
+        self.assertEqual(rows, {match["id"]: match["recommendation"] for match in results})
+
+    def test_reweight_from_feature_store_matches_scoring(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            rows = []
+            results, _, _, _ = _score_jobs(self.jobs, self.profile, config, preset_name="", feature_rows=rows)
+            path = os.path.join(tmpdir, "job_features.db")
+            write_features(path, rows)
+            stored = load_features(path)
+        reweighted = reweight_features(stored, config, preset_name="")
+        expected = {str(match["id"]): (match["score"], match["recommendation"]) for match in results}
+        self.assertEqual({row["id"]: (row["score"], row["recommendation"]) for row in reweighted["results"]}, expected)
+        title_only = reweight_features(
+            stored,
+            config,
+            weights={key: 0.0 for key in config["matching"]["weights"]} | {"title": 1.0},
+            thresholds={"apply": 0.99, "consider": 0.0},
+            preset_name="",
+        )
+        self.assertEqual(title_only["thresholds"], {"apply": 0.99, "consider": 0.0})
+        scores = [row["score"] for row in title_only["results"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_bm25_scores_titles_of_text_missing_jobs_against_title_corpus(self):
+        jobs = self.jobs + [
+            {
+                "id": "job-3",
+                "title": "Platform Engineer",
+                "company": "Acme",
+                "location": "Berlin",
+                "description": " ".join(["Strategy leadership for AI platforms and cloud security programs."] * 6),
+            }
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            results, _, _, _ = _score_jobs(jobs, self.profile, config, similarity_mode="bm25")
+        bm25 = _build_bm25(jobs, config)
+        profile_text = _text_from_profile(self.profile)
+        by_id = {match["id"]: match for match in results}
+        for job in self.jobs:
+            self.assertIn(job["title"], bm25["documents"])
+            expected = round(bm25["titles"].similarity(profile_text, job["title"]), 4)
+            self.assertEqual(by_id[job["id"]]["score_breakdown"]["title"], expected)
+        self.assertNotEqual(
+            bm25["titles"].similarity(profile_text, self.jobs[0]["title"]),
+            bm25["documents"].similarity(profile_text, self.jobs[0]["title"]),
+        )
+
+    def test_match_index_slims_entries_and_serves_detail_from_shards(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            results, _, _, _ = _score_jobs(self.jobs, self.profile, config)
+            output_dir = config["paths"]["output_dir"]
+            shards = write_match_index(output_dir, results, shard_size=2, preview_chars=40)
+            index = load_match_index(output_dir)
+            details = [load_match_detail(output_dir, match["id"], index=index) for match in results]
+        self.assertEqual(shards, (len(results) + 1) // 2)
+        self.assertEqual([entry["id"] for entry in index["matches"]], [match["id"] for match in results])
+        self.assertEqual(details, results)
+        for entry, match in zip(index["matches"], results):
+            self.assertNotIn("job_analysis", entry)
+            self.assertNotIn("requirements", entry["qualification"])
+            self.assertEqual(entry["qualification"]["requirement_count"], len(match["qualification"]["requirements"]))
+            self.assertLessEqual(len(entry["job"]["description"]), 40)
+            self.assertEqual(entry["score"], match["score"])
+
+    def test_write_full_off_serves_matches_from_the_shards(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            config["matching"]["match_index"] = {"shard_size": 1, "write_full": False}
+            config_path = os.path.join(tmpdir, "applicant.json")
+            write_json(config, config_path)
+            output_dir = config["paths"]["output_dir"]
+            results, suggestions, assessment, _ = _score_jobs(self.jobs, self.profile, config)
+            write_json(results, os.path.join(output_dir, "matched_jobs.json"))
+            _write_ranked_outputs(output_dir, results, suggestions, assessment, config)
+            written = os.path.exists(os.path.join(output_dir, "matched_jobs.json"))
+            loaded = load_matches(output_dir)
+            reranked = rerank_matches(config_path, preset_name="balanced", feedback_enabled=False)
+            config["matching"]["match_index"]["write_full"] = True
+            _write_ranked_outputs(output_dir, results, suggestions, assessment, config)
+            restored = read_json(os.path.join(output_dir, "matched_jobs.json"))
+        self.assertFalse(written)
+        self.assertEqual(loaded, results)
+        self.assertEqual([match["id"] for match in reranked], [match["id"] for match in results])
+        self.assertEqual(restored, results)
+
+    def test_upper_bound_pruning_only_skips_jobs_that_cannot_reach_consider(self):
+        jobs = self.jobs + [
+            {
+                "id": "job-3",
+                "title": "Forklift Operator",
+                "company": "Depot",
+                "location": "Sydney",
+                "language": "ja",
+                "description": "Operate forklifts in the warehouse.\nNight shifts and loading docks.",
+            }
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            config["matching"]["analysis_cache"] = {"enabled": False}
+            config["scoring"]["presets"] = {}
+            config["matching"]["consider_threshold"] = 0.6
+            config["matching"]["apply_threshold"] = 0.8
+            full, _, _, _ = _score_jobs(jobs, self.profile, config)
+            config["matching"]["pruning"] = {"enabled": True}
+            pruned, _, _, _ = _score_jobs(jobs, self.profile, config)
+            output_dir = config["paths"]["output_dir"]
+            write_json(self.profile, os.path.join(output_dir, "rob_profile.json"))
+            write_match_index(output_dir, pruned, shard_size=2)
+            write_json(pruned, os.path.join(output_dir, "matched_jobs.json"))
+            cache_base = os.path.join(tmpdir, "cache", "emb")
+            config["matching"]["semantic"]["cache_path"] = cache_base
+            store = EmbeddingStore(cache_base)
+            store.set("seed", [1.0])
+            store.save()
+            before = {name: os.path.getmtime(os.path.join(tmpdir, "cache", name)) for name in os.listdir(os.path.join(tmpdir, "cache"))}
+            expanded = [expand_pruned_match(config, match) for match in pruned]
+            after = {name: os.path.getmtime(os.path.join(tmpdir, "cache", name)) for name in os.listdir(os.path.join(tmpdir, "cache"))}
+            saved = [load_match_detail(output_dir, match["id"]) for match in pruned]
+            index = load_match_index(output_dir)
+            stored = load_matches(output_dir)
+        by_id = {match["id"]: match for match in full}
+        self.assertTrue(any(match.get("pruned") for match in pruned))
+        for match in pruned:
+            if match.get("pruned"):
+                self.assertEqual(match["recommendation"], "skip")
+                self.assertEqual(by_id[match["id"]]["recommendation"], "skip")
+                self.assertLessEqual(by_id[match["id"]]["score"], match["pruned"]["upper_bound"])
+            else:
+                self.assertEqual(match, by_id[match["id"]])
+        self.assertEqual({match["id"]: match for match in expanded}, by_id)
+        self.assertEqual(saved, expanded)
+        self.assertEqual(after, before)
+        self.assertEqual(stored, full)
+        self.assertEqual([entry["id"] for entry in index["matches"]], [match["id"] for match in full])
+        self.assertEqual([entry["score"] for entry in index["matches"]], [match["score"] for match in full])
+        self.assertFalse(any("pruned" in entry for entry in index["matches"]))
+
+    def test_reweight_reports_pruned_jobs_as_not_analysed(self):
+        jobs = self.jobs + [
+            {
+                "id": "job-3",
+                "title": "Forklift Operator",
+                "company": "Depot",
+                "location": "Sydney",
+                "language": "ja",
+                "description": "Operate forklifts in the warehouse.\nNight shifts and loading docks.",
+            }
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = _fixture_config(tmpdir)
+            config["matching"]["analysis_cache"] = {"enabled": False}
+            config["scoring"]["presets"] = {}
+            config["matching"]["consider_threshold"] = 0.6
+            config["matching"]["apply_threshold"] = 0.8
+            config["matching"]["pruning"] = {"enabled": True}
+            rows = []
+            results, _, _, _ = _score_jobs(jobs, self.profile, config, feature_rows=rows)
+            path = os.path.join(tmpdir, "job_features.db")
+            write_features(path, rows)
+            stored = load_features(path)
+        pruned = {str(match["id"]): match["pruned"]["upper_bound"] for match in results if match.get("pruned")}
+        self.assertIn("job-3", pruned)
+        self.assertEqual({str(row["job_id"]): row["upper_bound"] for row in stored if row["pruned"]}, pruned)
+        promoted = reweight_features(stored, config, thresholds={"apply": 1.0, "consider": 0.0}, preset_name="")
+        self.assertEqual({row["id"]: row["upper_bound"] for row in promoted["not_analysed"]}, pruned)
+        self.assertFalse(set(pruned) & {row["id"] for row in promoted["results"]})
+        self.assertTrue(all(row["recommendation"] == "consider" for row in promoted["results"]))
+
+
+
+class JobScanTests(unittest.TestCase):
+    def test_single_pass_scan_matches_per_detector_output(self):
+        jobs = read_json(JOBS_PATH) + [
+            {"title": "Senior Salesforce Engineer", "description": "Full time role. Director reports; hybrid."},
+            {"title": "Sales Director", "description": "Quota carrying. EUR 90,000 - 110,000 per year, stock options."},
+            {"title": "Team Sr", "description": "time contract with vice\npresident access", "location": "Remote"},
+            {"title": "Vice", "description": "President of internal tooling, pre-sales and html engineering"},
+            {"title": "\u0130nterim CTO", "description": "On-site in office. Paid time off and gym."},
+            {"title": None, "description": None, "location": None},
+        ]
+        for job in jobs:
+            expected = {
+                "intent_tags": _job_intent_tags(job),
+                "sales_guard": _sales_guard_hit(job.get("title")),
+                "job_facts": _extract_job_facts(job),
+            }
+            self.assertEqual(_scan_job(job), expected)
+
+    def test_single_pass_scan_matches_baseline_regex_path(self):
+        jobs = read_json(JOBS_PATH) + read_json(LATEST_JOBS_PATH)
+        jobs += [dict(job, title=job.get("description", "")[:80], description=job.get("title", "")) for job in jobs]
+        for job in jobs:
+            self.assertEqual(_scan_job(job), _baseline_scan(job), job.get("id"))
+
+
+# The per-pattern detectors as they were before the single-pass scan, kept
+# verbatim so the scan is checked against an independent implementation.
+_BASELINE_SALES_GUARD = [
+    r"\baccount executive\b",
+    r"\baccount manager\b",
+    r"\bsales ops\b",
+    r"\bsales operations\b",
+    r"\bbusiness development\b",
+    r"\bquota\b",
+    r"\bsdr\b",
+    r"\bbdr\b",
+    r"\bsales(?!force)\b",
+]
+_BASELINE_INTENTS = [
+    ("executive_strategy", r"\bdirector\b|\bhead\b|\bvp\b|vice president|\bchief\b|\bexecutive\b|\bstrategy\b"),
+    ("principal_architecture", r"\barchitect\b|\barchitecture\b|solution architect|enterprise architect|platform architect"),
+    ("consulting_leadership", r"\bconsultant\b|\bconsulting\b|\badvisory\b|\badvisor\b|pre-?sales|\bpartner\b|\bclient\b"),
+    (
+        "engineering_execution",
+        r"\bengineer\b|\bdeveloper\b|\bscientist\b|data engineer|ml engineer|\bbackend\b|\bfrontend\b|full stack|\bswe\b|\bdevops\b|\bsre\b",
+    ),
+]
+_BASELINE_SENIORITY = [
+    ("c_level", ["chief", "c-level", "cto", "cio", "ciso", "ceo", "coo", "cpo"]),
+    ("vp", ["vp", "vice president"]),
+    ("director", ["director", "head of"]),
+    ("principal", ["principal", "staff"]),
+    ("lead", ["lead", "leader"]),
+    ("senior", ["senior", "sr.", "sr "]),
+    ("mid", ["mid", "mid-level", "mid level"]),
+    ("junior", ["junior", "jr.", "jr "]),
+    ("intern", ["intern", "internship"]),
+]
+_BASELINE_CONTRACTS = [
+    ("full_time", ["full-time", "full time", "fulltime"]),
+    ("part_time", ["part-time", "part time", "parttime"]),
+    ("contract", ["contract", "contractor", "fixed-term", "fixed term"]),
+    ("freelance", ["freelance"]),
+    ("internship", ["intern", "internship"]),
+    ("temporary", ["temporary", "temp"]),
+]
+_BASELINE_BENEFITS = {
+    "health": ["health insurance", "medical insurance", "healthcare", "medical plan"],
+    "pension": ["pension", "retirement", "401k", "401(k)"],
+    "equity": ["equity", "stock", "stock options", "esop", "rsu"],
+    "bonus": ["bonus", "performance bonus", "annual bonus"],
+    "relocation": ["relocation", "relocate"],
+    "visa": ["visa sponsorship", "work visa", "sponsorship"],
+    "training": ["training", "learning budget", "education budget", "conference"],
+    "wellness": ["wellness", "gym", "fitness"],
+    "pto": ["pto", "paid time off", "vacation", "holiday"],
+}
+_BASELINE_EMPLOYMENT = {
+    "full_time": "Full-time",
+    "part_time": "Part-time",
+    "contract": "Contract",
+    "temporary": "Temporary",
+    "internship": "Internship",
+    "freelance": "Freelance",
+}
+
+
+def _baseline_first(rules, text):
+    low = (text or "").lower()
+    return next((label for label, tokens in rules if any(token in low for token in tokens)), "")
+
+
+def _baseline_scan(job):
+    title = job.get("title", "") or ""
+    description = job.get("description", "") or ""
+    location = job.get("location", "") or ""
+    intent_text = f"{title} {description}".lower()
+    text = f"{title}\\n{description}".lower()
+    low_location = location.lower()
+    if "hybrid" in text or "hybrid" in low_location:
+        work_mode = "hybrid"
+    elif "remote" in text or "remote" in low_location or "telecommute" in text:
+        work_mode = "remote"
+    elif any(token in text for token in ["on-site", "onsite", "in-office", "in office", "office-based"]):
+        work_mode = "on_site"
+    else:
+        work_mode = ""
+    contract_type = _baseline_first(_BASELINE_CONTRACTS, text)
+    low_description = description.lower()
+    return {
+        "intent_tags": {tag for tag, pattern in _BASELINE_INTENTS if re.search(pattern, intent_text)},
+        "sales_guard": any(re.search(pattern, title.lower()) for pattern in _BASELINE_SALES_GUARD),
+        "job_facts": {
+            "location": location.strip(),
+            "workplace": {"remote": "Remote", "hybrid": "Hybrid", "on_site": "On-site"}.get(work_mode, ""),
+            "work_mode": work_mode,
+            "employment_type": _BASELINE_EMPLOYMENT.get(contract_type, ""),
+            "contract_type": contract_type,
+            "compensation": _extract_compensation(description),
+            "seniority": _baseline_first(_BASELINE_SENIORITY, title) or _baseline_first(_BASELINE_SENIORITY, description),
+            "benefits": [label for label, tokens in _BASELINE_BENEFITS.items() if any(token in low_description for token in tokens)],
+        },
+    }
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,268 @@
+import io
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+import zipfile
+from unittest import mock
+
+from utils import parser
+from utils.io import read_json
+from utils.parser import (
+    _docx_to_text_regex,
+    build_inventory,
+    docx_to_text,
+    iter_docx_paragraphs,
+    load_documents,
+    open_text_cache,
+    pdf_to_text,
+)
+
+_READ_TEXT = parser._read_text
+
+
+def _slow_read_text(path):
+    if "slow" in os.path.basename(path):
+        time.sleep(5)
+    return _READ_TEXT(path)
+
+
+def _write_sources(folder):
+    os.makedirs(os.path.join(folder, "nested"))
+    for idx in range(6):
+        with open(os.path.join(folder, f"note_{idx}.txt"), "w", encoding="utf-8") as f:
+            f.write(f"Note {idx} about Python and cloud security.")
+    with open(os.path.join(folder, "nested", "readme.md"), "w", encoding="utf-8") as f:
+        f.write("# Projects\nGovernance roadmap.")
+    with open(os.path.join(folder, "nested", "image.png"), "wb") as f:
+        f.write(b"\x89PNG")
+    with zipfile.ZipFile(os.path.join(folder, "cv.docx"), "w") as z:
+        z.writestr("word/document.xml", "<w:p><w:t>Stakeholder Management</w:t></w:p><w:p><w:t>AI</w:t></w:p>")
+
+
+def _inventory_without_timing(docs):
+    return [{key: value for key, value in row.items() if key != "parse_ms"} for row in build_inventory(docs)]
+
+
+class _FakePage:
+    def __init__(self, text, reads):
+        self.text = text
+        self.reads = reads
+
+    def extract_text(self):
+        self.reads.append(self.text)
+        return self.text
+
+
+class _FakePdfReader:
+    reads = []
+
+    def __init__(self, source):
+        self.pages = [_FakePage(f"Page {idx} " + "x" * 90, self.reads) for idx in range(200)]
+
+
+class _FakePdftotext:
+    output = ""
+    killed = False
+
+    def __init__(self, command, **kwargs):
+        pages = len(self.output.split("\f")) - 1
+        if "-l" in command:
+            pages = min(pages, int(command[command.index("-l") + 1]))
+        self.stdout = io.StringIO("".join(page + "\f" for page in self.output.split("\f")[:pages]))
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self):
+        _FakePdftotext.killed = True
+        self.returncode = -9
+
+    def wait(self):
+        self.returncode = self.returncode if self.returncode is not None else 0
+        return self.returncode
+
+
+class PdftotextFallbackTests(unittest.TestCase):
+    def setUp(self):
+        _FakePdftotext.output = "".join(f"Page {idx} " + "x" * 90 + "\f" for idx in range(200))
+        _FakePdftotext.killed = False
+        patcher = mock.patch.object(parser.subprocess, "Popen", _FakePdftotext)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reports_truncation_when_max_pages_cuts_the_document(self):
+        with mock.patch.object(parser, "_pdf_page_count", return_value=200):
+            parsed = parser._pdftotext_text("report.pdf", max_pages=3)
+        self.assertEqual(parsed["pages"], 3)
+        self.assertTrue(parsed["truncated"])
+        with mock.patch.object(parser, "_pdf_page_count", return_value=3):
+            self.assertFalse(parser._pdftotext_text("report.pdf", max_pages=3)["truncated"])
+        with mock.patch.object(parser, "_pdf_page_count", return_value=0):
+            self.assertTrue(parser._pdftotext_text("report.pdf", max_pages=3)["truncated"])
+
+    def test_stops_reading_output_at_max_chars(self):
+        parsed = parser._pdftotext_text("report.pdf", max_chars=250)
+        self.assertEqual(len(parsed["content"]), 250)
+        self.assertTrue(parsed["truncated"])
+        self.assertTrue(_FakePdftotext.killed)
+        self.assertLess(parsed["pages"], 200)
+
+
+class PdfExtractionTests(unittest.TestCase):
+    def setUp(self):
+        _FakePdfReader.reads = []
+        patcher = mock.patch.object(parser, "_open_pdf_reader", _FakePdfReader)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stops_reading_pages_at_max_pages(self):
+        parsed = pdf_to_text(b"%PDF", max_pages=3)
+        self.assertEqual(len(_FakePdfReader.reads), 3)
+        self.assertEqual(parsed["pages"], 3)
+        self.assertTrue(parsed["truncated"])
+        self.assertTrue(parsed["content"].startswith("Page 0"))
+        self.assertIn("Page 2", parsed["content"])
+
+    def test_stops_early_and_truncates_at_max_chars(self):
+        parsed = pdf_to_text(b"%PDF", max_chars=250)
+        self.assertEqual(len(_FakePdfReader.reads), 3)
+        self.assertEqual(len(parsed["content"]), 250)
+        self.assertTrue(parsed["truncated"])
+        self.assertEqual(parsed["method"], "pypdf")
+
+    def test_unbounded_reads_every_page(self):
+        parsed = pdf_to_text(b"%PDF")
+        self.assertEqual(parsed["pages"], 200)
+        self.assertFalse(parsed["truncated"])
+
+    def test_inventory_records_pages_and_timing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "report.pdf"), "wb") as f:
+                f.write(b"%PDF")
+            docs = load_documents(tmpdir, max_pages=5, max_chars=10000)
+        row = build_inventory(docs)[0]
+        self.assertEqual(row["pages"], 5)
+        self.assertTrue(row["truncated"])
+        self.assertGreaterEqual(row["parse_ms"], 0)
+        self.assertIn("stopped after 5 pages", row["notes"])
+
+
+_TEXT_BOX_XML = (
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>'
+    "<w:p><w:r><w:t>Before</w:t></w:r><w:r><mc:AlternateContent>"
+    "<mc:Choice><w:txbxContent><w:p><w:r><w:t>Boxed note</w:t></w:r></w:p></w:txbxContent></mc:Choice>"
+    "<mc:Fallback><w:txbxContent><w:p><w:r><w:t>Boxed note</w:t></w:r></w:p></w:txbxContent></mc:Fallback>"
+    "</mc:AlternateContent></w:r><w:r><w:t> after</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>Next</w:t></w:r></w:p>"
+    "</w:body></w:document>"
+)
+
+
+class DocxExtractionTests(unittest.TestCase):
+    def test_streaming_extractor_yields_paragraph_text(self):
+        xml = (
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+            "<w:p><w:r><w:t>Cloud &amp; Security</w:t></w:r><w:r><w:tab/><w:t>Python</w:t></w:r>"
+            "<w:del><w:r><w:delText>dropped</w:delText></w:r></w:del><w:ins><w:r><w:t> added</w:t></w:r></w:ins></w:p>"
+            "<w:p/><w:p/><w:p/>"
+            "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+            "</w:body></w:document>"
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "cv.docx")
+            with zipfile.ZipFile(path, "w") as z:
+                z.writestr("word/document.xml", xml)
+            self.assertEqual(docx_to_text(path), "Cloud & Security\tPython added\n\nCell")
+            with open(path, "rb") as f:
+                self.assertEqual(docx_to_text(f), docx_to_text(path))
+
+            boxed = os.path.join(tmpdir, "boxed.docx")
+            with zipfile.ZipFile(boxed, "w") as z:
+                z.writestr("word/document.xml", _TEXT_BOX_XML)
+            self.assertEqual(list(iter_docx_paragraphs(boxed)), ["Boxed note", "Before after", "Next"])
+
+            legacy = os.path.join(tmpdir, "legacy.docx")
+            with zipfile.ZipFile(legacy, "w") as z:
+                z.writestr("word/document.xml", "<w:p><w:t>Unbound</w:t></w:p><w:p><w:t>prefix</w:t></w:p>")
+            self.assertEqual(docx_to_text(legacy), _docx_to_text_regex(legacy))
+
+
+class LoadDocumentsTests(unittest.TestCase):
+    def test_parallel_parsing_keeps_walk_order_and_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sources = os.path.join(tmpdir, "Sources")
+            _write_sources(sources)
+            serial = load_documents(sources, output_text_dir=os.path.join(tmpdir, "serial"))
+            parallel = load_documents(sources, output_text_dir=os.path.join(tmpdir, "parallel"), workers=3)
+            serial_texts = sorted(os.listdir(os.path.join(tmpdir, "serial")))
+            parallel_texts = sorted(os.listdir(os.path.join(tmpdir, "parallel")))
+        self.assertEqual(serial_texts, parallel_texts)
+        self.assertEqual(_inventory_without_timing(serial), _inventory_without_timing(parallel))
+        self.assertEqual([doc.content for doc in serial], [doc.content for doc in parallel])
+        self.assertEqual(len(serial), 9)
+        self.assertIn("Stakeholder Management\nAI", [doc.content for doc in serial])
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "patched reader only reaches forked workers")
+    def test_hung_files_are_killed_at_their_own_deadline(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_sources(tmpdir)
+            for idx in range(3):
+                with open(os.path.join(tmpdir, f"slow_{idx}.txt"), "w", encoding="utf-8") as f:
+                    f.write("never read")
+            with mock.patch.object(parser, "_read_text", _slow_read_text):
+                started = time.perf_counter()
+                docs = load_documents(tmpdir, workers=2, timeout=0.5)
+                elapsed = time.perf_counter() - started
+        by_name = {os.path.basename(doc.path): doc for doc in docs}
+        for idx in range(3):
+            self.assertEqual(by_name[f"slow_{idx}.txt"].status, "skipped")
+            self.assertIn("timed out", by_name[f"slow_{idx}.txt"].notes)
+        self.assertEqual([doc.status for doc in docs if "slow" not in doc.path].count("ok"), 8)
+        self.assertLess(elapsed, 4)
+
+    def test_serial_parsing_does_not_start_a_pool(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_sources(tmpdir)
+            with mock.patch.object(parser, "ProcessPoolExecutor", side_effect=AssertionError("pool started")):
+                docs = load_documents(tmpdir, workers=1, timeout=120)
+        self.assertEqual([doc.status for doc in docs].count("ok"), 8)
+
+    def test_text_cache_reuses_unchanged_documents(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sources = os.path.join(tmpdir, "Sources")
+            cache_path = os.path.join(tmpdir, "source_text_cache.json")
+            _write_sources(sources)
+            cold = load_documents(sources, cache=open_text_cache(cache_path))
+            note_path = os.path.join(sources, "note_0.txt")
+            os.utime(note_path, (1, 1))
+            with open(os.path.join(sources, "note_1.txt"), "a", encoding="utf-8") as f:
+                f.write(" Updated.")
+            os.remove(os.path.join(sources, "nested", "readme.md"))
+            with mock.patch.object(parser, "docx_to_text", side_effect=AssertionError("docx re-parsed")):
+                warm_cache = open_text_cache(cache_path)
+                warm = load_documents(sources, cache=warm_cache)
+            entries = read_json(cache_path)["entries"]
+        cold_by_name = {os.path.basename(doc.path): doc for doc in cold}
+        warm_by_name = {os.path.basename(doc.path): doc for doc in warm}
+        self.assertEqual({doc.cache for doc in cold}, {"miss"})
+        self.assertEqual(warm_by_name["cv.docx"].cache, "hit")
+        self.assertEqual(warm_by_name["cv.docx"].content, cold_by_name["cv.docx"].content)
+        self.assertEqual(warm_by_name["cv.docx"].method, "docx")
+        self.assertEqual(warm_by_name["note_0.txt"].cache, "hit")
+        self.assertEqual(warm_by_name["note_1.txt"].cache, "miss")
+        self.assertTrue(warm_by_name["note_1.txt"].content.endswith("Updated."))
+        self.assertEqual(warm_cache.stats(), {"hits": 7, "misses": 1, "entries": 8})
+        self.assertEqual(len(entries), 8)
+        self.assertNotIn(os.path.join(sources, "nested", "readme.md"), entries)
+        self.assertEqual(build_inventory(warm)[0]["cache"], warm[0].cache)
+        self.assertEqual({doc.parse_ms for doc in warm if doc.cache == "hit"}, {0.0})
+        self.assertGreater(warm_by_name["note_1.txt"].parse_ms, 0.0)
+        self.assertEqual(entries[os.path.join(sources, "cv.docx")]["parse_ms"], cold_by_name["cv.docx"].parse_ms)
+
+
+if __name__ == "__main__":
+    unittest.main()
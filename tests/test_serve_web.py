@@ -0,0 +1,136 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import urllib.error
+import urllib.request
+from unittest import mock
+
+from scripts import serve_web
+from utils.io import DEFAULT_CONFIG, read_json
+
+
+class ServeWebConcurrencyTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = tmpdir.name
+        web_dir = os.path.join(self.tmpdir, "web")
+        os.makedirs(web_dir)
+        with open(os.path.join(web_dir, "index.html"), "w", encoding="utf-8") as f:
+            f.write("<html>review</html>")
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config["paths"]["output_dir"] = os.path.join(self.tmpdir, "output")
+        config["paths"]["logs_dir"] = os.path.join(self.tmpdir, "logs")
+        config.setdefault("db", {})["enabled"] = False
+        patcher = mock.patch.object(serve_web, "load_config", return_value=config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.config = config
+
+        self.server = serve_web.make_server("127.0.0.1", 0, web_dir)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def _request(self, path, payload=None):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(self.base + path, data=data, method="POST" if data is not None else "GET")
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read()
+
+    def test_running_crawl_does_not_block_static_files_or_votes(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_crawl(config_path):
+            started.set()
+            release.wait(10)
+
+        results = {}
+        with mock.patch.object(serve_web, "crawl_jobs", side_effect=slow_crawl):
+            crawl = threading.Thread(target=lambda: results.setdefault("crawl", self._request("/api/crawl", {})))
+            crawl.start()
+            self.assertTrue(started.wait(5))
+            began = time.perf_counter()
+            static_status, body = self._request("/index.html")
+            vote_status, _ = self._request("/api/vote", {"job_id": "1", "vote": "approve"})
+            busy_status, busy_body = self._request("/api/crawl", {})
+            elapsed = time.perf_counter() - began
+            release.set()
+            crawl.join(10)
+        self.assertEqual(static_status, 200)
+        self.assertIn(b"review", body)
+        self.assertEqual(vote_status, 200)
+        self.assertEqual(busy_status, 409)
+        self.assertIn("in progress", json.loads(busy_body)["error"])
+        self.assertLess(elapsed, 3)
+        self.assertEqual(results["crawl"][0], 200)
+
+    def test_reweight_and_votes_do_not_wait_on_runs_or_submissions(self):
+        crawling = threading.Event()
+        submitting = threading.Event()
+        release = threading.Event()
+
+        def slow_crawl(config_path):
+            crawling.set()
+            release.wait(10)
+
+        def slow_submit(*args, **kwargs):
+            submitting.set()
+            release.wait(10)
+            return {"status": "sent"}
+
+        self.config["submission"] = {"enabled": True, "mode": "draft"}
+        self.assertEqual(self._request("/api/vote", {"job_id": "1", "vote": "approve"})[0], 200)
+        apps = [{"job_id": "1", "_file": "application_1.json", "review_required": True}]
+        results = {}
+        with mock.patch.object(serve_web, "crawl_jobs", side_effect=slow_crawl), mock.patch.object(
+            serve_web, "load_applications", return_value=apps
+        ), mock.patch.object(serve_web, "submit_application", side_effect=slow_submit):
+            crawl = threading.Thread(target=lambda: results.setdefault("crawl", self._request("/api/crawl", {})))
+            submit = threading.Thread(
+                target=lambda: results.setdefault(
+                    "submit", self._request("/api/submit", {"job_id": "1", "checklist": {"reviewed": True}})
+                )
+            )
+            crawl.start()
+            submit.start()
+            self.assertTrue(crawling.wait(5))
+            self.assertTrue(submitting.wait(5))
+            began = time.perf_counter()
+            reweight_status, reweight_body = self._request("/api/reweight", {"weights": {"title": 1.0}})
+            vote_status, _ = self._request("/api/vote", {"job_id": "2", "vote": "hold"})
+            elapsed = time.perf_counter() - began
+            release.set()
+            crawl.join(10)
+            submit.join(10)
+        self.assertEqual(reweight_status, 404)
+        self.assertIn("feature store", json.loads(reweight_body)["error"])
+        self.assertEqual(vote_status, 200)
+        self.assertLess(elapsed, 3)
+        self.assertEqual(results["submit"][0], 200)
+
+    def test_concurrent_votes_are_all_kept(self):
+        threads = [
+            threading.Thread(target=self._request, args=("/api/vote", {"job_id": str(idx), "vote": "hold"}))
+            for idx in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        votes = read_json(os.path.join(self.config["paths"]["output_dir"], "review_votes.json"))
+        self.assertEqual(sorted(votes, key=int), [str(idx) for idx in range(20)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+import importlib.util
+import json
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.vectorizer import (
+    BM25Index,
+    EmbeddingStore,
+    SPARSE_CACHE_SIZE,
+    SemanticEmbedder,
+    _cached_sparse_hash_embedding,
+    _cosine_similarity,
+    _hash_embedding,
+    tokenize,
+)
+
+
+class _RecordingModel:
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, batch_size=32):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class EmbeddingStoreTests(unittest.TestCase):
+    def test_appends_and_reads_back_float32_vectors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "embeddings")
+            store = EmbeddingStore(path, namespace="hash:")
+            store.set("alpha", [1.0, -2.0, 0.5])
+            store.save()
+            store.set("beta", [3.0, 4.0])
+            store.save()
+            reopened = EmbeddingStore(path, namespace="hash:")
+            self.assertEqual(reopened.get("alpha"), [1.0, -2.0, 0.5])
+            self.assertEqual(reopened.get("beta"), [3.0, 4.0])
+            self.assertIsNone(EmbeddingStore(path, namespace="sbert:model").get("alpha"))
+            with open(path + ".idx", "rb") as f:
+                self.assertEqual(len(f.read()), 2 * EmbeddingStore.RECORD.size)
+
+    def test_imports_legacy_json_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "embedding_cache.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"cloud security lead": _hash_embedding("cloud security lead")}, f)
+            embedder = SemanticEmbedder(cache_path=path)
+            self.assertEqual(embedder.cache.get("cloud security lead"), _hash_embedding("cloud security lead"))
+            embedder.cache.save()
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "embedding_cache.vec")))
+
+    def test_evicts_least_recently_used_and_expired_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "embeddings")
+            store = EmbeddingStore(path, max_entries=2)
+            for idx, text in enumerate(["old", "mid", "new"]):
+                store._now = 1000.0 + idx
+                store.set(text, [float(idx)] * 4)
+            store.save()
+            self.assertEqual(store.evicted, 1)
+            reopened = EmbeddingStore(path, ttl_days=1)
+            reopened._now = 1001.0 + 86400 * 2
+            self.assertEqual(reopened.get("new"), [2.0] * 4)
+            self.assertIsNone(reopened.get("old"))
+            result = reopened.compact()
+            self.assertEqual(result["entries"], 1)
+            self.assertEqual(os.path.getsize(path + ".vec"), 16)
+            self.assertEqual(EmbeddingStore(path).get("new"), [2.0] * 4)
+
+    def test_two_stores_share_one_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "embeddings")
+            first = EmbeddingStore(path)
+            second = EmbeddingStore(path)
+            first.set("alpha", [1.0] * 4)
+            first.set("beta", [2.0] * 4)
+            first.save()
+            second.set("gamma", [3.0, 3.0])
+            second.set("alpha", [1.0] * 4)
+            second.save()
+            first.compact()
+            first.set("delta", [4.0])
+            first.save()
+            second.set("epsilon", [5.0] * 3)
+            second.save()
+            reopened = EmbeddingStore(path)
+            self.assertEqual(reopened.get("alpha"), [1.0] * 4)
+            self.assertEqual(reopened.get("beta"), [2.0] * 4)
+            self.assertEqual(reopened.get("gamma"), [3.0, 3.0])
+            self.assertEqual(reopened.get("delta"), [4.0])
+            self.assertEqual(reopened.get("epsilon"), [5.0] * 3)
+            self.assertEqual(len(reopened), 5)
+            self.assertEqual(second.get("delta"), [4.0])
+
+    def test_concurrent_saves_from_separate_processes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "embeddings")
+            context = multiprocessing.get_context("spawn")
+            workers = [context.Process(target=_save_store_entries, args=(path, worker)) for worker in range(4)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(60)
+            self.assertEqual([worker.exitcode for worker in workers], [0] * 4)
+            store = EmbeddingStore(path)
+            self.assertEqual(len(store), 4 * 20)
+            for worker in range(4):
+                for idx in range(20):
+                    self.assertEqual(store.get(f"{worker}:{idx}"), [float(worker), float(idx)])
+
+
+def _save_store_entries(path, worker):
+    for idx in range(20):
+        store = EmbeddingStore(path, max_entries=200)
+        store.set(f"{worker}:{idx}", [float(worker), float(idx)])
+        store.save()
+        if idx % 7 == 0:
+            store.compact()
+
+
+class EmbedManyTests(unittest.TestCase):
+    def test_dedupes_and_batches_only_cache_misses(self):
+        embedder = SemanticEmbedder(backend="hash")
+        embedder.backend = "sbert"
+        embedder.model = _RecordingModel()
+        embedder.cache.set("cached", [9.0, 9.0])
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            rows = embedder.embed_many(["alpha", "beta", "alpha", "", "cached", "gamma"], batch_size=2)
+        self.assertEqual(embedder.model.batches, [["alpha", "beta"], ["gamma"]])
+        self.assertEqual(rows, [[5.0, 1.0], [4.0, 1.0], [5.0, 1.0], [], [9.0, 9.0], [5.0, 1.0]])
+        self.assertEqual(embedder.embed("beta"), [4.0, 1.0])
+        self.assertEqual(len(embedder.model.batches), 2)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_model_backend_returns_a_matrix(self):
+        embedder = SemanticEmbedder(backend="hash")
+        embedder.backend = "sbert"
+        embedder.model = _RecordingModel()
+        matrix = embedder.embed_many(["alpha", "", "beta"])
+        self.assertEqual(matrix.shape, (3, 2))
+        self.assertEqual(matrix.tolist(), [[5.0, 1.0], [0.0, 0.0], [4.0, 1.0]])
+        self.assertEqual(_cosine_similarity(matrix[1], matrix[0]), 0.0)
+        self.assertAlmostEqual(_cosine_similarity(matrix[0], matrix[0]), 1.0, places=6)
+        self.assertIsInstance(SemanticEmbedder(backend="hash").embed_many(["alpha"]), list)
+
+
+class SparseHashBackendTests(unittest.TestCase):
+    def test_cosine_matches_token_overlap_without_collisions(self):
+        embedder = SemanticEmbedder(backend="hash_fast")
+        self.assertTrue(embedder.available)
+        text_a = "Cloud security architect leading platform strategy"
+        text_b = "Platform strategy lead for cloud operations"
+        vec_a = embedder.embed(text_a)
+        vec_b = embedder.embed(text_b)
+        self.assertIs(embedder.embed(text_a), vec_a)
+        self.assertEqual(len(vec_a), len(tokenize(text_a)))
+        self.assertAlmostEqual(_cosine_similarity(vec_a, vec_a), 1.0)
+        tokens_a = tokenize(text_a)
+        tokens_b = tokenize(text_b)
+        expected = len(tokens_a & tokens_b) / math.sqrt(len(tokens_a) * len(tokens_b))
+        self.assertAlmostEqual(_cosine_similarity(vec_a, vec_b), expected)
+
+    def test_dims_bound_the_index_space(self):
+        embedder = SemanticEmbedder(backend="hash_fast", dims=8)
+        vec = embedder.embed("alpha beta gamma delta epsilon zeta eta theta iota kappa")
+        self.assertTrue(all(0 <= idx < 8 for idx in vec))
+        self.assertEqual(embedder.embed_many(["", "alpha"])[0], [])
+
+    def test_sparse_vectors_share_a_bounded_cache(self):
+        _cached_sparse_hash_embedding.cache_clear()
+        first = SemanticEmbedder(backend="hash_fast")
+        second = SemanticEmbedder(backend="hash_fast")
+        self.assertIs(first.embed("cloud security"), second.embed("cloud security"))
+        for idx in range(SPARSE_CACHE_SIZE + 10):
+            first.embed(f"token{idx} platform")
+        self.assertEqual(_cached_sparse_hash_embedding.cache_info().currsize, SPARSE_CACHE_SIZE)
+
+
+class BM25IndexTests(unittest.TestCase):
+    def test_rare_terms_outweigh_boilerplate(self):
+        documents = [
+            "Team player role with great benefits and kubernetes platform work",
+            "Team player role with great benefits",
+            "Team player role with great benefits and office snacks",
+        ]
+        index = BM25Index(documents)
+        query = "kubernetes team player benefits"
+        scores, peak = index.score_all(query)
+        self.assertEqual(scores.index(peak), 0)
+        self.assertEqual(index.similarity(query, documents[0]), 1.0)
+        self.assertLess(index.similarity(query, documents[2]), index.similarity(query, documents[1]))
+        self.assertGreater(index.similarity(query, "kubernetes operator"), 0.0)
+        self.assertEqual(index.similarity(query, ""), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import copy
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from modules import extract_profile
+from modules.extract_profile import _load_web_documents, _web_fingerprints
+from utils.io import load_config, read_json
+from utils.web import WebCache, cached_text
+
+PAGES = {
+    "/": '<a href="/library/a">A</a> <a href="/library/b">B</a> <a href="/about">About</a>'
+    ' <a href="http://example.invalid/library/x">X</a>',
+    "/library/a": '<p>Python and cloud security.</p><a href="/library/deep">Deep</a>',
+    "/library/b": "<p>Stakeholder management.</p>",
+    "/library/deep": "<p>Governance roadmap.</p>",
+    "/about": "<p>About page.</p>",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests = []
+    failing = set()
+
+    def do_GET(self):
+        if self.path in _Handler.failing:
+            _Handler.requests.append((self.path, 503))
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = PAGES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        etag = '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:16] + '"'
+        not_modified = self.headers.get("If-None-Match") == etag
+        _Handler.requests.append((self.path, 304 if not_modified else 200))
+        if not_modified:
+            self.send_response(304)
+            self.end_headers()
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class WebProfileCrawlTests(unittest.TestCase):
+    def setUp(self):
+        _Handler.requests = []
+        _Handler.failing = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.host = f"127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _config(self, tmpdir, **web):
+        config = copy.deepcopy(load_config("tests/fixtures/config/applicant.yaml"))
+        config["paths"]["output_dir"] = os.path.join(tmpdir, "output")
+        config["paths"]["logs_dir"] = os.path.join(tmpdir, "logs")
+        config["web_profile"] = {
+            "enabled": True,
+            "urls": [f"http://{self.host}/"],
+            "allowed_domains": [self.host],
+            "follow_patterns": ["library"],
+            "max_pages": 0,
+            "max_workers": 3,
+            "max_per_domain": 2,
+            **web,
+        }
+        return config
+
+    def test_bounded_bfs_keeps_order_and_revalidates_from_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = self._config(tmpdir)
+            docs = _load_web_documents(config, os.path.join(tmpdir, "texts"))
+            paths = [doc.path.split(self.host, 1)[1] for doc in docs]
+            self.assertEqual(paths, ["/", "/library/a", "/library/b"])
+            self.assertEqual(sorted(os.listdir(os.path.join(tmpdir, "texts"))), ["web_1.txt", "web_2.txt", "web_3.txt"])
+
+            _Handler.requests = []
+            parse = mock.patch.object(extract_profile, "html_to_text", wraps=extract_profile.html_to_text)
+            with parse as parsed:
+                warm = _load_web_documents(self._config(tmpdir, max_depth=2), None)
+            self.assertEqual(parsed.call_count, 1)
+            cold_prints = _web_fingerprints(config, docs)
+            warm_prints = _web_fingerprints(config, warm)
+            self.assertEqual({path: warm_prints[path] for path in cold_prints}, cold_prints)
+            self.assertTrue(all(value[1].startswith('"') for value in cold_prints.values()))
+            self.assertEqual([doc.path.split(self.host, 1)[1] for doc in warm], paths + ["/library/deep"])
+            self.assertEqual([doc.content for doc in warm[:3]], [doc.content for doc in docs])
+            self.assertEqual(
+                sorted(_Handler.requests),
+                [("/", 304), ("/library/a", 304), ("/library/b", 304), ("/library/deep", 200)],
+            )
+
+            _Handler.requests = []
+            uncached = self._config(tmpdir, max_depth=2, max_pages=1, cache={"enabled": False})
+            limited = _load_web_documents(uncached, None)
+            self.assertEqual([doc.path.split(self.host, 1)[1] for doc in limited], ["/", "/library/a"])
+            self.assertTrue(all(status == 200 for _, status in _Handler.requests))
+
+    def test_removed_pages_leave_the_cache_and_outages_use_the_stored_body(self):
+        removed = f"http://{self.host}/library/b"
+        failing = f"http://{self.host}/library/a"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = self._config(tmpdir)
+            cache_dir = os.path.join(tmpdir, "output", "web_cache")
+            cold = _load_web_documents(config, None)
+            cold_prints = _web_fingerprints(config, cold)
+            used_at = WebCache(cache_dir).entry(failing)["used_at"]
+            _Handler.failing = {"/library/a"}
+            with mock.patch.dict(PAGES):
+                del PAGES["/library/b"]
+                warm = _load_web_documents(config, None)
+            warm_prints = _web_fingerprints(config, warm)
+            cache = WebCache(cache_dir)
+        by_path = {doc.path: doc for doc in warm}
+        self.assertEqual(by_path[f"web:{removed}"].status, "error")
+        self.assertIn("404", by_path[f"web:{removed}"].notes)
+        self.assertIsNone(cache.entry(removed))
+        self.assertNotEqual(warm_prints[f"web:{removed}"], cold_prints[f"web:{removed}"])
+        self.assertEqual(by_path[f"web:{failing}"].status, "ok")
+        self.assertIn("cached (fetch failed", by_path[f"web:{failing}"].notes)
+        self.assertEqual(cache.entry(failing)["used_at"], used_at)
+
+    def test_cache_prunes_unused_entries_and_orphaned_texts(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = WebCache(tmpdir, max_age_days=1)
+            for url in ("http://a/old", "http://a/new"):
+                cache.store(url, url.encode("utf-8"), {"ETag": '"1"'})
+                self.assertEqual(cached_text(cache, url.encode("utf-8"), "html", lambda data: data.decode("utf-8")), url)
+            cache.store_text("0" * 64, "html", "orphan")
+            cache._entries["http://a/old"]["used_at"] = time.time() - 2 * 86400
+            cache.save()
+            index = read_json(os.path.join(tmpdir, "index.json"))
+            files = sorted(name.rsplit(".", 1)[1] for name in os.listdir(tmpdir))
+
+            reopened = WebCache(tmpdir)
+            self.assertEqual(cached_text(reopened, b"http://a/new", "html", lambda data: "reparsed"), "http://a/new")
+            self.assertEqual(cached_text(reopened, b"http://a/new", "pdf:40:0", lambda data: "reparsed"), "reparsed")
+        self.assertEqual(list(index["entries"]), ["http://a/new"])
+        self.assertEqual(files, ["body", "json", "txt"])
+        self.assertEqual(cache.stats()["pruned"], 1)
+        self.assertEqual(reopened.stats()["text_hits"], 1)
+
+    def test_allowed_domains_block_configured_urls(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = self._config(tmpdir, urls=["http://example.invalid/", f"http://{self.host}/library/b"])
+            docs = _load_web_documents(config, None)
+        self.assertEqual([doc.status for doc in docs], ["blocked", "ok"])
+        self.assertEqual(_Handler.requests, [("/library/b", 200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
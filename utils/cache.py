@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+
+from utils.io import write_json
+
+
+def stable_hash(value):
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisCache:
+    def __init__(self, path=None):
+        self.path = path
+        self._entries = {}
+        self._touched = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and isinstance(data.get("entries"), dict):
+                    self._entries = data["entries"]
+            except Exception:
+                self._entries = {}
+
+    def get(self, key):
+        self._touched.add(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def set(self, key, features):
+        self._touched.add(key)
+        self._entries[key] = features
+        self._dirty = True
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._touched),
+            "pruned": len(set(self._entries) - self._touched),
+        }
+
+    def save(self):
+        if not self.path:
+            return
+        stale = set(self._entries) - self._touched
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            self._entries.pop(key, None)
+        write_json({"entries": self._entries}, self.path)
+        self._dirty = False
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DocumentTextCache:
+    def __init__(self, path=None, version=1):
+        self.path = path
+        self.version = version
+        self._entries = {}
+        self._digests = {}
+        self._touched = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == version and isinstance(data.get("entries"), dict):
+                    self._entries = data["entries"]
+            except Exception:
+                self._entries = {}
+
+    def get(self, path):
+        self._touched.add(path)
+        entry = self._entries.get(path)
+        try:
+            stat = os.stat(path)
+            if entry and entry.get("size") == stat.st_size and entry.get("mtime") == stat.st_mtime_ns:
+                self.hits += 1
+                return self._hit(entry)
+            digest = file_sha256(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self._digests[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        if entry and entry.get("size") == stat.st_size and entry.get("sha256") == digest:
+            entry["mtime"] = stat.st_mtime_ns
+            self._dirty = True
+            self.hits += 1
+            return self._hit(entry)
+        self.misses += 1
+        return None
+
+    @staticmethod
+    def _hit(entry):
+        # The stored parse_ms describes the original parse; a hit costs none.
+        return {**entry, "parse_ms": 0.0, "cached": True}
+
+    def set(self, path, record):
+        self._touched.add(path)
+        fingerprint = self._digests.get(path)
+        if fingerprint is None:
+            try:
+                stat = os.stat(path)
+                fingerprint = (stat.st_size, stat.st_mtime_ns, file_sha256(path))
+            except OSError:
+                return
+        size, mtime, digest = fingerprint
+        self._entries[path] = {**record, "size": size, "mtime": mtime, "sha256": digest}
+        self._dirty = True
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._touched)}
+
+    def save(self):
+        if not self.path:
+            return
+        stale = set(self._entries) - self._touched
+        if not self._dirty and not stale:
+            return
+        for key in stale:
+            self._entries.pop(key, None)
+        write_json({"version": self.version, "entries": self._entries}, self.path)
+        self._dirty = False
@@ -82,3 +82,53 @@ def upsert_job_state(config, job_id, score, recommendation):
             (job_id, score, recommendation, updated_at),
         )
     return updated_at
+
+
+class JobStateWriter:
+    def __init__(self, config, batch_size=None):
+        self.path = _db_path(config)
+        if batch_size is None:
+            batch_size = config.get("db", {}).get("batch_size", 500)
+        try:
+            batch_size = int(batch_size)
+        except (TypeError, ValueError):
+            batch_size = 500
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self._pending = {}
+        self._schema_ready = False
+
+    def add(self, job_id, score, recommendation):
+        self._pending[job_id] = (score, recommendation)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return 0
+        updated_at = datetime.utcnow().isoformat() + "Z"
+        rows = [(job_id, score, recommendation, updated_at) for job_id, (score, recommendation) in self._pending.items()]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                self._schema_ready = True
+            with conn:
+                conn.executemany(
+                    "INSERT INTO job_states (job_id, score, recommendation, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(job_id) DO UPDATE SET score=excluded.score, recommendation=excluded.recommendation, updated_at=excluded.updated_at",
+                    rows,
+                )
+        finally:
+            conn.close()
+        self._pending = {}
+        self.written += len(rows)
+        return len(rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
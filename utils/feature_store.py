@@ -0,0 +1,98 @@
+import json
+import os
+import sqlite3
+
+
+FEATURE_COLUMNS = (
+    "skills",
+    "skills_semantic",
+    "coverage",
+    "title",
+    "experience",
+    "language",
+    "location",
+    "alignment",
+    "intent_adjustment",
+    "feedback_adjustment",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_features (
+    position INTEGER PRIMARY KEY,
+    job_id TEXT,
+    {columns},
+    sales_guard INTEGER NOT NULL,
+    role_intent TEXT NOT NULL,
+    job_intent_tags TEXT NOT NULL,
+    pruned INTEGER NOT NULL DEFAULT 0,
+    upper_bound REAL
+);
+""".format(columns=",\n    ".join(f"{column} REAL NOT NULL" for column in FEATURE_COLUMNS))
+
+
+def feature_store_path(config):
+    path = (config.get("matching", {}).get("feature_store", {}) or {}).get("path")
+    return path or os.path.join(config["paths"]["output_dir"], "job_features.db")
+
+
+def write_features(path, rows):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    columns = ("position", "job_id") + FEATURE_COLUMNS + ("sales_guard", "role_intent", "job_intent_tags", "pruned", "upper_bound")
+    records = [
+        (
+            idx,
+            None if row.get("job_id") is None else str(row.get("job_id")),
+            *[float(row.get(column, 0.0) or 0.0) for column in FEATURE_COLUMNS],
+            1 if row.get("sales_guard") else 0,
+            row.get("role_intent") or "",
+            json.dumps(sorted(row.get("job_intent_tags") or [])),
+            1 if row.get("pruned") else 0,
+            None if row.get("upper_bound") is None else float(row.get("upper_bound")),
+        )
+        for idx, row in enumerate(rows)
+    ]
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.executemany(
+                f"INSERT INTO job_features ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                records,
+            )
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+def load_features(path):
+    if not path or not os.path.exists(path):
+        return []
+    conn = sqlite3.connect(path)
+    try:
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM job_features ORDER BY position").fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+    features = []
+    for row in rows:
+        item = {column: row[column] for column in FEATURE_COLUMNS}
+        item["job_id"] = row["job_id"]
+        item["sales_guard"] = bool(row["sales_guard"])
+        item["role_intent"] = row["role_intent"]
+        try:
+            item["job_intent_tags"] = json.loads(row["job_intent_tags"])
+        except Exception:
+            item["job_intent_tags"] = []
+        keys = row.keys()
+        item["pruned"] = bool(row["pruned"]) if "pruned" in keys else False
+        item["upper_bound"] = row["upper_bound"] if "upper_bound" in keys else None
+        features.append(item)
+    return features
@@ -4,7 +4,14 @@ import io
 import zipfile
 import base64
 import hashlib
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
 EXPORT_FORMAT = "applicant-export-v1"
 
 DEFAULT_CONFIG = {
@@ -21,6 +28,14 @@ DEFAULT_CONFIG = {
         "email": "",
         "source_exclude": ["Sources/ICAR", "ICAR_"],
         "committee": {"min_score": 2},
+        "incremental": True,
+        "parsing": {
+            "workers": 1,
+            "timeout_seconds": 120,
+            "max_pages": 40,
+            "max_chars": 200000,
+            "cache": {"enabled": True, "path": ""},
+        },
     },
     "web_profile": {
         "enabled": True,
@@ -29,6 +44,11 @@ DEFAULT_CONFIG = {
         "follow_library": True,
         "follow_patterns": ["library"],
         "max_pages": 5,
+        "max_depth": 1,
+        "max_workers": 4,
+        "max_per_domain": 2,
+        "timeout_seconds": 10,
+        "cache": {"enabled": True, "path": ""},
     },
     "language": {"default": "en", "supported": ["en", "de"]},
     "discovery": {"source_policy": {"mode": "advisory"}},
@@ -51,8 +71,30 @@ DEFAULT_CONFIG = {
             "backend": "hash",
             "model_path": "",
             "cache_path": "",
+            "cache_max_entries": 0,
+            "cache_ttl_days": 0,
+            "batch_size": 64,
+            "dims": 0,
+            "bm25": {"k1": 1.5, "b": 0.75},
+        },
+        "analysis_cache": {
+            "enabled": True,
+            "path": "",
+        },
+        "feature_store": {
+            "enabled": True,
+            "path": "",
+        },
+        "pruning": {
+            "enabled": False,
+        },
+        "match_index": {
+            "enabled": True,
+            "shard_size": 100,
+            "preview_chars": 1200,
         },
         "top_n": 5,
+        "workers": 1,
         "min_score": 0.1,
         "apply_threshold": 0.25,
         "consider_threshold": 0.15,
@@ -219,6 +261,7 @@ DEFAULT_CONFIG = {
         "env": "dev",
         "path": "db/applicant.db",
         "dev_path": "db/applicant_dev.db",
+        "batch_size": 500,
     },
     "skills_seed": {
         "hard": ["AI", "ML", "NLP", "Python", "Strategy", "Consulting", "Data Analysis", "Product", "Cloud", "Automation"],
@@ -253,10 +296,61 @@ def read_json(path):
         return json.load(f)
 
 
+_FILE_LOCKS = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def file_lock(path):
+    key = os.path.abspath(path)
+    with _FILE_LOCKS_GUARD:
+        lock = _FILE_LOCKS.get(key)
+        if lock is None:
+            lock = threading.RLock()
+            _FILE_LOCKS[key] = lock
+        return lock
+
+
+_PROCESS_LOCK_DEPTH = {}
+
+
+@contextmanager
+def process_lock(path):
+    """Hold file_lock(path) plus an exclusive flock on the file at path.
+
+    Re-entrant within a thread; on platforms without fcntl only the
+    in-process lock is taken.
+    """
+    key = os.path.abspath(path)
+    with file_lock(key):
+        depth = _PROCESS_LOCK_DEPTH.get(key, 0)
+        if depth or fcntl is None:
+            _PROCESS_LOCK_DEPTH[key] = depth + 1
+            try:
+                yield
+            finally:
+                _PROCESS_LOCK_DEPTH[key] = depth
+            return
+        ensure_dir(os.path.dirname(key))
+        with open(key, "a+b") as handle:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            _PROCESS_LOCK_DEPTH[key] = 1
+            try:
+                yield
+            finally:
+                _PROCESS_LOCK_DEPTH.pop(key, None)
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
 def write_json(data, path):
     ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def write_text(text, path):
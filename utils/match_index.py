@@ -0,0 +1,198 @@
+import os
+
+from utils.io import ensure_dir, file_lock, read_json, write_json
+
+
+INDEX_FILENAME = "matched_jobs_index.json"
+MATCHES_FILENAME = "matched_jobs.json"
+DETAIL_DIRNAME = "match_details"
+INDEX_KEYS = (
+    "id",
+    "score",
+    "score_raw",
+    "score_preset",
+    "score_intent_adjusted",
+    "score_adjusted",
+    "recommendation",
+    "recommendation_reason",
+    "out_of_scope",
+    "preset_name",
+    "adjusted_by",
+    "feedback_applied",
+    "cluster_id",
+    "cluster_size",
+    "job_facts",
+    "alignment",
+    "pruned",
+)
+INDEX_JOB_KEYS = ("id", "job_id", "title", "company", "location", "language", "source", "url", "committee_review")
+
+
+def match_index_settings(config):
+    settings = config.get("matching", {}).get("match_index", {}) or {}
+    return {
+        "enabled": settings.get("enabled", True),
+        "shard_size": max(1, int(settings.get("shard_size", 100) or 100)),
+        "preview_chars": max(0, int(settings.get("preview_chars", 1200) or 0)),
+        "write_full": settings.get("write_full", True),
+    }
+
+
+def match_index_path(output_dir):
+    return os.path.join(output_dir, INDEX_FILENAME)
+
+
+def slim_match(match, preview_chars=1200, shard=None):
+    entry = {key: match[key] for key in INDEX_KEYS if key in match}
+    job = match.get("job", {}) or {}
+    slim_job = {key: job[key] for key in INDEX_JOB_KEYS if key in job}
+    description = job.get("description") or ""
+    if len(description) > preview_chars:
+        slim_job["description"] = description[:preview_chars].rstrip()
+        slim_job["description_truncated"] = True
+    else:
+        slim_job["description"] = description
+    entry["job"] = slim_job
+    qualification = match.get("qualification", {}) or {}
+    requirements = qualification.get("requirements") or []
+    entry["qualification"] = {
+        "coverage": qualification.get("coverage", 0.0),
+        "coverage_reason": qualification.get("coverage_reason", ""),
+        "gaps": qualification.get("gaps", []),
+        "requirement_count": len(requirements),
+        "requirements_matched": sum(1 for row in requirements if row.get("status") == "matched"),
+    }
+    if shard:
+        entry["detail_shard"] = shard
+    return entry
+
+
+def write_match_index(output_dir, results, shard_size=100, preview_chars=1200):
+    detail_dir = os.path.join(output_dir, DETAIL_DIRNAME)
+    ensure_dir(detail_dir)
+    shards = []
+    entries = []
+    for start in range(0, len(results), shard_size):
+        name = f"shard_{len(shards):05d}.json"
+        chunk = results[start : start + shard_size]
+        write_json({str(match.get("id")): match for match in chunk}, os.path.join(detail_dir, name))
+        shards.append(name)
+        entries.extend(slim_match(match, preview_chars, shard=name) for match in chunk)
+    for name in os.listdir(detail_dir):
+        if name.startswith("shard_") and name.endswith(".json") and name not in shards:
+            os.remove(os.path.join(detail_dir, name))
+    write_json(
+        {
+            "total": len(entries),
+            "shard_size": shard_size,
+            "preview_chars": preview_chars,
+            "shards": shards,
+            "matches": entries,
+        },
+        match_index_path(output_dir),
+    )
+    return len(shards)
+
+
+def load_match_index(output_dir):
+    path = match_index_path(output_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        index = read_json(path)
+    except Exception:
+        return None
+    if not isinstance(index, dict) or not isinstance(index.get("matches"), list):
+        return None
+    return index
+
+
+def load_matches(output_dir):
+    """Full ranked matches from matched_jobs.json, else rebuilt from the detail shards."""
+    matches_path = os.path.join(output_dir, MATCHES_FILENAME)
+    if os.path.exists(matches_path):
+        return read_json(matches_path)
+    index = load_match_index(output_dir)
+    if index is None:
+        return []
+    details = {}
+    for shard in index.get("shards") or []:
+        shard_path = os.path.join(output_dir, DETAIL_DIRNAME, os.path.basename(shard))
+        if os.path.exists(shard_path):
+            details.update(read_json(shard_path))
+    return [details[str(entry.get("id"))] for entry in index["matches"] if str(entry.get("id")) in details]
+
+
+def matches_available(output_dir):
+    return os.path.exists(os.path.join(output_dir, MATCHES_FILENAME)) or os.path.exists(match_index_path(output_dir))
+
+
+def load_match_detail(output_dir, job_id, index=None):
+    job_id = str(job_id)
+    index = index if index is not None else load_match_index(output_dir)
+    if index is not None:
+        shard = next((entry.get("detail_shard") for entry in index["matches"] if str(entry.get("id")) == job_id), None)
+        if not shard:
+            return None
+        shard_path = os.path.join(output_dir, DETAIL_DIRNAME, os.path.basename(shard))
+        if os.path.exists(shard_path):
+            try:
+                return read_json(shard_path).get(job_id)
+            except Exception:
+                pass
+    matches_path = os.path.join(output_dir, "matched_jobs.json")
+    if not os.path.exists(matches_path):
+        return None
+    return next((match for match in read_json(matches_path) if str(match.get("id")) == job_id), None)
+
+
+def save_match_detail(output_dir, match):
+    with file_lock(os.path.join(output_dir, "matched_jobs.json")):
+        return _save_match_detail(output_dir, match)
+
+
+def _rank_key(match):
+    return (-(match.get("score") or 0.0), str(match.get("id") or ""))
+
+
+def _replace_match(matches, match):
+    job_id = str(match.get("id"))
+    for idx, existing in enumerate(matches):
+        if str(existing.get("id")) == job_id:
+            matches[idx] = match
+            matches.sort(key=_rank_key)
+            return True
+    return False
+
+
+def _save_match_detail(output_dir, match):
+    # An expanded match replaces its pruned placeholder everywhere it is
+    # stored (shard, index entry and matched_jobs.json) so every reader sees
+    # the same score, flags and rank.
+    job_id = str(match.get("id"))
+    matches_path = os.path.join(output_dir, MATCHES_FILENAME)
+    index = load_match_index(output_dir)
+    if index is not None:
+        shard = next((entry.get("detail_shard") for entry in index["matches"] if str(entry.get("id")) == job_id), None)
+        shard_path = os.path.join(output_dir, DETAIL_DIRNAME, os.path.basename(shard)) if shard else ""
+        if not shard_path or not os.path.exists(shard_path):
+            return False
+        details = read_json(shard_path)
+        if job_id not in details:
+            return False
+        details[job_id] = match
+        _replace_match(index["matches"], slim_match(match, index.get("preview_chars", 1200), shard=shard))
+        write_json(details, shard_path)
+        write_json(index, match_index_path(output_dir))
+        if os.path.exists(matches_path):
+            matches = read_json(matches_path)
+            if _replace_match(matches, match):
+                write_json(matches, matches_path)
+        return True
+    if not os.path.exists(matches_path):
+        return False
+    matches = read_json(matches_path)
+    if not _replace_match(matches, match):
+        return False
+    write_json(matches, matches_path)
+    return True
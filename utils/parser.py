@@ -1,20 +1,83 @@
+import multiprocessing
 import os
 import re
+import signal
 import subprocess
+import tempfile
+import threading
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from xml.etree.ElementTree import ParseError, iterparse
+
+from utils.cache import DocumentTextCache
+
+
+TEXT_CACHE_VERSION = 3
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DOCX_PARAGRAPH = f"{WORD_NS}p"
+DOCX_TEXT = f"{WORD_NS}t"
+DOCX_BREAKS = {f"{WORD_NS}tab": "\t", f"{WORD_NS}br": "\n", f"{WORD_NS}cr": "\n"}
+DOCX_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+UNCACHED_METHODS = {"timeout", "error", "unavailable"}
 
 
 class Document:
-    def __init__(self, path, content, file_type, status, notes):
+    def __init__(self, path, content, file_type, status, notes, method="", cache="", pages=0, truncated=False, parse_ms=0.0):
         self.path = path
         self.content = content
         self.file_type = file_type
         self.status = status
         self.notes = notes
+        self.method = method
+        self.cache = cache
+        self.pages = pages
+        self.truncated = truncated
+        self.parse_ms = parse_ms
 
 
-def _docx_to_text(path):
-    with zipfile.ZipFile(path) as z:
+def iter_docx_paragraphs(source):
+    # Paragraphs nested in text boxes (w:txbxContent) are yielded on their own,
+    # ahead of the paragraph that anchors them, instead of splitting it.
+    # mc:Fallback copies of the same content are skipped. Every element is
+    # detached from its parent once it ends, so memory stays flat.
+    with zipfile.ZipFile(source) as z:
+        with z.open("word/document.xml") as xml:
+            stack = []
+            paragraphs = []
+            fallback = 0
+            for event, elem in iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    stack.append(elem)
+                    if tag == DOCX_PARAGRAPH:
+                        paragraphs.append([])
+                    elif tag == DOCX_FALLBACK:
+                        fallback += 1
+                    continue
+                stack.pop()
+                if tag == DOCX_PARAGRAPH:
+                    text = "".join(paragraphs.pop())
+                    if not fallback:
+                        yield text
+                elif tag == DOCX_FALLBACK:
+                    fallback -= 1
+                elif paragraphs and not fallback:
+                    if tag == DOCX_TEXT:
+                        paragraphs[-1].append(elem.text or "")
+                    elif tag in DOCX_BREAKS:
+                        paragraphs[-1].append(DOCX_BREAKS[tag])
+                if stack:
+                    stack[-1].remove(elem)
+                else:
+                    elem.clear()
+
+
+def _docx_to_text_regex(source):
+    with zipfile.ZipFile(source) as z:
         xml = z.read("word/document.xml").decode("utf-8", errors="ignore")
     xml = re.sub(r"</w:p>", "\n", xml)
     text = re.sub(r"<[^>]+>", "", xml)
@@ -22,32 +85,141 @@ def _docx_to_text(path):
     return text.strip()
 
 
-def _pdf_to_text(path):
+def docx_to_text(source):
     try:
-        from pypdf import PdfReader  # type: ignore
+        text = "\n".join(iter_docx_paragraphs(source))
+    except ParseError:
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return _docx_to_text_regex(source)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
 
-        reader = PdfReader(path)
-        parts = []
-        for page in reader.pages:
-            parts.append(page.extract_text() or "")
-        return "\n".join(parts).strip(), "pypdf"
-    except Exception:
-        pass
 
+def iter_pdf_pages(reader, max_pages=0):
+    total = len(reader.pages)
+    for index in range(min(total, max_pages) if max_pages else total):
+        yield reader.pages[index].extract_text() or ""
+
+
+def _limit_pdf_text(parts, total_pages, max_chars=0):
+    text = "\n".join(parts).strip()
+    truncated = len(parts) < total_pages
+    if max_chars and len(text) > max_chars:
+        text = text[:max_chars].rstrip()
+        truncated = True
+    return text, truncated
+
+
+def _open_pdf_reader(source):
+    from pypdf import PdfReader  # type: ignore
+
+    return PdfReader(source)
+
+
+def _pypdf_text(source, max_pages=0, max_chars=0):
+    reader = _open_pdf_reader(source)
+    parts = []
+    chars = 0
+    for text in iter_pdf_pages(reader, max_pages=max_pages):
+        parts.append(text)
+        chars += len(text) + 1
+        if max_chars and chars > max_chars:
+            break
+    content, truncated = _limit_pdf_text(parts, len(reader.pages), max_chars=max_chars)
+    return {"content": content, "method": "pypdf", "pages": len(parts), "truncated": truncated}
+
+
+def _pdf_page_count(path, timeout=None):
     try:
         result = subprocess.run(
-            ["pdftotext", path, "-"],
+            ["pdfinfo", path],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
             text=True,
+            timeout=timeout,
         )
-        if result.stdout:
-            return result.stdout.strip(), "pdftotext"
+    except Exception:
+        return 0
+    match = re.search(r"^Pages:\s+(\d+)", result.stdout or "", re.MULTILINE)
+    return int(match.group(1)) if match else 0
+
+
+def _pdftotext_text(path, timeout=None, max_pages=0, max_chars=0):
+    command = ["pdftotext"] + (["-l", str(max_pages)] if max_pages else []) + [path, "-"]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    timed_out = []
+
+    def _kill():
+        timed_out.append(True)
+        process.kill()
+
+    timer = threading.Timer(timeout, _kill) if timeout else None
+    parts = []
+    pending = ""
+    chars = 0
+    stopped = False
+    try:
+        if timer:
+            timer.start()
+        for chunk in iter(lambda: process.stdout.read(8192), ""):
+            pages = (pending + chunk).split("\f")
+            pending = pages.pop()
+            for page in pages:
+                parts.append(page)
+                chars += len(page) + 1
+            if max_chars and chars + len(pending) > max_chars:
+                stopped = True
+                break
+    finally:
+        if timer:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+    if timed_out:
+        raise subprocess.TimeoutExpired(command, timeout)
+    if pending:
+        parts.append(pending)
+    if not "".join(parts):
+        return None
+    total_pages = len(parts)
+    if stopped:
+        total_pages += 1
+    elif max_pages and len(parts) >= max_pages:
+        total_pages = _pdf_page_count(path, timeout=timeout) or len(parts) + 1
+    content, truncated = _limit_pdf_text(parts, total_pages, max_chars=max_chars)
+    return {"content": content, "method": "pdftotext", "pages": len(parts), "truncated": truncated}
+
+
+def pdf_to_text(source, timeout=None, max_pages=0, max_chars=0):
+    data = source if isinstance(source, (bytes, bytearray)) else None
+    try:
+        return _pypdf_text(BytesIO(data) if data is not None else source, max_pages=max_pages, max_chars=max_chars)
     except Exception:
         pass
 
-    return "", "unavailable"
+    temp_path = None
+    try:
+        if data is not None:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+                tmp.write(data)
+                temp_path = tmp.name
+        parsed = _pdftotext_text(temp_path or source, timeout=timeout, max_pages=max_pages, max_chars=max_chars)
+        if parsed:
+            return parsed
+    except Exception:
+        pass
+    finally:
+        if temp_path:
+            try:
+                os.unlink(temp_path)
+            except Exception:
+                pass
+
+    return {"content": "", "method": "unavailable", "pages": 0, "truncated": False}
 
 
 def _read_text(path):
@@ -59,46 +231,177 @@ def _safe_name(path):
     return re.sub(r"[^a-zA-Z0-9._-]+", "_", path)
 
 
-def load_documents(folder_path, output_text_dir=None):
-    documents = []
+def _parse_document(path, timeout=None, max_pages=0, max_chars=0):
+    started = time.perf_counter()
+    ext = os.path.splitext(path)[1].lower()
+    record = {"content": "", "status": "skipped", "notes": "", "method": "", "pages": 0, "truncated": False}
+
+    if ext in {".txt", ".md"}:
+        record.update(content=_read_text(path), status="ok", method="text")
+    elif ext == ".docx":
+        record["method"] = "docx"
+        try:
+            record.update(content=docx_to_text(path), status="ok")
+        except Exception as exc:
+            record["notes"] = f"docx parse failed: {exc}"
+    elif ext == ".pdf":
+        record.update(pdf_to_text(path, timeout=timeout, max_pages=max_pages, max_chars=max_chars))
+        if record["content"]:
+            record["status"] = "ok"
+            record["notes"] = f"pdf parsed via {record['method']}"
+            if record["truncated"]:
+                record["notes"] += f" (stopped after {record['pages']} pages, {len(record['content'])} chars)"
+        else:
+            record["notes"] = "pdf parsing unavailable"
+    else:
+        record["notes"] = "unsupported file type"
+    record["parse_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return record
+
+
+def _failed_record(notes, method):
+    return {"content": "", "status": "skipped", "notes": notes, "method": method, "pages": 0, "truncated": False, "parse_ms": 0.0}
+
+
+def walk_documents(folder_path):
+    paths = []
     for root, _, files in os.walk(folder_path):
         for filename in files:
             if filename.startswith("."):
                 continue
-            path = os.path.join(root, filename)
-            ext = os.path.splitext(filename)[1].lower()
-            content = ""
-            status = "skipped"
-            notes = ""
-
-            if ext in {".txt", ".md"}:
-                content = _read_text(path)
-                status = "ok"
-            elif ext == ".docx":
+            paths.append(os.path.join(root, filename))
+    return paths
+
+
+def _init_parse_worker(pids):
+    pids.put(os.getpid())
+
+
+def _stop_executor(executor, pids):
+    # Hung workers must die before shutdown can join them. kill_workers is
+    # public from Python 3.14; older versions kill the pids the workers
+    # reported on start-up.
+    kill_workers = getattr(executor, "kill_workers", None)
+    if kill_workers is not None:
+        kill_workers()
+    else:
+        while not pids.empty():
+            try:
+                os.kill(pids.get(), getattr(signal, "SIGKILL", signal.SIGTERM))
+            except OSError:
+                pass
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _parse_documents_pooled(paths, workers, timeout=None, max_pages=0, max_chars=0):
+    parsed = [None] * len(paths)
+    queue = deque(range(len(paths)))
+    running = {}
+    executor = None
+    pids = None
+    try:
+        while queue or running:
+            if executor is None:
+                pids = multiprocessing.SimpleQueue()
+                executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker, initargs=(pids,))
+            while queue and len(running) < workers:
+                idx = queue.popleft()
+                future = executor.submit(_parse_document, paths[idx], timeout, max_pages, max_chars)
+                running[future] = (idx, time.monotonic())
+            wait_for = None
+            if timeout:
+                oldest = min(started for _, started in running.values())
+                wait_for = max(0.0, oldest + timeout - time.monotonic())
+            done, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                idx, _ = running.pop(future)
                 try:
-                    content = _docx_to_text(path)
-                    status = "ok"
+                    parsed[idx] = future.result()
+                except BrokenProcessPool as exc:
+                    broken = True
+                    parsed[idx] = _failed_record(f"parse failed: {exc}", "error")
                 except Exception as exc:
-                    notes = f"docx parse failed: {exc}"
-            elif ext == ".pdf":
-                content, method = _pdf_to_text(path)
-                if content:
-                    status = "ok"
-                    notes = f"pdf parsed via {method}"
-                else:
-                    notes = "pdf parsing unavailable"
+                    parsed[idx] = _failed_record(f"parse failed: {exc}", "error")
+            now = time.monotonic()
+            expired = [future for future, (_, started) in running.items() if timeout and now - started >= timeout]
+            for future in expired:
+                idx, _ = running.pop(future)
+                parsed[idx] = _failed_record(f"parse timed out after {timeout}s", "timeout")
+            if expired or broken:
+                queue.extendleft(sorted((idx for idx, _ in running.values()), reverse=True))
+                running = {}
+                _stop_executor(executor, pids)
+                executor = None
+    finally:
+        if executor is not None:
+            if running:
+                _stop_executor(executor, pids)
             else:
-                notes = "unsupported file type"
+                executor.shutdown(wait=True)
+    return parsed
 
-            if output_text_dir and content:
-                os.makedirs(output_text_dir, exist_ok=True)
-                out_name = _safe_name(os.path.relpath(path, folder_path)) + ".txt"
-                out_path = os.path.join(output_text_dir, out_name)
+
+def open_text_cache(path, max_pages=0, max_chars=0):
+    if not path:
+        return None
+    return DocumentTextCache(path, version=f"{TEXT_CACHE_VERSION}:{max_pages or 0}:{max_chars or 0}")
+
+
+def load_documents(folder_path, output_text_dir=None, workers=1, timeout=None, cache=None, max_pages=0, max_chars=0):
+    paths = walk_documents(folder_path)
+    parsed = {}
+    if cache is not None:
+        for path in paths:
+            entry = cache.get(path)
+            if entry is not None:
+                parsed[path] = entry
+    pending = [path for path in paths if path not in parsed]
+    workers = min(max(1, int(workers or 1)), max(1, len(pending)))
+    if pending and workers > 1:
+        parsed_pending = _parse_documents_pooled(pending, workers, timeout=timeout, max_pages=max_pages, max_chars=max_chars)
+    else:
+        parsed_pending = [
+            _parse_document(path, timeout=timeout, max_pages=max_pages, max_chars=max_chars) for path in pending
+        ]
+    for path, record in zip(pending, parsed_pending):
+        parsed[path] = record
+        if cache is not None and record["method"] not in UNCACHED_METHODS:
+            cache.set(path, record)
+
+    documents = []
+    for path in paths:
+        record = parsed[path]
+        content = record["content"]
+        ext = os.path.splitext(path)[1].lower()
+        cache_state = ""
+        if cache is not None:
+            cache_state = "miss" if path in pending else "hit"
+        if output_text_dir and content:
+            os.makedirs(output_text_dir, exist_ok=True)
+            out_name = _safe_name(os.path.relpath(path, folder_path)) + ".txt"
+            out_path = os.path.join(output_text_dir, out_name)
+            if cache_state != "hit" or not os.path.exists(out_path):
                 with open(out_path, "w", encoding="utf-8") as f:
                     f.write(content)
 
-            documents.append(Document(path, content, ext.lstrip("."), status, notes))
+        documents.append(
+            Document(
+                path,
+                content,
+                ext.lstrip("."),
+                record["status"],
+                record["notes"],
+                method=record["method"],
+                cache=cache_state,
+                pages=record.get("pages", 0),
+                truncated=record.get("truncated", False),
+                parse_ms=record.get("parse_ms", 0.0),
+            )
+        )
 
+    if cache is not None:
+        cache.save()
     return documents
 
 
@@ -112,6 +415,11 @@ def build_inventory(documents):
                 "status": doc.status,
                 "notes": doc.notes,
                 "char_count": len(doc.content or ""),
+                "method": doc.method,
+                "cache": doc.cache,
+                "pages": doc.pages,
+                "truncated": doc.truncated,
+                "parse_ms": doc.parse_ms,
             }
         )
     return inventory
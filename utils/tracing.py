@@ -0,0 +1,209 @@
+import functools
+import inspect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils.io import file_lock, load_config, read_json, write_json
+
+
+METRICS_FILENAME = "run_metrics.json"
+_STATE = threading.local()
+
+
+class Span:
+    def __init__(self, name, path, run=None):
+        self.name = name
+        self.path = path
+        self.run = run
+        self.calls = 0
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.counts = {}
+        self._started = None
+
+    def count(self, key, value=1):
+        self.counts[key] = self.counts.get(key, 0) + value
+        return self
+
+    def begin(self):
+        if self.run is not None:
+            self.run.stack.append(self)
+        self._started = (time.perf_counter(), time.process_time())
+        return self
+
+    def end(self, **counts):
+        if self._started is None:
+            return self
+        wall, cpu = self._started
+        self._started = None
+        self.calls += 1
+        self.wall_s += time.perf_counter() - wall
+        self.cpu_s += time.process_time() - cpu
+        for key, value in counts.items():
+            self.count(key, value)
+        if self.run is not None and self.run.stack and self.run.stack[-1] is self:
+            self.run.stack.pop()
+        return self
+
+    def merge(self, row):
+        self.calls += row.get("calls", 0)
+        self.wall_s += row.get("wall_s", 0.0)
+        self.cpu_s += row.get("cpu_s", 0.0)
+        for key, value in (row.get("counts") or {}).items():
+            self.count(key, value)
+        return self
+
+    def as_dict(self):
+        return {
+            "path": self.path,
+            "name": self.name,
+            "depth": self.path.count("/"),
+            "calls": self.calls,
+            "wall_s": round(self.wall_s, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "counts": dict(self.counts),
+        }
+
+
+class Run:
+    def __init__(self, name):
+        self.name = name
+        self.started_at = datetime.utcnow().isoformat() + "Z"
+        self.spans = {}
+        self.stack = []
+
+    def span(self, name):
+        path = f"{self.stack[-1].path}/{name}" if self.stack else name
+        entry = self.spans.get(path)
+        if entry is None:
+            entry = Span(name, path, run=self)
+            self.spans[path] = entry
+        return entry
+
+    def span_at(self, path):
+        entry = self.spans.get(path)
+        if entry is None:
+            entry = Span(path.rsplit("/", 1)[-1], path, run=self)
+            self.spans[path] = entry
+        return entry
+
+    def export_spans(self):
+        return [entry.as_dict() for entry in self.spans.values()]
+
+    def as_dict(self, status="ok"):
+        root = self.spans.get(self.name)
+        return {
+            "run": self.name,
+            "status": status,
+            "started_at": self.started_at,
+            "finished_at": datetime.utcnow().isoformat() + "Z",
+            "wall_s": round(root.wall_s, 6) if root else 0.0,
+            "cpu_s": round(root.cpu_s, 6) if root else 0.0,
+            "spans": self.export_spans(),
+        }
+
+
+def current_run():
+    return getattr(_STATE, "run", None)
+
+
+def begin_span(name):
+    run = current_run()
+    if run is None:
+        return Span(name, name).begin()
+    return run.span(name).begin()
+
+
+@contextmanager
+def span(name, **counts):
+    active = begin_span(name)
+    try:
+        yield active
+    finally:
+        active.end(**counts)
+
+
+@contextmanager
+def collect_spans():
+    """Record spans into a detached run, e.g. inside a process pool worker.
+
+    Ship ``run.export_spans()`` back with the worker result and pass it to
+    ``merge_spans`` in the parent.
+    """
+    previous = current_run()
+    run = Run("")
+    _STATE.run = run
+    try:
+        yield run
+    finally:
+        _STATE.run = previous
+
+
+def merge_spans(rows):
+    """Fold exported span rows under the innermost open span of the current run."""
+    run = current_run()
+    if run is None:
+        return
+    prefix = run.stack[-1].path if run.stack else ""
+    for row in rows or []:
+        path = f"{prefix}/{row['path']}" if prefix else row["path"]
+        run.span_at(path).merge(row)
+
+
+def load_run_metrics(output_dir, name=None):
+    path = os.path.join(output_dir, METRICS_FILENAME)
+    try:
+        data = read_json(path)
+    except Exception:
+        data = {}
+    runs = data.get("runs") if isinstance(data, dict) else None
+    runs = runs if isinstance(runs, dict) else {}
+    if name is None:
+        return runs
+    return runs.get(name)
+
+
+def write_run_metrics(run, output_dir, status="ok"):
+    path = os.path.join(output_dir, METRICS_FILENAME)
+    with file_lock(path):
+        runs = load_run_metrics(output_dir)
+        runs[run.name] = run.as_dict(status=status)
+        write_json({"last_run": run.name, "runs": runs}, path)
+    return path
+
+
+def traced_run(name):
+    def decorate(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current_run() is not None:
+                with span(name):
+                    return func(*args, **kwargs)
+            run = Run(name)
+            _STATE.run = run
+            status = "error"
+            root = run.span(name).begin()
+            try:
+                result = func(*args, **kwargs)
+                status = "ok"
+                return result
+            finally:
+                root.end()
+                _STATE.run = None
+                try:
+                    bound = signature.bind(*args, **kwargs)
+                    bound.apply_defaults()
+                    if bound.arguments.get("write_outputs") is not False:
+                        output_dir = load_config(bound.arguments["config_path"])["paths"]["output_dir"]
+                        write_run_metrics(run, output_dir, status=status)
+                except Exception:
+                    pass
+
+        return wrapper
+
+    return decorate
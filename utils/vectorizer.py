@@ -1,9 +1,21 @@
 import hashlib
 import json
 import math
+import mmap
 import os
 import re
+import struct
+import sys
+import time
+import zlib
+from array import array
+from functools import lru_cache
 
+from utils.io import process_lock
+
+
+SPARSE_HASH_DIMS = 1 << 20
+SPARSE_CACHE_SIZE = 4096
 
 STOPWORDS = {
     "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or", "that", "the", "to", "with",
@@ -15,6 +27,15 @@ def tokenize(text):
     return {t for t in tokens if t not in STOPWORDS and len(t) > 1}
 
 
+def _term_counts(text):
+    counts = {}
+    for token in re.findall(r"[a-zA-Z0-9+#]+", (text or "").lower()):
+        if token in STOPWORDS or len(token) <= 1:
+            continue
+        counts[token] = counts.get(token, 0) + 1
+    return counts
+
+
 def jaccard_similarity(text_a, text_b):
     set_a = tokenize(text_a or "")
     set_b = tokenize(text_b or "")
@@ -24,11 +45,18 @@ def jaccard_similarity(text_a, text_b):
 
 
 def _cosine_similarity(vec_a, vec_b):
-    if not vec_a or not vec_b:
+    if vec_a is None or vec_b is None or len(vec_a) == 0 or len(vec_b) == 0:
         return 0.0
-    dot = sum(a * b for a, b in zip(vec_a, vec_b))
-    norm_a = math.sqrt(sum(a * a for a in vec_a))
-    norm_b = math.sqrt(sum(b * b for b in vec_b))
+    if isinstance(vec_a, SparseVector) and isinstance(vec_b, SparseVector):
+        return _sparse_cosine_similarity(vec_a, vec_b)
+    if hasattr(vec_a, "dot") and hasattr(vec_b, "dot"):
+        dot = float(vec_a.dot(vec_b))
+        norm_a = math.sqrt(float(vec_a.dot(vec_a)))
+        norm_b = math.sqrt(float(vec_b.dot(vec_b)))
+    else:
+        dot = sum(a * b for a, b in zip(vec_a, vec_b))
+        norm_a = math.sqrt(sum(a * a for a in vec_a))
+        norm_b = math.sqrt(sum(b * b for b in vec_b))
     if norm_a == 0 or norm_b == 0:
         return 0.0
     return dot / (norm_a * norm_b)
@@ -47,51 +75,436 @@ def _hash_embedding(text, dims=256):
     return vec
 
 
-class EmbeddingCache:
-    def __init__(self, path=None):
+class SparseVector(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._norm = None
+
+    @property
+    def norm(self):
+        if self._norm is None:
+            self._norm = math.sqrt(sum(value * value for value in self.values()))
+        return self._norm
+
+
+def _sparse_cosine_similarity(vec_a, vec_b):
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    norm_a = vec_a.norm
+    norm_b = vec_b.norm
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    dot = sum(value * vec_b.get(idx, 0.0) for idx, value in vec_a.items())
+    return dot / (norm_a * norm_b)
+
+
+def _sparse_hash_embedding(text, dims=SPARSE_HASH_DIMS):
+    vec = SparseVector()
+    for token in tokenize(text):
+        digest = zlib.crc32(token.encode("utf-8"))
+        idx = (digest >> 1) % dims
+        vec[idx] = vec.get(idx, 0.0) + (1.0 if digest & 1 == 0 else -1.0)
+    return vec
+
+
+@lru_cache(maxsize=SPARSE_CACHE_SIZE)
+def _cached_sparse_hash_embedding(text, dims=SPARSE_HASH_DIMS):
+    return _sparse_hash_embedding(text, dims)
+
+
+class BM25Index:
+    def __init__(self, documents, k1=1.5, b=0.75):
+        try:
+            self.k1 = float(k1)
+        except (TypeError, ValueError):
+            self.k1 = 1.5
+        try:
+            self.b = float(b)
+        except (TypeError, ValueError):
+            self.b = 0.75
+        self._docs = {}
+        self._postings = {}
+        lengths = []
+        for text in documents:
+            text = text or ""
+            if text in self._docs:
+                continue
+            doc_id = len(lengths)
+            self._docs[text] = doc_id
+            counts = _term_counts(text)
+            lengths.append(sum(counts.values()))
+            for token, count in counts.items():
+                self._postings.setdefault(token, []).append((doc_id, count))
+        self._lengths = lengths
+        total = len(lengths)
+        self._avg_length = (sum(lengths) / total) if total else 0.0
+        self._idf = {
+            token: math.log(1.0 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self._postings.items()
+        }
+        self._scores = {}
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def __contains__(self, text):
+        return (text or "") in self._docs
+
+    def _term_weight(self, count, length):
+        norm = 1.0 - self.b + self.b * (length / self._avg_length if self._avg_length else 0.0)
+        return count * (self.k1 + 1.0) / (count + self.k1 * norm)
+
+    def score_all(self, query):
+        cached = self._scores.get(query)
+        if cached is not None:
+            return cached
+        scores = [0.0] * len(self._lengths)
+        for token in tokenize(query):
+            idf = self._idf.get(token)
+            if idf is None:
+                continue
+            for doc_id, count in self._postings[token]:
+                scores[doc_id] += idf * self._term_weight(count, self._lengths[doc_id])
+        peak = max(scores, default=0.0)
+        cached = (scores, peak)
+        self._scores[query] = cached
+        return cached
+
+    def score(self, query, text):
+        text = text or ""
+        scores, peak = self.score_all(query)
+        doc_id = self._docs.get(text)
+        if doc_id is not None:
+            value = scores[doc_id]
+        else:
+            counts = _term_counts(text)
+            length = sum(counts.values())
+            value = sum(
+                self._idf[token] * self._term_weight(counts[token], length)
+                for token in tokenize(query)
+                if token in counts and token in self._idf
+            )
+        return value, peak
+
+    def similarity(self, query, text):
+        if not query or not text:
+            return 0.0
+        value, peak = self.score(query, text)
+        if peak <= 0:
+            return 0.0
+        return min(1.0, value / peak)
+
+
+def _as_matrix(rows):
+    """Stack dense rows into a float32 numpy matrix; empty rows become zero rows.
+
+    Returns the rows unchanged when numpy is missing or the widths differ
+    (e.g. model vectors mixed with hash fallbacks).
+    """
+    try:
+        import numpy as np  # type: ignore
+    except ImportError:
+        return rows
+    widths = {len(row) for row in rows if len(row)}
+    if len(widths) > 1:
+        return rows
+    matrix = np.zeros((len(rows), widths.pop() if widths else 0), dtype=np.float32)
+    for idx, row in enumerate(rows):
+        if len(row):
+            matrix[idx] = row
+    return matrix
+
+
+def _load_legacy_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class EmbeddingStore:
+    RECORD = struct.Struct("<16sQI")
+    ACCESS = struct.Struct("<16sd")
+    TOMBSTONE = 0xFFFFFFFF
+
+    def __init__(self, path=None, namespace="", max_entries=0, ttl_days=0, import_legacy=True, read_only=False):
         self.path = path
-        self._cache = {}
-        if path and os.path.exists(path):
+        self.namespace = namespace or ""
+        self.read_only = read_only
+        try:
+            self.max_entries = max(0, int(max_entries or 0))
+        except (TypeError, ValueError):
+            self.max_entries = 0
+        try:
+            self.ttl_seconds = max(0.0, float(ttl_days or 0)) * 86400
+        except (TypeError, ValueError):
+            self.ttl_seconds = 0.0
+        self.base = None
+        self.evicted = 0
+        self._now = time.time()
+        self._index = {}
+        self._access = {}
+        self._pending = {}
+        self._mmap = None
+        self._data_size = 0
+        self._live_bytes = 0
+        if not path:
+            return
+        self.base = path[:-5] if path.endswith(".json") else path
+        index_exists = os.path.exists(self.index_path)
+        if os.path.exists(self.data_path):
+            with process_lock(self.lock_path):
+                self._load_index()
+                self._load_access()
+        if import_legacy and not read_only and not index_exists and path.endswith(".json") and os.path.exists(path):
+            for text, vector in _load_legacy_cache(path).items():
+                if isinstance(vector, list):
+                    self.set(text, vector)
+
+    @property
+    def data_path(self):
+        return f"{self.base}.vec" if self.base else None
+
+    @property
+    def index_path(self):
+        return f"{self.base}.idx" if self.base else None
+
+    @property
+    def access_path(self):
+        return f"{self.base}.lru" if self.base else None
+
+    @property
+    def lock_path(self):
+        return f"{self.base}.lock" if self.base else None
+
+    def _key(self, text):
+        payload = f"{self.namespace}\0{text}".encode("utf-8", errors="surrogatepass")
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _load_index(self):
+        self._close_map()
+        self._index = {}
+        self._data_size = 0
+        self._live_bytes = 0
+        if not os.path.exists(self.data_path) or not os.path.exists(self.index_path):
+            return
+        self._data_size = os.path.getsize(self.data_path)
+        try:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+        except Exception:
+            return
+        size = self.RECORD.size
+        for pos in range(0, len(raw) - size + 1, size):
+            key, offset, dims = self.RECORD.unpack_from(raw, pos)
+            if dims == self.TOMBSTONE:
+                self._index.pop(key, None)
+            elif offset + dims * 4 <= self._data_size:
+                self._index[key] = (offset, dims)
+        self._live_bytes = sum(dims * 4 for _, dims in self._index.values())
+        if self._data_size:
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    self._cache = data
+                with open(self.data_path, "rb") as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             except Exception:
-                self._cache = {}
+                self._mmap = None
+                self._index = {}
+
+    def _load_access(self):
+        self._access = {}
+        if not self._index or not os.path.exists(self.access_path):
+            return
+        try:
+            with open(self.access_path, "rb") as f:
+                raw = f.read()
+        except Exception:
+            return
+        size = self.ACCESS.size
+        for pos in range(0, len(raw) - size + 1, size):
+            key, accessed = self.ACCESS.unpack_from(raw, pos)
+            if key in self._index:
+                self._access[key] = accessed
+
+    def _reload(self):
+        # Another process may have appended, evicted or compacted since this
+        # store was opened; pick up its files and keep our newer access times.
+        access = self._access
+        self._load_index()
+        self._load_access()
+        self._pending = {key: vector for key, vector in self._pending.items() if key not in self._index}
+        for key, accessed in access.items():
+            if key in self._index or key in self._pending:
+                self._access[key] = max(accessed, self._access.get(key, accessed))
+
+    def _close_map(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        return len(self._index) + len(self._pending)
 
     def get(self, text):
-        if text in self._cache:
-            return self._cache[text]
-        return None
+        key = self._key(text)
+        if key in self._pending:
+            self._access[key] = self._now
+            return self._pending[key]
+        entry = self._index.get(key)
+        if entry is None or self._mmap is None:
+            return None
+        offset, dims = entry
+        values = array("f")
+        values.frombytes(self._mmap[offset:offset + dims * 4])
+        if sys.byteorder != "little":
+            values.byteswap()
+        self._access[key] = self._now
+        return values.tolist()
 
     def set(self, text, vector):
-        self._cache[text] = vector
+        key = self._key(text)
+        self._access[key] = self._now
+        if key in self._index:
+            return
+        self._pending[key] = [float(value) for value in vector]
+
+    def _append(self):
+        self._close_map()
+        records = []
+        with open(self.data_path, "ab") as f:
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            for key, vector in self._pending.items():
+                values = array("f", vector)
+                if sys.byteorder != "little":
+                    values.byteswap()
+                f.write(values.tobytes())
+                records.append(self.RECORD.pack(key, offset, len(vector)))
+                offset += len(vector) * 4
+        with open(self.index_path, "ab") as f:
+            f.write(b"".join(records))
+        self._pending = {}
+        self._load_index()
+
+    def _evict(self):
+        keys = list(self._index)
+        last_access = {key: self._access.get(key, self._now) for key in keys}
+        expired = set()
+        if self.ttl_seconds:
+            expired = {key for key in keys if self._now - last_access[key] > self.ttl_seconds}
+        remaining = [key for key in keys if key not in expired]
+        if self.max_entries and len(remaining) > self.max_entries:
+            remaining.sort(key=lambda key: (last_access[key], key))
+            expired.update(remaining[: len(remaining) - self.max_entries])
+        if not expired:
+            return 0
+        with open(self.index_path, "ab") as f:
+            f.write(b"".join(self.RECORD.pack(key, 0, self.TOMBSTONE) for key in sorted(expired)))
+        for key in expired:
+            _, dims = self._index.pop(key)
+            self._access.pop(key, None)
+            self._live_bytes -= dims * 4
+        self.evicted += len(expired)
+        return len(expired)
+
+    def _save_access(self):
+        records = [self.ACCESS.pack(key, self._access.get(key, self._now)) for key in self._index]
+        with open(self.access_path, "wb") as f:
+            f.write(b"".join(records))
 
     def save(self):
-        if not self.path:
+        if not self.base or self.read_only:
             return
-        directory = os.path.dirname(self.path)
+        directory = os.path.dirname(self.base)
         if directory:
             os.makedirs(directory, exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(self._cache, f)
+        with process_lock(self.lock_path):
+            self._reload()
+            if self._pending:
+                self._append()
+            if not self._index and not os.path.exists(self.index_path):
+                return
+            self._evict()
+            if self._data_size - self._live_bytes > self._live_bytes:
+                self._compact()
+            else:
+                self._save_access()
+
+    def compact(self):
+        if not self.base or self.read_only:
+            return {"entries": 0, "reclaimed_bytes": 0}
+        with process_lock(self.lock_path):
+            self._reload()
+            return self._compact()
+
+    def _compact(self):
+        if self._pending:
+            self._append()
+        if not os.path.exists(self.index_path):
+            return {"entries": 0, "reclaimed_bytes": 0}
+        self._evict()
+        before = self._data_size
+        entries = sorted(self._index.items(), key=lambda item: (self._access.get(item[0], self._now), item[0]))
+        records = []
+        offset = 0
+        data_tmp = f"{self.data_path}.tmp"
+        index_tmp = f"{self.index_path}.tmp"
+        with open(data_tmp, "wb") as f:
+            for key, (old_offset, dims) in entries:
+                f.write(self._mmap[old_offset:old_offset + dims * 4] if self._mmap is not None else b"")
+                records.append(self.RECORD.pack(key, offset, dims))
+                offset += dims * 4
+        with open(index_tmp, "wb") as f:
+            f.write(b"".join(records))
+        self._close_map()
+        # Drop the index first so a crash between the renames leaves an empty
+        # store rather than offsets into the wrong data file.
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+        os.replace(data_tmp, self.data_path)
+        os.replace(index_tmp, self.index_path)
+        self._load_index()
+        self._save_access()
+        return {"entries": len(self._index), "reclaimed_bytes": max(0, before - self._data_size)}
+
+    def close(self):
+        self._close_map()
 
 
 class SemanticEmbedder:
-    def __init__(self, backend="hash", model_path=None, cache_path=None):
+    def __init__(
+        self,
+        backend="hash",
+        model_path=None,
+        cache_path=None,
+        cache_max_entries=0,
+        cache_ttl_days=0,
+        dims=0,
+        cache_read_only=False,
+    ):
         self.backend = backend
         self.model_path = model_path
-        self.cache = EmbeddingCache(cache_path)
+        try:
+            self.dims = int(dims or 0) or SPARSE_HASH_DIMS
+        except (TypeError, ValueError):
+            self.dims = SPARSE_HASH_DIMS
+        self.cache = EmbeddingStore(
+            cache_path if backend != "hash_fast" else None,
+            namespace=f"{backend}:{model_path or ''}",
+            max_entries=cache_max_entries,
+            ttl_days=cache_ttl_days,
+            read_only=cache_read_only,
+        )
         self.model = None
         self.available = False
         self.reason = ""
         self._init_model()
 
     def _init_model(self):
-        if self.backend == "hash":
+        if self.backend in {"hash", "hash_fast"}:
             self.available = True
-            self.reason = "hash"
+            self.reason = self.backend
             return
         if self.backend != "sbert":
             self.available = False
@@ -118,22 +531,49 @@ class SemanticEmbedder:
     def embed(self, text):
         if not text:
             return []
+        if self.backend == "hash_fast":
+            return _cached_sparse_hash_embedding(text, self.dims)
         cached = self.cache.get(text)
         if cached is not None:
             return cached
-        if self.backend == "hash":
-            vec = _hash_embedding(text)
-        elif self.backend == "sbert" and self.model:
-            try:
-                vec = self.model.encode([text])[0]
-                vec = vec.tolist() if hasattr(vec, "tolist") else list(vec)
-            except Exception:
-                vec = _hash_embedding(text)
-        else:
-            vec = _hash_embedding(text)
+        vec = self._encode([text])[0]
         self.cache.set(text, vec)
         return vec
 
+    def _encode(self, texts, batch_size=64):
+        if self.backend == "sbert" and self.model:
+            try:
+                encoded = self.model.encode(list(texts), batch_size=batch_size)
+                return [vec.tolist() if hasattr(vec, "tolist") else list(vec) for vec in encoded]
+            except Exception:
+                pass
+        return [_hash_embedding(text) for text in texts]
+
+    def embed_many(self, texts, batch_size=64):
+        try:
+            batch_size = max(1, int(batch_size))
+        except (TypeError, ValueError):
+            batch_size = 64
+        if self.backend == "hash_fast":
+            return [_cached_sparse_hash_embedding(text, self.dims) if text else [] for text in texts]
+        vectors = {}
+        misses = []
+        for text in dict.fromkeys(text for text in texts if text):
+            cached = self.cache.get(text)
+            if cached is not None:
+                vectors[text] = cached
+            else:
+                misses.append(text)
+        for start in range(0, len(misses), batch_size):
+            batch = misses[start:start + batch_size]
+            for text, vec in zip(batch, self._encode(batch, batch_size=batch_size)):
+                self.cache.set(text, vec)
+                vectors[text] = vec
+        rows = [vectors[text] if text else [] for text in texts]
+        if self.backend == "sbert" and self.model is not None:
+            return _as_matrix(rows)
+        return rows
+
 
 def semantic_similarity(text_a, text_b, embedder=None):
     if not embedder or not embedder.available:
@@ -146,12 +586,10 @@ def semantic_similarity(text_a, text_b, embedder=None):
 def cluster_texts(texts, embedder=None, threshold=0.85):
     if not texts:
         return [], []
-    vectors = []
-    for text in texts:
-        if embedder and embedder.available:
-            vectors.append(embedder.embed(text or ""))
-        else:
-            vectors.append(_hash_embedding(text or ""))
+    if embedder and embedder.available:
+        vectors = embedder.embed_many([text or "" for text in texts])
+    else:
+        vectors = [_hash_embedding(text or "") for text in texts]
 
     cluster_ids = []
     cluster_vectors = []
@@ -1,8 +1,212 @@
+import hashlib
+import json
+import os
 import re
+import threading
+import time
 from html import unescape
+from urllib.error import HTTPError
 from urllib.parse import urlparse, urljoin
 from urllib.request import Request, urlopen
 
+from utils.io import write_json
+
+
+USER_AGENT = "ApplicantMVP/1.0"
+
+
+class WebCache:
+    def __init__(self, directory, max_age_days=30):
+        self.directory = directory
+        self.index_path = os.path.join(directory, "index.json")
+        try:
+            self.max_age_seconds = max(0.0, float(max_age_days or 0)) * 86400
+        except (TypeError, ValueError):
+            self.max_age_seconds = 30 * 86400
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.fetched = 0
+        self.not_modified = 0
+        self.stale = 0
+        self.text_hits = 0
+        self.removed = 0
+        self.pruned = 0
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and isinstance(data.get("entries"), dict):
+                    self._entries = data["entries"]
+            except Exception:
+                self._entries = {}
+
+    def _body_path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".body")
+
+    def _text_path(self, digest, parser_key):
+        parser_hash = hashlib.sha256(parser_key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.{parser_hash}.txt")
+
+    def _write(self, path, data):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def entry(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def body(self, url):
+        try:
+            with open(self._body_path(url), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url, data, headers):
+        self._write(self._body_path(url), data)
+        with self._lock:
+            self._entries[url] = {
+                "etag": headers.get("ETag", ""),
+                "last_modified": headers.get("Last-Modified", ""),
+                "content_type": headers.get("Content-Type", ""),
+                "size": len(data),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "used_at": time.time(),
+            }
+            self._dirty = True
+            self.fetched += 1
+
+    def record(self, outcome, url=None):
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            if url in self._entries:
+                self._entries[url]["used_at"] = time.time()
+                self._dirty = True
+
+    def drop(self, url):
+        with self._lock:
+            if self._entries.pop(url, None) is None:
+                return
+            self.removed += 1
+            self._dirty = True
+        try:
+            os.remove(self._body_path(url))
+        except OSError:
+            pass
+
+    def text(self, digest, parser_key):
+        try:
+            with open(self._text_path(digest, parser_key), "r", encoding="utf-8") as f:
+                text = f.read()
+        except OSError:
+            return None
+        self.record("text_hits")
+        return text
+
+    def store_text(self, digest, parser_key, text):
+        self._write(self._text_path(digest, parser_key), text.encode("utf-8"))
+
+    def stats(self):
+        return {
+            "fetched": self.fetched,
+            "not_modified": self.not_modified,
+            "stale": self.stale,
+            "text_hits": self.text_hits,
+            "removed": self.removed,
+            "pruned": self.pruned,
+            "entries": len(self._entries),
+        }
+
+    def _prune(self):
+        if self.max_age_seconds:
+            cutoff = time.time() - self.max_age_seconds
+            for url in [url for url, entry in self._entries.items() if entry.get("used_at", cutoff) < cutoff]:
+                del self._entries[url]
+                self.pruned += 1
+                self._dirty = True
+        if not os.path.isdir(self.directory):
+            return
+        bodies = {os.path.basename(self._body_path(url)) for url in self._entries}
+        digests = {entry.get("sha256") for entry in self._entries.values() if entry.get("sha256")}
+        for name in os.listdir(self.directory):
+            if name.endswith(".body"):
+                keep = name in bodies
+            elif name.endswith(".txt"):
+                keep = name.split(".", 1)[0] in digests
+            else:
+                continue
+            if not keep:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def save(self):
+        with self._lock:
+            self._prune()
+            if not self._dirty:
+                return
+            write_json({"entries": self._entries}, self.index_path)
+            self._dirty = False
+
+
+def cached_text(cache, content, parser_key, parse):
+    """Return ``parse(content)``, reusing text stored for the same body and parser.
+
+    Parsed text is keyed by the body's SHA-256, so a 304 or a byte-identical
+    refetch skips HTML cleanup and PDF/DOCX extraction.
+    """
+    if cache is None or not content:
+        return parse(content)
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    digest = hashlib.sha256(data).hexdigest()
+    text = cache.text(digest, parser_key)
+    if text is None:
+        text = parse(content)
+        cache.store_text(digest, parser_key, text)
+    return text
+
+
+def fetch_cached(url, cache, timeout=10):
+    headers = {"User-Agent": USER_AGENT}
+    entry = cache.entry(url)
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    error = None
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as resp:
+            data = resp.read()
+            cache.store(url, data, resp.headers)
+            return data, resp.headers.get("Content-Type", ""), "ok"
+    except HTTPError as exc:
+        if exc.code == 304 and entry:
+            data = cache.body(url)
+            if data is not None:
+                cache.record("not_modified", url)
+                return data, entry.get("content_type", ""), "ok"
+        if exc.code in (404, 410):
+            cache.drop(url)
+            return b"", "", f"fetch failed: {exc}"
+        if exc.code < 500:
+            return b"", "", f"fetch failed: {exc}"
+        error = exc
+    except Exception as exc:
+        error = exc
+    # Only network errors and 5xx fall back to the stored body. A stale hit
+    # does not refresh used_at, so pages that stay unreachable age out.
+    data = cache.body(url) if entry else None
+    if data is not None:
+        cache.record("stale")
+        return data, entry.get("content_type", ""), f"cached (fetch failed: {error})"
+    return b"", "", f"fetch failed: {error}"
+
 
 def allowed_url(url, allowed_domains):
     if not allowed_domains:
@@ -35,8 +239,11 @@ def html_to_text(raw):
     return text
 
 
-def fetch_url_html(url, timeout=10):
-    req = Request(url, headers={"User-Agent": "ApplicantMVP/1.0"})
+def fetch_url_html(url, timeout=10, cache=None):
+    if cache is not None:
+        data, _, status = fetch_cached(url, cache, timeout=timeout)
+        return data.decode("utf-8", errors="ignore"), status
+    req = Request(url, headers={"User-Agent": USER_AGENT})
     try:
         with urlopen(req, timeout=timeout) as resp:
             raw = resp.read().decode("utf-8", errors="ignore")
@@ -45,8 +252,10 @@ def fetch_url_html(url, timeout=10):
     return raw, "ok"
 
 
-def fetch_binary(url, timeout=10):
-    req = Request(url, headers={"User-Agent": "ApplicantMVP/1.0"})
+def fetch_binary(url, timeout=10, cache=None):
+    if cache is not None:
+        return fetch_cached(url, cache, timeout=timeout)
+    req = Request(url, headers={"User-Agent": USER_AGENT})
     try:
         with urlopen(req, timeout=timeout) as resp:
             data = resp.read()
@@ -1074,6 +1074,24 @@ function buildFeedbackBlock(match) {
   return block;
 }
 
+async function loadMatchDetail(match) {
+  if (!match.detail_shard) {
+    return;
+  }
+  const res = await fetch(`/api/matches/${encodeURIComponent(match.id)}`);
+  if (!res.ok) {
+    return;
+  }
+  const data = await res.json();
+  if (!data.match) {
+    return;
+  }
+  const idx = state.matches.findIndex((row) => String(row.id) === String(match.id));
+  if (idx >= 0) {
+    state.matches[idx] = data.match;
+  }
+}
+
 function buildCard(match) {
   const job = match.job || {};
   const card = document.createElement("article");
@@ -1189,7 +1207,7 @@ function buildCard(match) {
   const lines = descriptionText.split(/\n+/).filter((line) => line.trim());
   const previewLines = 6;
   const isExpanded = Boolean(state.expandedDescriptions[match.id]);
-  const hasMore = lines.length > previewLines;
+  const hasMore = lines.length > previewLines || Boolean(job.description_truncated);
   let previewText = descriptionText;
   if (hasMore && !isExpanded) {
     previewText = lines.slice(0, previewLines).join("\n");
@@ -1204,7 +1222,10 @@ function buildCard(match) {
     toggleBtn = document.createElement("button");
     toggleBtn.className = "action-btn ghost";
     toggleBtn.textContent = isExpanded ? "Show less" : "Show more";
-    toggleBtn.onclick = () => {
+    toggleBtn.onclick = async () => {
+      if (!isExpanded) {
+        await loadMatchDetail(match);
+      }
       state.expandedDescriptions[match.id] = !isExpanded;
       renderCards();
     };
@@ -1212,6 +1233,26 @@ function buildCard(match) {
 
   let requirementsBlock = null;
   const requirements = qualification.requirements || [];
+  if (!requirements.length && (qualification.requirement_count || match.pruned)) {
+    requirementsBlock = document.createElement("div");
+    requirementsBlock.className = "requirements";
+
+    const header = document.createElement("div");
+    header.className = "requirement-header";
+    header.innerHTML = match.pruned
+      ? "<strong>Prerequisites:</strong> not analysed (score cannot reach consider)"
+      : `<strong>Prerequisites:</strong> ${qualification.requirements_matched || 0}/${qualification.requirement_count} matched`;
+    requirementsBlock.appendChild(header);
+
+    const loadBtn = document.createElement("button");
+    loadBtn.className = "action-btn ghost";
+    loadBtn.textContent = match.pruned ? "Run full analysis" : "Show prerequisites";
+    loadBtn.onclick = async () => {
+      await loadMatchDetail(match);
+      renderCards();
+    };
+    requirementsBlock.appendChild(loadBtn);
+  }
   if (requirements.length) {
     const matchedCount = requirements.filter((row) => row.status === "matched").length;
     requirementsBlock = document.createElement("div");
@@ -2654,9 +2695,15 @@ async function runCrawl() {
   beginAction("Running job crawl...");
   setButtonBusy(el.runCrawl, true);
   setButtonBusy(el.runScore, true);
+  let doneMessage = "Crawl complete";
   try {
     const res = await fetch("/api/crawl", { method: "POST" });
     const data = await res.json();
+    if (!res.ok || data.error) {
+      doneMessage = data.error || "Crawl failed";
+      window.alert(doneMessage);
+      return;
+    }
     if (data && data.summary) {
       state.insights.collection = data.summary;
       renderCollection();
@@ -2666,25 +2713,36 @@ async function runCrawl() {
   } finally {
     setButtonBusy(el.runCrawl, false);
     setButtonBusy(el.runScore, false);
-    endAction("Crawl complete");
+    endAction(doneMessage);
   }
 }
 
-async function runScore() {
+async function runScore(options = {}) {
   beginAction("Refreshing scores...");
   setButtonBusy(el.runCrawl, true);
   setButtonBusy(el.runScore, true);
+  let doneMessage = "Scores refreshed";
   try {
-    await fetch("/api/score", {
+    const res = await fetch("/api/score", {
       method: "POST",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ feedback_enabled: state.feedbackEnabled, preset: state.activePreset }),
+      body: JSON.stringify({
+        feedback_enabled: state.feedbackEnabled,
+        preset: state.activePreset,
+        rerank: Boolean(options.rerank),
+      }),
     });
+    const data = await res.json();
+    if (!res.ok || data.error) {
+      doneMessage = data.error || "Scoring failed";
+      window.alert(doneMessage);
+      return;
+    }
     await Promise.all([loadMatches({ silent: true }), loadInsights({ silent: true }), loadCommittee({ silent: true })]);
   } finally {
     setButtonBusy(el.runCrawl, false);
     setButtonBusy(el.runScore, false);
-    endAction("Scores refreshed");
+    endAction(doneMessage);
   }
 }
 
@@ -2722,7 +2780,7 @@ if (el.feedbackToggle) {
 if (el.presetToggle) {
   el.presetToggle.addEventListener("change", () => {
     state.activePreset = el.presetToggle.value;
-    runScore();
+    runScore({ rerank: true });
   });
 }
 